@@ -0,0 +1,80 @@
+"""
+Toxicity classifier benchmarks.
+
+Measures raw vectorized throughput per batch size and end-to-end latency
+of the micro-batching scorer under concurrent load. Uses a randomly
+initialised model, so scores are meaningless — only timings matter.
+
+Run from the repo root:
+    python -m benchmarks.bench_toxicity
+"""
+
+import asyncio
+import random
+import statistics
+import string
+import time
+
+import numpy as np
+
+from utils.toxicity import HashedNgramModel, MicroBatchScorer
+
+N_FEATURES = 2 ** 18
+
+
+def make_messages(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(2000)]
+    return [" ".join(rng.choices(words, k=rng.randint(3, 40))) for _ in range(count)]
+
+
+def bench_throughput(model: HashedNgramModel, messages: list[str]):
+    print("— Throughput (direct score_batch) —")
+    for size in (1, 8, 32, 64, 256):
+        batches = [messages[i:i + size] for i in range(0, len(messages), size)]
+        start = time.perf_counter()
+        for batch in batches:
+            model.score_batch(batch)
+        elapsed = time.perf_counter() - start
+        print(f"batch={size:>4} | {len(messages) / elapsed:>9.0f} msg/s")
+
+
+async def bench_latency(model: HashedNgramModel, messages: list[str], rate: int, window_ms: float):
+    scorer = MicroBatchScorer(model, window_ms=window_ms, max_batch=64)
+    latencies = []
+
+    async def one(text: str):
+        start = time.perf_counter()
+        await scorer.score(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tasks = []
+    gap = 1 / rate
+    for text in messages:
+        tasks.append(asyncio.create_task(one(text)))
+        await asyncio.sleep(gap)
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"rate={rate:>5}/s window={window_ms:>4}ms | "
+        f"p50={statistics.median(latencies):6.2f}ms p99={p99:6.2f}ms | "
+        f"avg batch={scorer.avg_batch:5.1f}"
+    )
+
+
+def main():
+    rng = np.random.default_rng(0)
+    model = HashedNgramModel(rng.normal(0, 0.1, N_FEATURES).astype(np.float32), bias=-1.0)
+    messages = make_messages(4000)
+
+    bench_throughput(model, messages)
+
+    print("— Latency (MicroBatchScorer, worker thread) —")
+    for rate, window in ((100, 2), (500, 5), (2000, 5)):
+        asyncio.run(bench_latency(model, messages[:1000], rate, window))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,16 @@
 import discord
 from discord.ext import commands
-import asyncio
 
 from utils.embeds import luxury_embed
 from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.jobs import jobs
 from utils import state
 
 
 class Admin(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        jobs.register("massrole", self._massrole_one)
 
         # 🔒 Ensure staff role tiers always exist
         if not hasattr(state, "STAFF_ROLE_TIERS"):
@@ -190,17 +191,23 @@ class Admin(commands.Cog):
         if not self._is_staff_level(ctx, 4):
             return
 
-        msg = await ctx.send(f"⏳ Processing mass role for {ctx.guild.member_count} members...")
-        count = 0
-        for member in ctx.guild.members:
-            if role not in member.roles:
-                try:
-                    await member.add_roles(role)
-                    count += 1
-                    await asyncio.sleep(0.5) # Avoid rate limits
-                except: continue
-        
-        await msg.edit(content=None, embed=luxury_embed("🌍 Mass Role Complete", f"Added {role.mention} to {count} members.", COLOR_GOLD))
+        # Snapshot now: members joining later are not part of this run
+        targets = [m.id for m in ctx.guild.members if role not in m.roles]
+        if not targets:
+            return await ctx.send(embed=luxury_embed("🌍 Mass Role", f"Everyone already has {role.mention}.", COLOR_SECONDARY))
+
+        await jobs.launch(ctx, "massrole", {"role_id": role.id}, targets, f"Mass role {role.name}")
+
+    @staticmethod
+    async def _massrole_one(guild: discord.Guild, params: dict, target_id: int) -> bool:
+        role = guild.get_role(params["role_id"])
+        member = guild.get_member(target_id)
+        if role is None:
+            raise RuntimeError("role deleted")
+        if member is None or role in member.roles:
+            return False
+        await member.add_roles(role, reason="Mass role")
+        return True
 
     @commands.command(name="rolecolor")
     @commands.guild_only()
@@ -1,199 +1,342 @@
-import discord
-import asyncio
-from discord.ext import commands, tasks
-from datetime import datetime, timedelta
-
-from utils.embeds import luxury_embed
-from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
-from utils.permissions import require_level
-from utils import state
-
-
-# =====================================================
-# RUNTIME STATE (SAFE, IN-MEMORY)
-# =====================================================
-
-state.ANNOUNCE_TEMPLATES = getattr(state, "ANNOUNCE_TEMPLATES", {})
-state.ANNOUNCE_OPTOUT = getattr(state, "ANNOUNCE_OPTOUT", set())
-state.ANNOUNCE_HISTORY = getattr(state, "ANNOUNCE_HISTORY", [])
-
-
-class Announce(commands.Cog):
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
-
-    # =====================================================
-    # MAIN COMMAND GROUP
-    # =====================================================
-
-    @commands.group(invoke_without_command=True)
-    @commands.guild_only()
-    @require_level(4)
-    async def announce(self, ctx):
-        await ctx.send(
-            embed=luxury_embed(
-                title="📢 Announcement System",
-                description=(
-                    "`&announce dm <message>`\n"
-                    "`&announce channel #channel <message>`\n"
-                    "`&announce preview <message>`\n"
-                    "`&announce schedule <minutes> <message>`\n"
-                    "`&announce template add/use`\n"
-                    "`&announce optout / optin`"
-                ),
-                color=COLOR_SECONDARY
-            )
-        )
-
-    # =====================================================
-    # DM ANNOUNCEMENT
-    # =====================================================
-
-    @announce.command(name="dm")
-    async def announce_dm(self, ctx, *, message: str):
-        if state.SYSTEM_FLAGS.get("panic_mode"):
-            return await ctx.send(embed=luxury_embed(
-                title="🚨 Panic Mode Active",
-                description="Announcements are disabled.",
-                color=COLOR_DANGER
-            ))
-
-        embed = self._build_embed(message)
-        sent, failed = 0, 0
-
-        status = await ctx.send(embed=luxury_embed(
-            title="📡 Broadcasting (DM)",
-            description="Sending announcements...",
-            color=COLOR_SECONDARY
-        ))
-
-        for member in ctx.guild.members:
-            if member.bot or member.id in state.ANNOUNCE_OPTOUT:
-                continue
-            try:
-                await member.send(embed=embed)
-                sent += 1
-                await asyncio.sleep(0.9)
-            except:
-                failed += 1
-                await asyncio.sleep(0.3)
-
-        await self._finalize(ctx, status, sent, failed, "DM")
-
-    # =====================================================
-    # CHANNEL ANNOUNCEMENT
-    # =====================================================
-
-    @announce.command(name="channel")
-    async def announce_channel(self, ctx, channel: discord.TextChannel, *, message: str):
-        embed = self._build_embed(message)
-        await channel.send(embed=embed)
-        await ctx.send(embed=luxury_embed(
-            title="📣 Announcement Posted",
-            description=f"Sent to {channel.mention}",
-            color=COLOR_GOLD
-        ))
-
-    # =====================================================
-    # PREVIEW
-    # =====================================================
-
-    @announce.command(name="preview")
-    async def announce_preview(self, ctx, *, message: str):
-        await ctx.send(embed=self._build_embed(message))
-
-    # =====================================================
-    # SCHEDULED ANNOUNCEMENT
-    # =====================================================
-
-    @announce.command(name="schedule")
-    async def announce_schedule(self, ctx, minutes: int, *, message: str):
-        await ctx.send(embed=luxury_embed(
-            title="⏰ Announcement Scheduled",
-            description=f"Will send in **{minutes} minutes**.",
-            color=COLOR_GOLD
-        ))
-
-        async def delayed_send():
-            await asyncio.sleep(minutes * 60)
-            await self.announce_dm(ctx, message=message)
-
-        self.bot.loop.create_task(delayed_send())
-
-    # =====================================================
-    # TEMPLATE SYSTEM
-    # =====================================================
-
-    @announce.group()
-    async def template(self, ctx):
-        pass
-
-    @template.command(name="add")
-    async def template_add(self, ctx, name: str, *, message: str):
-        state.ANNOUNCE_TEMPLATES[name.lower()] = message
-        await ctx.send(embed=luxury_embed(
-            title="📌 Template Saved",
-            description=f"Template `{name}` added.",
-            color=COLOR_GOLD
-        ))
-
-    @template.command(name="use")
-    async def template_use(self, ctx, name: str):
-        msg = state.ANNOUNCE_TEMPLATES.get(name.lower())
-        if not msg:
-            return await ctx.send(embed=luxury_embed(
-                title="❌ Template Not Found",
-                description="No such template.",
-                color=COLOR_DANGER
-            ))
-        await ctx.send(embed=self._build_embed(msg))
-
-    # =====================================================
-    # OPTOUT SYSTEM (USERS)
-    # =====================================================
-
-    @announce.command()
-    async def optout(self, ctx):
-        state.ANNOUNCE_OPTOUT.add(ctx.author.id)
-        await ctx.send("🔕 You will no longer receive announcements.")
-
-    @announce.command()
-    async def optin(self, ctx):
-        state.ANNOUNCE_OPTOUT.discard(ctx.author.id)
-        await ctx.send("🔔 You will now receive announcements.")
-
-    # =====================================================
-    # INTERNAL UTILITIES
-    # =====================================================
-
-    def _build_embed(self, message: str):
-        embed = luxury_embed(
-            title="📜 Imperial Proclamation",
-            description=message,
-            color=COLOR_GOLD
-        )
-        embed.set_footer(text="HellFire Hangout • Official Announcement")
-        if self.bot.user and self.bot.user.avatar:
-            embed.set_thumbnail(url=self.bot.user.avatar.url)
-        return embed
-
-    async def _finalize(self, ctx, status, sent, failed, mode):
-        await status.edit(embed=luxury_embed(
-            title="📊 Announcement Complete",
-            description=f"Mode: {mode}\n✅ Sent: {sent}\n❌ Failed: {failed}",
-            color=COLOR_GOLD
-        ))
-
-        state.ANNOUNCE_HISTORY.append({
-            "by": ctx.author.id,
-            "sent": sent,
-            "failed": failed,
-            "time": datetime.utcnow()
-        })
-
-        if len(state.ANNOUNCE_HISTORY) > 10:
-            state.ANNOUNCE_HISTORY.pop(0)
-
-
-async def setup(bot: commands.Bot):
-    await bot.add_cog(Announce(bot))
+import discord
+import json
+import time
+from discord.ext import commands, tasks
+from datetime import datetime, timedelta
+
+from utils.embeds import luxury_embed
+from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.permissions import require_level
+from utils.dm import dm
+from utils.jobs import jobs
+from utils.scheduler import scheduler, parse_duration
+from utils.roleindex import roleindex
+from utils import state
+
+
+# A full-guild DM broadcast can take over an hour on the shared DM budget
+RECURRING_MIN_INTERVAL = 3600
+
+
+# =====================================================
+# RUNTIME STATE (SAFE, IN-MEMORY)
+# =====================================================
+
+state.ANNOUNCE_TEMPLATES = getattr(state, "ANNOUNCE_TEMPLATES", {})
+state.ANNOUNCE_OPTOUT = getattr(state, "ANNOUNCE_OPTOUT", set())
+state.ANNOUNCE_HISTORY = getattr(state, "ANNOUNCE_HISTORY", [])
+
+
+class Announce(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        jobs.register("broadcast", self._broadcast_one)
+        scheduler.register("announce", self._run_scheduled)
+
+    # =====================================================
+    # MAIN COMMAND GROUP
+    # =====================================================
+
+    @commands.group(invoke_without_command=True)
+    @commands.guild_only()
+    @require_level(4)
+    async def announce(self, ctx):
+        await ctx.send(
+            embed=luxury_embed(
+                title="📢 Announcement System",
+                description=(
+                    "`&announce dm <message>`\n"
+                    "`&announce segment \"<roles>\" <message>`\n"
+                    "`&announce count <roles>`\n"
+                    "`&announce channel #channel <message>`\n"
+                    "`&announce preview <message>`\n"
+                    "`&announce schedule <in> <message>`\n"
+                    "`&announce recurring <every> <message>`\n"
+                    "`&announce scheduled` • `&announce unschedule <id>`\n"
+                    "`&announce template add/use`\n"
+                    "`&announce optout / optin`"
+                ),
+                color=COLOR_SECONDARY
+            )
+        )
+
+    # =====================================================
+    # DM ANNOUNCEMENT
+    # =====================================================
+
+    @announce.command(name="dm")
+    async def announce_dm(self, ctx, *, message: str):
+        if state.SYSTEM_FLAGS.get("panic_mode"):
+            return await ctx.send(embed=luxury_embed(
+                title="🚨 Panic Mode Active",
+                description="Announcements are disabled.",
+                color=COLOR_DANGER
+            ))
+
+        await self._broadcast(ctx.channel, ctx.author.id, message, "DM announcement")
+
+    async def _broadcast(self, channel, author_id: int, message: str, title: str, audience=None, schedule_id: int = None) -> int:
+        embed = self._build_embed(message)
+
+        # Recipients are snapshotted: the broadcast survives restarts and
+        # `&job cancel` stops it; progress lives on the job's status embed
+        if audience is None:
+            audience = roleindex.everyone(channel.guild)
+        recipients = sorted(self._recipients(channel.guild, audience))
+        job_id = await jobs.post(channel, author_id, "broadcast", {"embed": embed.to_dict(), "schedule": schedule_id}, recipients, title)
+
+        state.ANNOUNCE_HISTORY.append({
+            "by": author_id,
+            "job": job_id,
+            "recipients": len(recipients),
+            "time": datetime.utcnow()
+        })
+        if len(state.ANNOUNCE_HISTORY) > 10:
+            state.ANNOUNCE_HISTORY.pop(0)
+        return job_id
+
+    @staticmethod
+    def _recipients(guild: discord.Guild, audience: set) -> set:
+        return audience - roleindex.bots(guild) - state.ANNOUNCE_OPTOUT
+
+    @staticmethod
+    async def _broadcast_one(guild: discord.Guild, params: dict, target_id: int) -> bool:
+        # Opted out since the snapshot, or DMs known closed → skipped, no REST call
+        if target_id in state.ANNOUNCE_OPTOUT or dm.is_closed(target_id):
+            return False
+        # Paced by the DM service's shared budget
+        if await dm.send(target_id, embed=discord.Embed.from_dict(params["embed"])) is None:
+            raise RuntimeError("DM not delivered")
+        return True
+
+    # =====================================================
+    # ROLE SEGMENTS
+    # =====================================================
+
+    # Segments are role expressions, e.g. "@Gamers and not @Muted",
+    # resolved by set algebra over the role membership index
+
+    @announce.command(name="segment")
+    async def announce_segment(self, ctx, segment: str, *, message: str):
+        if state.SYSTEM_FLAGS.get("panic_mode"):
+            return await ctx.send(embed=luxury_embed(
+                title="🚨 Panic Mode Active",
+                description="Announcements are disabled.",
+                color=COLOR_DANGER
+            ))
+
+        try:
+            audience = roleindex.resolve(ctx.guild, segment)
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Segment", description=str(e), color=COLOR_DANGER))
+
+        if not self._recipients(ctx.guild, audience):
+            return await ctx.send(embed=luxury_embed(
+                title="❌ Empty Segment",
+                description="No members match that segment.",
+                color=COLOR_DANGER
+            ))
+        await self._broadcast(ctx.channel, ctx.author.id, message, f"Segment: {segment[:40]}", audience)
+
+    @announce.command(name="count")
+    async def announce_count(self, ctx, *, segment: str):
+        started = time.perf_counter()
+        try:
+            audience = roleindex.resolve(ctx.guild, segment)
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Segment", description=str(e), color=COLOR_DANGER))
+        recipients = self._recipients(ctx.guild, audience)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        await ctx.send(embed=luxury_embed(
+            title="🎯 Segment Dry Run",
+            description=(
+                f"**Segment:** `{segment}`\n"
+                f"**Matching members:** `{len(audience)}`\n"
+                f"**Would receive DM:** `{len(recipients)}` (bots & opt-outs excluded)\n"
+                f"**Resolved in:** `{elapsed:.1f}ms`"
+            ),
+            color=COLOR_SECONDARY
+        ))
+
+    # =====================================================
+    # CHANNEL ANNOUNCEMENT
+    # =====================================================
+
+    @announce.command(name="channel")
+    async def announce_channel(self, ctx, channel: discord.TextChannel, *, message: str):
+        embed = self._build_embed(message)
+        await channel.send(embed=embed)
+        await ctx.send(embed=luxury_embed(
+            title="📣 Announcement Posted",
+            description=f"Sent to {channel.mention}",
+            color=COLOR_GOLD
+        ))
+
+    # =====================================================
+    # PREVIEW
+    # =====================================================
+
+    @announce.command(name="preview")
+    async def announce_preview(self, ctx, *, message: str):
+        await ctx.send(embed=self._build_embed(message))
+
+    # =====================================================
+    # SCHEDULED ANNOUNCEMENT
+    # =====================================================
+
+    # Stored in SQLite and fired by the shared scheduler heap, so
+    # schedules survive restarts and cost no task while waiting
+
+    @announce.command(name="schedule")
+    async def announce_schedule(self, ctx, when: str, *, message: str):
+        try:
+            delay = parse_duration(when)
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Time", description=str(e), color=COLOR_DANGER))
+
+        run_at = int(time.time()) + delay
+        schedule_id = scheduler.add(ctx.guild.id, "announce", {"message": message}, run_at, ctx.author.id, ctx.channel.id)
+        await ctx.send(embed=luxury_embed(
+            title="⏰ Announcement Scheduled",
+            description=f"**#{schedule_id}** will send <t:{run_at}:R>.",
+            color=COLOR_GOLD
+        ))
+
+    @announce.command(name="recurring")
+    async def announce_recurring(self, ctx, every: str, *, message: str):
+        try:
+            interval = parse_duration(every)
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Interval", description=str(e), color=COLOR_DANGER))
+        if interval < RECURRING_MIN_INTERVAL:
+            return await ctx.send(embed=luxury_embed(
+                title="❌ Interval Too Short",
+                description=f"Recurring announcements need at least **{RECURRING_MIN_INTERVAL // 60} minutes** between runs.",
+                color=COLOR_DANGER
+            ))
+
+        run_at = int(time.time()) + interval
+        schedule_id = scheduler.add(
+            ctx.guild.id, "announce", {"message": message}, run_at, ctx.author.id, ctx.channel.id, interval=interval
+        )
+        await ctx.send(embed=luxury_embed(
+            title="🔁 Recurring Announcement",
+            description=f"**#{schedule_id}** sends every `{every}`, first <t:{run_at}:R>.",
+            color=COLOR_GOLD
+        ))
+
+    @announce.command(name="scheduled")
+    async def announce_scheduled(self, ctx):
+        rows = scheduler.for_guild(ctx.guild.id, "announce")
+        if not rows:
+            return await ctx.send(embed=luxury_embed(
+                title="⏰ Scheduled Announcements",
+                description="Nothing scheduled.",
+                color=COLOR_SECONDARY
+            ))
+
+        lines = []
+        for row in rows[:15]:
+            preview = json.loads(row["payload"])["message"][:60]
+            repeat = f" • 🔁 every `{row['interval'] // 60}m`" if row["interval"] else ""
+            lines.append(f"**#{row['id']}** <t:{row['run_at']}:R>{repeat}\n└ {preview}")
+
+        await ctx.send(embed=luxury_embed(
+            title=f"⏰ Scheduled Announcements ({len(rows)})",
+            description="\n".join(lines),
+            color=COLOR_SECONDARY
+        ))
+
+    @announce.command(name="unschedule")
+    async def announce_unschedule(self, ctx, schedule_id: int):
+        if not scheduler.cancel(schedule_id, ctx.guild.id):
+            return await ctx.send(embed=luxury_embed(
+                title="❌ Not Found",
+                description=f"No active schedule **#{schedule_id}**.",
+                color=COLOR_DANGER
+            ))
+        await ctx.send(embed=luxury_embed(
+            title="🗑️ Schedule Cancelled",
+            description=f"Schedule **#{schedule_id}** will not run.",
+            color=COLOR_GOLD
+        ))
+
+    async def _run_scheduled(self, row: dict, payload: dict):
+        if state.SYSTEM_FLAGS.get("panic_mode"):
+            return
+        guild = self.bot.get_guild(row["guild_id"])
+        channel = guild.get_channel(row["channel_id"]) if guild else None
+        if channel is None:
+            return
+
+        # Runs never overlap: while the previous broadcast of this schedule is
+        # still delivering, this run is skipped (the next one comes anyway)
+        running = jobs.active_for(guild.id, "broadcast", "schedule", row["id"])
+        if running:
+            print(f"⏭️ Schedule #{row['id']} skipped: job #{running['id']} still running")
+            return
+        await self._broadcast(
+            channel, row["created_by"], payload["message"], f"Scheduled announcement #{row['id']}", schedule_id=row["id"]
+        )
+
+    # =====================================================
+    # TEMPLATE SYSTEM
+    # =====================================================
+
+    @announce.group()
+    async def template(self, ctx):
+        pass
+
+    @template.command(name="add")
+    async def template_add(self, ctx, name: str, *, message: str):
+        state.ANNOUNCE_TEMPLATES[name.lower()] = message
+        await ctx.send(embed=luxury_embed(
+            title="📌 Template Saved",
+            description=f"Template `{name}` added.",
+            color=COLOR_GOLD
+        ))
+
+    @template.command(name="use")
+    async def template_use(self, ctx, name: str):
+        msg = state.ANNOUNCE_TEMPLATES.get(name.lower())
+        if not msg:
+            return await ctx.send(embed=luxury_embed(
+                title="❌ Template Not Found",
+                description="No such template.",
+                color=COLOR_DANGER
+            ))
+        await ctx.send(embed=self._build_embed(msg))
+
+    # =====================================================
+    # OPTOUT SYSTEM (USERS)
+    # =====================================================
+
+    @announce.command()
+    async def optout(self, ctx):
+        state.ANNOUNCE_OPTOUT.add(ctx.author.id)
+        await ctx.send("🔕 You will no longer receive announcements.")
+
+    @announce.command()
+    async def optin(self, ctx):
+        state.ANNOUNCE_OPTOUT.discard(ctx.author.id)
+        await ctx.send("🔔 You will now receive announcements.")
+
+    # =====================================================
+    # INTERNAL UTILITIES
+    # =====================================================
+
+    def _build_embed(self, message: str):
+        embed = luxury_embed(
+            title="📜 Imperial Proclamation",
+            description=message,
+            color=COLOR_GOLD
+        )
+        embed.set_footer(text="HellFire Hangout • Official Announcement")
+        if self.bot.user and self.bot.user.avatar:
+            embed.set_thumbnail(url=self.bot.user.avatar.url)
+        return embed
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Announce(bot))
@@ -0,0 +1,221 @@
+import discord
+from discord.ext import commands
+import time
+
+from utils.embeds import luxury_embed
+from utils.config import (
+    COLOR_DANGER,
+    COLOR_GOLD,
+    COLOR_SECONDARY,
+    ANTINUKE_WINDOW_SECONDS,
+    ANTINUKE_THRESHOLDS
+)
+from utils.permissions import require_level
+from utils.windows import WindowRegistry
+from utils.outbound import outbound, Priority
+from utils.logsink import logsink, Severity
+from utils.dm import dm
+from utils.database import db
+from utils import state
+
+
+# =====================================================
+# WATCHED AUDIT ACTIONS
+# =====================================================
+
+WATCHED_ACTIONS = {
+    discord.AuditLogAction.channel_delete: "channel_delete",
+    discord.AuditLogAction.role_delete: "role_delete",
+    discord.AuditLogAction.ban: "ban",
+    discord.AuditLogAction.kick: "kick",
+    discord.AuditLogAction.webhook_create: "webhook_create",
+}
+
+QUARANTINE_COOLDOWN = 300  # seconds before the same actor can be re-quarantined
+
+
+class AntiNuke(commands.Cog):
+    """
+    Destructive-action monitor.
+    • Fed directly by audit log entry events (no polling)
+    • Per-actor sliding windows with constant cost per event
+    • Strips the actor's roles & alerts the owner on breach
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.windows = WindowRegistry(ANTINUKE_WINDOW_SECONDS)
+
+        # (guild_id, actor_id) -> quarantine timestamp; entries only matter
+        # for QUARANTINE_COOLDOWN and are pruned after that
+        self._quarantined: dict[tuple[int, int], float] = {}
+
+        # Trust is per guild and survives restarts
+        state.ANTINUKE_WHITELIST = {
+            (row["guild_id"], row["user_id"])
+            for row in db.fetchall("SELECT guild_id, user_id FROM antinuke_trust")
+        }
+
+    # =================================================
+    # INTERNAL HELPERS
+    # =================================================
+
+    def _is_trusted(self, guild: discord.Guild, actor_id: int) -> bool:
+        if actor_id == self.bot.user.id:
+            return True
+        if actor_id == guild.owner_id:
+            return True
+        return (guild.id, actor_id) in state.ANTINUKE_WHITELIST
+
+    def _recently_quarantined(self, key: tuple[int, int], now: float) -> bool:
+        last = self._quarantined.get(key)
+        return bool(last and now - last < QUARANTINE_COOLDOWN)
+
+    def _prune_quarantined(self, now: float):
+        expired = [k for k, at in self._quarantined.items() if now - at >= QUARANTINE_COOLDOWN]
+        for key in expired:
+            del self._quarantined[key]
+
+    # =================================================
+    # AUDIT LOG FEED
+    # =================================================
+
+    @commands.Cog.listener()
+    async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
+        action = WATCHED_ACTIONS.get(entry.action)
+        if action is None:
+            return
+
+        guild = entry.guild
+        actor_id = entry.user_id
+        if not actor_id or self._is_trusted(guild, actor_id):
+            return
+
+        now = time.time()
+        count = self.windows.hit((guild.id, actor_id, action), now=now)
+
+        if count < ANTINUKE_THRESHOLDS.get(action, 0):
+            return
+
+        key = (guild.id, actor_id)
+        if self._recently_quarantined(key, now):
+            return
+
+        self._prune_quarantined(now)
+        self._quarantined[key] = now
+        await self._quarantine(guild, actor_id, action, count)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self._quarantined.pop((payload.guild_id, payload.user.id), None)
+
+    # =================================================
+    # RESPONSE
+    # =================================================
+
+    async def _quarantine(self, guild: discord.Guild, actor_id: int, action: str, count: int):
+        member = guild.get_member(actor_id)
+        stripped = []
+        failed = False
+
+        if member:
+            keep = [r for r in member.roles if r.is_default() or r.managed]
+            stripped = [r for r in member.roles if r not in keep]
+
+            try:
+                await outbound.run(
+                    Priority.ENFORCE,
+                    lambda: member.edit(
+                        roles=keep,
+                        reason=f"Anti-Nuke: {count}x {action} in {ANTINUKE_WINDOW_SECONDS}s"
+                    ),
+                    ("guild", guild.id)
+                )
+            except (discord.Forbidden, discord.HTTPException):
+                failed = True
+
+        description = (
+            f"**Actor:** <@{actor_id}> (`{actor_id}`)\n"
+            f"**Trigger:** `{count}x {action}` within `{ANTINUKE_WINDOW_SECONDS}s`\n"
+            f"**Roles Stripped:** {len(stripped) if not failed else 0}\n"
+        )
+
+        if not member:
+            description += "⚠️ Actor is no longer in the server."
+        elif failed:
+            description += "❌ **Role strip failed** — check my role position."
+        elif any(r.managed for r in member.roles if not r.is_default()):
+            description += "⚠️ Actor keeps a managed (integration) role. Consider kicking it."
+
+        embed = luxury_embed(
+            title="☢️ Anti-Nuke Triggered",
+            description=description,
+            color=COLOR_DANGER
+        )
+
+        await self._alert_owner(guild, embed)
+        await self._log(guild, embed)
+
+    async def _alert_owner(self, guild: discord.Guild, embed: discord.Embed):
+        # Owner alerts ride the LOG class: they must not queue behind user DMs
+        if guild.owner:
+            dm.fire(guild.owner, Priority.LOG, embed=embed)
+
+    async def _log(self, guild: discord.Guild, embed: discord.Embed):
+        # Nuke alerts skip the log buffer
+        logsink.log(guild, embed, Severity.CRITICAL)
+
+    # =================================================
+    # TRUST MANAGEMENT
+    # =================================================
+
+    @commands.command(name="antinuke")
+    @commands.guild_only()
+    @require_level(4)
+    async def antinuke(self, ctx: commands.Context, action: str = None, user: discord.User = None):
+        """`&antinuke trust|untrust @user` — manage trusted actors"""
+        if action in ("trust", "untrust") and user:
+            key = (ctx.guild.id, user.id)
+            if action == "trust":
+                db.execute(
+                    "INSERT OR IGNORE INTO antinuke_trust (guild_id, user_id, added_by, created_at) VALUES (?, ?, ?, ?)",
+                    (ctx.guild.id, user.id, ctx.author.id, int(time.time()))
+                )
+                state.ANTINUKE_WHITELIST.add(key)
+            else:
+                db.execute("DELETE FROM antinuke_trust WHERE guild_id = ? AND user_id = ?", key)
+                state.ANTINUKE_WHITELIST.discard(key)
+            # Either way the old cooldown no longer applies
+            self._quarantined.pop(key, None)
+
+            return await ctx.send(
+                embed=luxury_embed(
+                    title="☢️ Anti-Nuke Updated",
+                    description=f"{user.mention} is now **{'trusted' if action == 'trust' else 'monitored'}**.",
+                    color=COLOR_GOLD
+                )
+            )
+
+        limits = "\n".join(
+            f"• `{name}` — {limit} / {ANTINUKE_WINDOW_SECONDS}s"
+            for name, limit in ANTINUKE_THRESHOLDS.items()
+        )
+        trusted = ", ".join(
+            f"<@{uid}>" for gid, uid in state.ANTINUKE_WHITELIST if gid == ctx.guild.id
+        ) or "None"
+
+        await ctx.send(
+            embed=luxury_embed(
+                title="☢️ Anti-Nuke Status",
+                description=(
+                    f"**Thresholds:**\n{limits}\n\n"
+                    f"**Trusted Actors:** {trusted}\n"
+                    f"**Tracked Windows:** `{len(self.windows)}`"
+                ),
+                color=COLOR_SECONDARY
+            )
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(AntiNuke(bot))
@@ -1,57 +1,86 @@
 import time
-import re
+import json
 import discord
-import math
-from collections import Counter
-from discord.ext import commands
+from datetime import timedelta
+from discord.ext import commands, tasks
 from utils import state
 from utils.embeds import luxury_embed
-from utils.config import COLOR_DANGER, COLOR_SECONDARY
+from utils.config import (
+    COLOR_DANGER,
+    COLOR_SECONDARY,
+    COLOR_GOLD,
+    TOXICITY_MODEL_PATH,
+    TOXICITY_BATCH_WINDOW_MS,
+    TOXICITY_MAX_BATCH,
+    DETECTOR_INLINE_MAX_LEN,
+    DETECTOR_BUDGET_MS
+)
+from utils.toxicity import load_scorer
+from utils.detectors import DetectorRunner
+from utils.permissions import require_level
+from utils.rules import rulebook, profiler, MessageFeatures, CompiledRule, validate_rule, adaptive_threshold
+from utils.baselines import baselines, TICK_SECONDS
+from utils.strikes import strikes
+from utils.escalation import escalation
+from utils.outbound import outbound, Priority
+from utils.logsink import logsink, Severity
+from utils.msgindex import msgindex
+from utils.dm import dm
 
 # =====================================================
 # ⚡ HELLFIRE ELITE CONFIGURATION
 # =====================================================
 ANALYSIS_WINDOW = 10.0         # Seconds to look back for patterns
-MAX_STRIKES_KICK = 6           # Kick at 6th strike
-MAX_STRIKES_BAN = 8            # Ban at 8th strike
-
-# REGEX PATTERNS
-INVITE_REGEX = r"(discord\.gg\/|discord\.com\/invite\/|discordapp\.com\/invite\/)"
-ZALGO_REGEX = r"[\u0300-\u036f\u0483-\u0489\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]"
-URL_REGEX = r"(https?:\/\/[^\s]+)"
-IP_LOGGER_REGEX = r"(grabify\.link|iplogger\.org|blasze\.com|shorte\.st)"
-
-# TOXICITY/SELF-HARM KEYWORDS (Staff get notified, user gets help-resource DM)
-DANGER_KEYWORDS = ["kys", "suicide", "self harm", "kill myself", "end it"]
-
-# ESCALATION MAPPING
-PUNISHMENT_MAP = {
-    1: "WARN",
-    2: 600,      # 10m
-    3: 3600,     # 1h
-    4: 43200,    # 12h
-    5: 86400,    # 24h
-    6: "KICK",
-    8: "BAN"
-}
+# Escalation ladder is shared with manual warns → utils.escalation
 
 class SilentAutoMod(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        # Structure: {uid: {'msgs': [], 'strikes': 0, 'last_act': 0, 'attachments': 0}}
+        # Structure: {(guild_id, uid): {'msgs': [(ts, content), ...]}}
+        # Strikes live in utils.strikes (persisted, decayed on read)
         self.user_data = {} 
 
-    def _calculate_entropy(self, text: str) -> float:
-        """Math-based detection for keyboard smashing/gibberish."""
-        if len(text) < 8: return 3.0 # Ignore short messages
-        prob = [n_x/len(text) for x, n_x in Counter(text).items()]
-        entropy = -sum([p * math.log(p, 2) for p in prob])
-        return entropy
+        # Optional local classifier (None when numpy / model file are missing)
+        self.toxicity = load_scorer(
+            TOXICITY_MODEL_PATH,
+            window_ms=TOXICITY_BATCH_WINDOW_MS,
+            max_batch=TOXICITY_MAX_BATCH
+        )
+
+        # Zalgo / entropy: inline for short messages, process pool for long ones
+        self.detectors = DetectorRunner(
+            inline_max_len=DETECTOR_INLINE_MAX_LEN,
+            budget_ms=DETECTOR_BUDGET_MS
+        )
+
+    async def cog_load(self):
+        self.flush_strikes.start()
+
+    def cog_unload(self):
+        self.flush_strikes.cancel()
+        strikes.flush()
+        self.detectors.shutdown()
+
+    @tasks.loop(seconds=30)
+    async def flush_strikes(self):
+        """Write-behind: batch strike updates into one DB transaction"""
+        strikes.flush()
+
+        # Drop idle burst caches (strikes are persisted separately)
+        now = time.time()
+        for key in [k for k, d in self.user_data.items() if not d['msgs'] or now - d['msgs'][-1][0] > ANALYSIS_WINDOW]:
+            del self.user_data[key]
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         # 1. CORE BYPASS CHECKS
         if not message.guild or message.author.bot: return
+
+        # Channel traffic baseline: authors in good standing only (staff
+        # included) → a flagged or timed-out user never moves their own limits
+        if not message.author.is_timed_out() and not strikes.get(message.guild.id, message.author.id):
+            baselines.observe(message.channel.id, message.author.id)
+
         if not state.SYSTEM_FLAGS.get("automod_enabled", True): return
         
         member = message.author
@@ -63,102 +92,99 @@ class SilentAutoMod(commands.Cog):
         content = message.content.lower()
         
         # 2. DATA INITIALIZATION & CLEANUP
-        data = self.user_data.get(uid, {'msgs': [], 'strikes': 0, 'last_act': 0, 'attachments': 0})
-        
-        # Strike Decay: Forgive 1 strike every 1 hour of good behavior
-        if now - data['last_act'] > 3600 and data['strikes'] > 0:
-            data['strikes'] -= 1
-            data['last_act'] = now
+        key = (message.guild.id, uid)
+        data = self.user_data.get(key, {'msgs': []})
 
         # Update Message Cache
         data['msgs'] = [(t, c) for t, c in data['msgs'] if now - t < ANALYSIS_WINDOW]
         data['msgs'].append((now, content))
-        self.user_data[uid] = data
+        self.user_data[key] = data
 
         # =====================================================
-        # 🚨 THE MULTI-LAYER SCANNER
+        # 🚨 THE RULE ENGINE (COMPILED PER GUILD)
         # =====================================================
-        violation = None
+        plan = rulebook.plan(message.guild.id, panic=bool(state.SYSTEM_FLAGS.get("panic_mode")))
+        features = MessageFeatures(
+            message, content, data['msgs'], self.detectors, self.toxicity,
+            scale=baselines.scale(message.channel.id)
+        )
+        role_ids = frozenset(r.id for r in member.roles)
 
-        # LAYER 1: Link & Invite Protection
-        if re.search(INVITE_REGEX, content):
-            violation = "External Server Invite"
-        elif re.search(IP_LOGGER_REGEX, content):
-            violation = "Malicious IP-Logger Link"
-        
-        # LAYER 2: Pattern Recognition (Gibberish/Zalgo)
-        elif re.search(ZALGO_REGEX, content):
-            violation = "Zalgo/Text Distortion"
-        elif len(content) > 20 and self._calculate_entropy(content) < 2.0:
-            violation = "Entropy Threshold (Gibberish)"
-
-        # LAYER 3: Burst/Spam Detection
-        limit = 3 if state.SYSTEM_FLAGS.get("panic_mode") else 5
-        if len(data['msgs']) >= limit:
-            violation = "Rapid Message Burst (Spam)"
-        
-        # LAYER 4: Duplicate Message Check
-        last_contents = [c for _, c in data['msgs']]
-        if last_contents.count(content) > 2:
-            violation = "Duplicate Message Spam"
-
-        # LAYER 5: Toxicity & Safety
-        if any(word in content for word in DANGER_KEYWORDS):
-            # Special handling: Notify staff without immediate auto-ban to assess mental health
-            await self._log_alert(member, "High-Risk Keyword Detected", content)
-            return
-
-        # LAYER 6: Attachment Spam
-        if message.attachments:
-            # Check if they sent > 3 attachments in 10 seconds
-            attach_count = sum(1 for t, c in data['msgs'] if any(x in c for x in ["", "file_sent"])) # simplified
-            if len(message.attachments) > 3:
-                violation = "Media/Attachment Spam"
-
-        # 3. EXECUTE JUSTICE IF VIOLATION FOUND
-        if violation:
-            await self._execute_action(member, message, violation)
+        rule, alerts = await plan.evaluate(features, message.channel.id, role_ids)
+
+        for alert in alerts:
+            # Special handling: Notify staff without immediate punishment
+            await self._log_alert(member, alert.label, content)
+
+        if rule:
+            await self._apply_rule(rule, member, message)
+
+    async def _apply_rule(self, rule, member: discord.Member, message: discord.Message):
+        if rule.action == "strike":
+            await self._execute_action(member, message, rule.label)
+
+        elif rule.action == "soft_warn":
+            await self._safe_delete(message)
+            await self._dm_user(
+                member,
+                "⚠️ Security Warning",
+                f"{rule.label}\n\nThis is an automated warning.\nRepeated violations may result in timeouts."
+            )
+            await self._log_action(member, "SOFT WARN", rule.label, strikes.get(member.guild.id, member.id))
+
+        elif rule.action == "delete":
+            await self._safe_delete(message)
+            await self._log_action(member, "DELETE", rule.label, strikes.get(member.guild.id, member.id))
+
+        elif rule.action == "timeout":
+            try:
+                until = discord.utils.utcnow() + timedelta(minutes=rule.minutes)
+                await outbound.run(Priority.ENFORCE, lambda: member.timeout(until, reason=f"Security: {rule.label}"), ("guild", member.guild.id))
+            except: return
+            await self._dm_user(member, "⛔ Security Timeout", f"⏱ **Duration:** {rule.minutes} minutes\n📄 **Reason:** {rule.label}")
+            await self._log_action(member, f"TIMEOUT ({rule.minutes}m)", rule.label, strikes.get(member.guild.id, member.id))
+
+    async def _safe_delete(self, message: discord.Message):
+        # Coalesced per channel: a burst of flagged messages → one bulk delete
+        msgindex.queue_delete(message)
 
     # =====================================================
     # ⚖️ JUSTICE EXECUTION ENGINE
     # =====================================================
 
     async def _execute_action(self, member: discord.Member, message: discord.Message, reason: str):
-        uid = member.id
-        self.user_data[uid]['strikes'] += 1
-        self.user_data[uid]['last_act'] = time.time()
-        strikes = self.user_data[uid]['strikes']
+        strikes.add(member.guild.id, member.id)
         
         # Immediate Removal
-        try: await message.delete()
-        except: pass
+        await self._safe_delete(message)
 
-        action_type = PUNISHMENT_MAP.get(strikes, "BAN")
+        # Combined score (manual warns + strikes) → next rung of the guild ladder
+        count, action_type = escalation.next_action(member.guild.id, member.id)
 
         # HANDLE PUNISHMENT TYPES
         if action_type == "WARN":
             await self._dm_user(member, "⚠️ Warning Issued", f"Flagged for: **{reason}**.\nRepeated offenses lead to mutes.")
-            await self._log_action(member, "WARNING", reason, strikes)
+            await self._log_action(member, "WARNING", reason, count)
 
         elif action_type == "KICK":
             try:
-                await member.kick(reason=f"AutoMod Escalation: {reason}")
-                await self._log_action(member, "KICK", reason, strikes)
+                await outbound.run(Priority.ENFORCE, lambda: member.kick(reason=f"AutoMod Escalation: {reason}"), ("guild", member.guild.id))
+                await self._log_action(member, "KICK", reason, count)
             except: pass
 
         elif action_type == "BAN":
             try:
-                await member.ban(reason=f"AutoMod Final Escalation: {reason}")
-                await self._log_action(member, "BAN", reason, strikes)
+                await outbound.run(Priority.ENFORCE, lambda: member.ban(reason=f"AutoMod Final Escalation: {reason}"), ("guild", member.guild.id))
+                await self._log_action(member, "BAN", reason, count)
             except: pass
 
         else: # Timeout/Mute
             duration = action_type
-            until = discord.utils.utcnow() + discord.timedelta(seconds=duration)
+            until = discord.utils.utcnow() + timedelta(seconds=duration)
             try:
-                await member.timeout(until, reason=f"AutoMod: {reason}")
+                await outbound.run(Priority.ENFORCE, lambda: member.timeout(until, reason=f"AutoMod: {reason}"), ("guild", member.guild.id))
                 await self._dm_user(member, "⛔ Silence Active", f"You are muted for **{duration//60}m** due to: **{reason}**.")
-                await self._log_action(member, f"TIMEOUT ({duration//60}m)", reason, strikes)
+                await self._log_action(member, f"TIMEOUT ({duration//60}m)", reason, count)
             except: pass
 
     # =====================================================
@@ -166,10 +192,8 @@ class SilentAutoMod(commands.Cog):
     # =====================================================
 
     async def _dm_user(self, member, title, desc):
-        try:
-            embed = luxury_embed(title=title, description=desc, color=COLOR_DANGER)
-            await member.send(embed=embed)
-        except: pass
+        embed = luxury_embed(title=title, description=desc, color=COLOR_DANGER)
+        dm.fire(member, embed=embed)
 
     async def _log_action(self, member, action, reason, strikes):
         # Fetches channel from your state config
@@ -188,14 +212,244 @@ class SilentAutoMod(commands.Cog):
             ),
             color=0x2b2d31
         )
-        await channel.send(embed=embed)
+        logsink.post(channel, embed)
 
     async def _log_alert(self, member, title, content):
         log_id = state.SYSTEM_FLAGS.get("bot_log_channel")
         channel = self.bot.get_channel(log_id)
         if channel:
             embed = luxury_embed(title=f"🚨 ALERT: {title}", description=f"**User:** {member.mention}\n**Content:** `{content}`", color=0xffa500)
-            await channel.send(embed=embed)
+            logsink.post(channel, embed, Severity.WARN)
+
+    # =====================================================
+    # 🎛️ CONTROL & INSTRUMENTATION
+    # =====================================================
+
+    @commands.group(name="automod", invoke_without_command=True)
+    @commands.guild_only()
+    @require_level(3)
+    async def automod(self, ctx: commands.Context):
+        enabled = state.SYSTEM_FLAGS.get("automod_enabled", True)
+        await ctx.send(embed=luxury_embed(
+            title="🛡️ AutoMod",
+            description=(
+                f"**Status:** `{'🟢 ON' if enabled else '🔴 OFF'}`\n\n"
+                "`&automod on / off` — toggle the shield\n"
+                "`&automod stats` — detector instrumentation\n"
+                "`&automod rules` — list the compiled rulebook\n"
+                "`&automod rulestats` — per-rule hits, overrides & cost\n"
+                "`&automod shadow <id> [on|off]` — evaluate without enforcing\n"
+                "`&automod fp <id> [@user]` — mark a false positive\n"
+                "`&automod baseline [#channel]` — traffic baseline & scaling\n"
+                "`&automod rule set <json>` / `remove <id>` / `toggle <id>`"
+            ),
+            color=COLOR_SECONDARY
+        ))
+
+    @automod.command(name="on")
+    @require_level(4)
+    async def automod_on(self, ctx: commands.Context):
+        state.SYSTEM_FLAGS["automod_enabled"] = True
+        await ctx.send(embed=luxury_embed(title="🛡️ AutoMod Enabled", description="Silent scanning resumed.", color=COLOR_SECONDARY))
+
+    @automod.command(name="off")
+    @require_level(4)
+    async def automod_off(self, ctx: commands.Context):
+        state.SYSTEM_FLAGS["automod_enabled"] = False
+        await ctx.send(embed=luxury_embed(title="🛡️ AutoMod Disabled", description="Silent scanning paused.", color=COLOR_DANGER))
+
+    @automod.command(name="stats")
+    @require_level(3)
+    async def automod_stats(self, ctx: commands.Context):
+        d = self.detectors.stats()
+        desc = (
+            f"**Inline Runs:** `{d['inline']}`\n"
+            f"**Offloaded (pool):** `{d['offloaded']}`\n"
+            f"**Budget Exceeded:** `{d['budget_exceeded']}` (`{d['exceeded_pct']:.1f}%`)\n"
+            f"**Pool Errors:** `{d['errors']}`\n"
+            f"**Skipped (pool saturated):** `{d['saturated']}` | in flight `{d['pending']}`\n"
+            f"**Avg Offload Latency:** `{d['avg_offload_ms']:.1f}ms` / budget `{DETECTOR_BUDGET_MS}ms`"
+        )
+        if self.toxicity:
+            desc += (
+                f"\n\n**Classifier Scored:** `{self.toxicity.scored}`\n"
+                f"**Avg Micro-Batch:** `{self.toxicity.avg_batch:.1f}`"
+            )
+        await ctx.send(embed=luxury_embed(title="📈 AutoMod Detector Stats", description=desc, color=COLOR_SECONDARY))
+
+    # =====================================================
+    # 📜 RULEBOOK MANAGEMENT (LIVE, NO RESTART)
+    # =====================================================
+
+    @automod.command(name="rules")
+    @require_level(3)
+    async def automod_rules(self, ctx: commands.Context):
+        plan = rulebook.plan(ctx.guild.id, panic=bool(state.SYSTEM_FLAGS.get("panic_mode")))
+        active = {r.id for r in plan.rules}
+
+        lines = []
+        for rule in plan.rules:
+            conds = " & ".join(f"{c['feature']} {c['op']} {c['value']}" for c in rule.raw["when"])
+            mark = "👻" if rule.shadow else "🟢"
+            lines.append(f"{mark} `{rule.id}` → **{rule.action}** | {conds}")
+        for raw in rulebook.all_rules(ctx.guild.id):
+            if raw["id"] not in active:
+                lines.append(f"⚪ `{raw['id']}` (disabled)")
+
+        await ctx.send(embed=luxury_embed(
+            title="📜 AutoMod Rulebook (evaluation order)",
+            description="\n".join(lines)[:4000],
+            color=COLOR_SECONDARY
+        ))
+
+    @automod.group(name="rule", invoke_without_command=True)
+    @require_level(4)
+    async def automod_rule(self, ctx: commands.Context):
+        await ctx.send(embed=luxury_embed(
+            title="📜 Rule Format",
+            description=(
+                "```json\n"
+                '{"id": "caps", "label": "Excessive Caps", "action": "soft_warn",\n'
+                ' "when": [{"feature": "length", "op": ">", "value": 12},\n'
+                '          {"feature": "caps_ratio", "op": ">=", "value": 0.7}],\n'
+                ' "exclude_channels": [], "exempt_roles": []}\n'
+                "```\n"
+                "Actions: `strike`, `soft_warn`, `timeout` (+`minutes`), `delete`, `alert`"
+            ),
+            color=COLOR_SECONDARY
+        ))
+
+    # =====================================================
+    # 👻 SHADOW MODE & RULE PROFILING
+    # =====================================================
+
+    @automod.command(name="shadow")
+    @require_level(4)
+    async def automod_shadow(self, ctx: commands.Context, rule_id: str, mode: str = "on"):
+        shadow = mode.lower() != "off"
+        if not rulebook.set_shadow(ctx.guild.id, rule_id, shadow):
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No rule `{rule_id}`.", color=COLOR_DANGER))
+        await ctx.send(embed=luxury_embed(
+            title="👻 Shadow Mode Updated",
+            description=f"`{rule_id}` will now **{'only be measured' if shadow else 'enforce again'}**.",
+            color=COLOR_GOLD
+        ))
+
+    @automod.command(name="fp", aliases=["falsepositive"])
+    @require_level(2)
+    async def automod_fp(self, ctx: commands.Context, rule_id: str, member: discord.Member = None):
+        """Staff override: the rule fired on something harmless"""
+        # Disabled rules still count — the false positive may predate the toggle
+        if not any(r["id"] == rule_id for r in rulebook.all_rules(ctx.guild.id)):
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No rule `{rule_id}`.", color=COLOR_DANGER))
+        profiler.get(ctx.guild.id, rule_id).overrides += 1
+
+        refunded = ""
+        if member and strikes.get(ctx.guild.id, member.id) > 0:
+            strikes.refund(ctx.guild.id, member.id)
+            refunded = f"\nRefunded one strike to {member.mention}."
+
+        await ctx.send(embed=luxury_embed(
+            title="🧾 False Positive Recorded",
+            description=f"Override logged against `{rule_id}`.{refunded}",
+            color=COLOR_GOLD
+        ))
+
+    @automod.command(name="rulestats", aliases=["profile"])
+    @require_level(3)
+    async def automod_rulestats(self, ctx: commands.Context):
+        stats = profiler.for_guild(ctx.guild.id)
+        if not stats:
+            return await ctx.send(embed=luxury_embed(title="📊 Rule Profile", description="No evaluations recorded yet.", color=COLOR_SECONDARY))
+
+        rows = sorted(((rid, st.summary()) for rid, st in stats.items()), key=lambda r: -r[1]["us_per_catch"])
+        lines = [
+            f"`{rid}` — evals `{d['evals']}` | hits `{d['hits']}` | 👻 `{d['shadow_hits']}` | "
+            f"FP `{d['overrides']}` | rate `{d['hit_rate'] * 100:.2f}%`\n"
+            f"  ⏱ avg `{d['avg_us']:.0f}µs` p95 `{d['p95_us']}µs` | cost/catch `{d['us_per_catch'] / 1000:.1f}ms`"
+            for rid, d in rows[:15]
+        ]
+
+        await ctx.send(embed=luxury_embed(
+            title="📊 Rule Profile (most expensive per catch first)",
+            description="\n".join(lines)[:4000],
+            color=COLOR_SECONDARY
+        ))
+
+    @automod.command(name="baseline")
+    @require_level(2)
+    async def automod_baseline(self, ctx: commands.Context, channel: discord.TextChannel = None):
+        channel = channel or ctx.channel
+        baseline = baselines.get(channel.id)
+
+        if not baseline:
+            return await ctx.send(embed=luxury_embed(
+                title="📈 Channel Baseline",
+                description=f"No traffic observed in {channel.mention} yet.",
+                color=COLOR_SECONDARY
+            ))
+
+        per_min = 60 / TICK_SECONDS
+        scale = baseline.scale()
+        panic = bool(state.SYSTEM_FLAGS.get("panic_mode"))
+        burst = next((r for r in rulebook.plan(ctx.guild.id, panic=panic).rules if r.id == "burst"), None)
+        effective = ""
+        if burst:
+            base = next(v for n, _, v, _ in burst.conditions if n == "burst")
+            effective = f"\n**Effective Burst Limit:** `{adaptive_threshold(base, scale):.1f}` msgs / {TICK_SECONDS:.0f}s (base `{base}`)"
+
+        await ctx.send(embed=luxury_embed(
+            title=f"📈 Channel Baseline — #{channel.name}",
+            description=(
+                f"**Message Rate:** `{baseline.rate * per_min:.1f}` / min\n"
+                f"**Unique Authors:** `{baseline.authors:.1f}` per {TICK_SECONDS:.0f}s\n"
+                f"**Msgs per Author:** `{baseline.per_author:.2f}`\n"
+                f"**Threshold Scale:** `×{scale:.2f}`"
+                f"{effective}"
+            ),
+            color=COLOR_SECONDARY
+        ))
+
+    @automod_rule.command(name="set")
+    @require_level(4)
+    async def automod_rule_set(self, ctx: commands.Context, *, body: str):
+        try:
+            raw = json.loads(body.strip().strip("`").removeprefix("json"))
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid JSON", description=f"`{e}`", color=COLOR_DANGER))
+
+        error = validate_rule(raw)
+        if error is None:
+            # Compile both variants before saving: a stored rule must never fail later
+            try:
+                for panic in (False, True):
+                    CompiledRule(raw, panic, ctx.guild.id)
+            except (KeyError, TypeError, ValueError) as e:
+                error = f"Rule does not compile: `{e}`"
+        if error:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Rule", description=error, color=COLOR_DANGER))
+
+        rulebook.set_rule(ctx.guild.id, raw)
+        await ctx.send(embed=luxury_embed(title="📜 Rule Saved", description=f"`{raw['id']}` is live.", color=COLOR_GOLD))
+
+    @automod_rule.command(name="remove")
+    @require_level(4)
+    async def automod_rule_remove(self, ctx: commands.Context, rule_id: str):
+        if not rulebook.remove_rule(ctx.guild.id, rule_id):
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No custom rule `{rule_id}`.", color=COLOR_DANGER))
+        await ctx.send(embed=luxury_embed(title="🗑️ Rule Removed", description=f"`{rule_id}` override deleted.", color=COLOR_GOLD))
+
+    @automod_rule.command(name="toggle")
+    @require_level(4)
+    async def automod_rule_toggle(self, ctx: commands.Context, rule_id: str):
+        enabled = rulebook.toggle_rule(ctx.guild.id, rule_id)
+        if enabled is None:
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No rule `{rule_id}`.", color=COLOR_DANGER))
+        await ctx.send(embed=luxury_embed(
+            title="📜 Rule Toggled",
+            description=f"`{rule_id}` is now **{'enabled' if enabled else 'disabled'}**.",
+            color=COLOR_GOLD
+        ))
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(SilentAutoMod(bot))
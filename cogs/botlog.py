@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 from utils.embeds import luxury_embed
 from utils import state
+from utils.logsink import logsink
 from utils.config import COLOR_SECONDARY, COLOR_DANGER, COLOR_GOLD
 
 
@@ -37,10 +38,7 @@ class BotLog(commands.Cog):
         return True
 
     async def _safe_send(self, channel: discord.TextChannel, embed: discord.Embed):
-        try:
-            await channel.send(embed=embed)
-        except (discord.Forbidden, discord.HTTPException):
-            pass
+        logsink.post(channel, embed)
 
     # =================================================
     # BOT READY
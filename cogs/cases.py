@@ -0,0 +1,150 @@
+import discord
+from discord.ext import commands
+import time
+
+from utils.embeds import luxury_embed
+from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.permissions import require_level
+from utils.cases import cases, PAGE_SIZE
+
+# =====================================================
+# 🔱 HELLFIRE CASE FILES
+# • &case <n>                — open a case
+# • &case search <terms>     — ranked full-text search (FTS5 / bm25)
+# • &case reason <n> <text>  — amend a case reason
+# • &cases @user             — latest cases for a member
+# =====================================================
+
+KIND_ICONS = {
+    "warn": "⚠️",
+    "timeout": "⏳",
+    "kick": "👢",
+    "ban": "⛔",
+    "massban": "🔨",
+    "softban": "🧼",
+    "unban": "🔓",
+    "note": "📝",
+}
+
+
+def _case_line(row) -> str:
+    icon = KIND_ICONS.get(row["kind"], "📁")
+    reason = (row["reason"] or "No reason")[:90]
+    target = f"<@{row['target_id']}>" if row["target_id"] else "—"
+    return f"{icon} **#{row['case_no']}** `{row['kind']}` {target} — {reason} (<t:{row['created_at']}:d>)"
+
+
+class CaseSearchView(discord.ui.View):
+    """Keyset-paged search results: the cursor is (score, id) of the last row."""
+
+    def __init__(self, author_id: int, guild_id: int, terms: str, rows):
+        super().__init__(timeout=120)
+        self.author_id = author_id
+        self.guild_id = guild_id
+        self.terms = terms
+        self.rows = rows
+        self.page_no = 1
+        self.elapsed_ms = 0.0
+        self.message = None
+
+    @property
+    def has_more(self) -> bool:
+        return len(self.rows) == PAGE_SIZE
+
+    def render(self) -> discord.Embed:
+        embed = luxury_embed(
+            title=f"🔎 Case Search — “{self.terms[:40]}”",
+            description="\n".join(_case_line(r) for r in self.rows),
+            color=COLOR_GOLD
+        )
+        embed.set_footer(text=f"Page {self.page_no} • {self.elapsed_ms:.1f} ms")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        last = self.rows[-1]
+        start = time.perf_counter()
+        rows = cases.search(self.guild_id, self.terms, after=(last["score"], last["id"]))
+        self.elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if rows:
+            self.rows = rows
+            self.page_no += 1
+        button.disabled = not rows or not self.has_more
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+
+class Cases(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.group(name="case", invoke_without_command=True)
+    @commands.guild_only()
+    @require_level(1)
+    async def case(self, ctx, case_no: int):
+        row = cases.get(ctx.guild.id, case_no)
+        if not row:
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No case `#{case_no}` in this server.", color=COLOR_DANGER))
+
+        icon = KIND_ICONS.get(row["kind"], "📁")
+        user = f"<@{row['target_id']}> (`{row['target_id']}`)" if row["target_id"] else "Multiple"
+        embed = luxury_embed(
+            title=f"{icon} Case #{row['case_no']} — {row['kind'].title()}",
+            description=(
+                f"**User:** {user}\n"
+                f"**Moderator:** <@{row['moderator_id']}>\n"
+                f"**When:** <t:{row['created_at']}:F>\n\n"
+                f"**Reason:**\n{row['reason'] or 'No reason'}"
+            ),
+            color=COLOR_GOLD
+        )
+        await ctx.send(embed=embed)
+
+    @case.command(name="search")
+    @require_level(1)
+    async def case_search(self, ctx, *, terms: str):
+        start = time.perf_counter()
+        rows = cases.search(ctx.guild.id, terms)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if not rows:
+            return await ctx.send(embed=luxury_embed(title="🔎 Case Search", description="No matching cases.", color=COLOR_SECONDARY))
+
+        view = CaseSearchView(ctx.author.id, ctx.guild.id, terms, rows)
+        view.elapsed_ms = elapsed
+        view.message = await ctx.send(embed=view.render(), view=view if view.has_more else None)
+
+    @case.command(name="reason")
+    @require_level(2)
+    async def case_reason(self, ctx, case_no: int, *, reason: str):
+        if not cases.set_reason(ctx.guild.id, case_no, reason):
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No case `#{case_no}` in this server.", color=COLOR_DANGER))
+        await ctx.send(embed=luxury_embed(title="✏️ Case Updated", description=f"Reason for `#{case_no}` amended.", color=COLOR_GOLD))
+
+    @commands.command(name="cases")
+    @commands.guild_only()
+    @require_level(1)
+    async def cases_for(self, ctx, member: discord.User):
+        rows = cases.for_target(ctx.guild.id, member.id, limit=10)
+        if not rows:
+            return await ctx.send(embed=luxury_embed(title="📁 Case Files", description=f"No cases for {member.mention}.", color=COLOR_SECONDARY))
+
+        await ctx.send(embed=luxury_embed(
+            title=f"📁 Case Files — {member.name}",
+            description="\n".join(_case_line(r) for r in rows),
+            color=COLOR_GOLD
+        ))
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Cases(bot))
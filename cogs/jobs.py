@@ -0,0 +1,97 @@
+import discord
+from discord.ext import commands
+
+from utils.embeds import luxury_embed
+from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.permissions import require_level
+from utils.jobs import jobs
+
+# =====================================================
+# 🔱 HELLFIRE BULK JOBS
+# • &jobs               — recent jobs with live progress
+# • &job <id>           — one job's progress card
+# • &job cancel <id>    — stop a running job (progress is kept)
+# • &job failed <id>    — targets that failed (e.g. undelivered DMs)
+# Unfinished jobs resume automatically after a restart.
+# =====================================================
+
+STATUS_ICONS = {
+    "queued": "🕒",
+    "paused": "⏸️",
+    "running": "⚙️",
+    "done": "✅",
+    "cancelled": "🛑",
+    "failed": "❌",
+}
+
+
+class Jobs(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._resumed = False
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Handlers are registered by their cogs' __init__, so every kind is
+        # known by the time the gateway is ready
+        if self._resumed:
+            return
+        self._resumed = True
+        resumed = jobs.resume_all()
+        if resumed:
+            print(f"⚙️ Resumed {resumed} bulk job(s)")
+
+    @commands.command(name="jobs")
+    @commands.guild_only()
+    @require_level(3)
+    async def jobs_list(self, ctx):
+        rows = jobs.for_guild(ctx.guild.id)
+        if not rows:
+            return await ctx.send(embed=luxury_embed(title="⚙️ Bulk Jobs", description="No jobs have run in this server.", color=COLOR_SECONDARY))
+
+        lines = []
+        for row in rows:
+            icon = STATUS_ICONS.get(row["status"], "📁")
+            processed = row["done"] + row["failed"] + row["skipped"]
+            lines.append(
+                f"{icon} **#{row['id']}** {row['title']} — `{processed}/{row['total']}` "
+                f"(<@{row['created_by']}>, <t:{row['created_at']}:R>)"
+            )
+        await ctx.send(embed=luxury_embed(title="⚙️ Bulk Jobs", description="\n".join(lines), color=COLOR_GOLD))
+
+    @commands.group(name="job", invoke_without_command=True)
+    @commands.guild_only()
+    @require_level(3)
+    async def job(self, ctx, job_id: int):
+        row = jobs.get(job_id)
+        if not row or row["guild_id"] != ctx.guild.id:
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No job `#{job_id}` in this server.", color=COLOR_DANGER))
+        await ctx.send(embed=jobs.render(row))
+
+    @job.command(name="failed")
+    @require_level(3)
+    async def job_failed(self, ctx, job_id: int):
+        row = jobs.get(job_id)
+        if not row or row["guild_id"] != ctx.guild.id:
+            return await ctx.send(embed=luxury_embed(title="❌ Not Found", description=f"No job `#{job_id}` in this server.", color=COLOR_DANGER))
+
+        failed = jobs.targets(job_id, "failed")
+        if not failed:
+            return await ctx.send(embed=luxury_embed(title=f"⚙️ Job #{job_id}", description="No failed targets.", color=COLOR_SECONDARY))
+
+        listing = ", ".join(f"<@{r['target_id']}>" for r in failed)
+        more = row["failed"] - len(failed)
+        if more > 0:
+            listing += f" … and {more} more"
+        await ctx.send(embed=luxury_embed(title=f"❌ Job #{job_id} — Failed Targets", description=listing, color=COLOR_DANGER))
+
+    @job.command(name="cancel")
+    @require_level(3)
+    async def job_cancel(self, ctx, job_id: int):
+        if not jobs.cancel(job_id, ctx.guild.id):
+            return await ctx.send(embed=luxury_embed(title="❌ Not Running", description=f"Job `#{job_id}` is not active in this server.", color=COLOR_DANGER))
+        await ctx.send(embed=luxury_embed(title="🛑 Job Cancelled", description=f"Job `#{job_id}` will stop after its current wave.", color=COLOR_GOLD))
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Jobs(bot))
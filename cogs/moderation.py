@@ -4,19 +4,27 @@ from datetime import timedelta, datetime
 import time
 import asyncio
 import re
+import io
 
 from utils.embeds import luxury_embed
 from utils.config import COLOR_GOLD, COLOR_DANGER, COLOR_SECONDARY
 from utils.permissions import require_level
+from utils.escalation import escalation, describe, parse_action
+from utils.warnstore import warnstore, PAGE_SIZE
+from utils.cases import cases
+from utils.staffstats import staffstats
+from utils.outbound import outbound, Priority
+from utils.logsink import logsink
+from utils.jobs import jobs
+from utils.lockdown import lockdowns
+from utils.msgindex import msgindex
+from utils.dm import dm
 from utils import state
 
 # =====================================================
 # CONFIGURATION (GOD LEVEL SENSITIVITY)
 # =====================================================
 
-WARN_TIMEOUT_THRESHOLD = 3
-WARN_KICK_THRESHOLD = 9 
-
 TIMEOUT_DURATION_MIN = 1440        # 24h escalation
 SPAM_TIMEOUT_MIN = 5               # spam timeout
 SPAM_WINDOW_SEC = 6
@@ -24,10 +32,17 @@ SPAM_LIMIT_NORMAL = 6
 SPAM_LIMIT_PANIC = 4
 
 SPAM_COOLDOWN = 30                 # prevents punishment loops
+SPAM_CLEANUP_SEC = 60              # spammer's messages removed from this window
+
+MASSBAN_CHUNK = 200                # Guild.bulk_ban per-call limit
+MASSBAN_MAX = 5000
+MASSBAN_FILE_MAX = 1_000_000       # bytes read per attached ID list
+ID_REGEX = re.compile(r"\b\d{15,20}\b")
 
 class Moderation(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        jobs.register("voice_mute", self._voice_mute_one)
 
         self.spam_cache: dict[int, list[float]] = {}
         self.last_spam_action: dict[int, float] = {}
@@ -38,10 +53,7 @@ class Moderation(commands.Cog):
         # =================================================
         # HARDEN RUNTIME STATE (CRITICAL)
         # =================================================
-        if not hasattr(state, "WARN_DATA"): state.WARN_DATA = {}
-        if not hasattr(state, "WARN_LOGS"): state.WARN_LOGS = {}
         if not hasattr(state, "LOCKDOWN_DATA"): state.LOCKDOWN_DATA = set()
-        if not hasattr(state, "STAFF_STATS"): state.STAFF_STATS = {}
 
     # =====================================================
     # INTERNAL HELPERS
@@ -61,32 +73,26 @@ class Moderation(commands.Cog):
             return True
         return False
 
-    async def _safe_dm(self, member: discord.Member, embed: discord.Embed):
-        try:
-            await member.send(embed=embed)
-        except (discord.Forbidden, discord.HTTPException):
-            pass
+    def _open_case(self, guild: discord.Guild, kind: str, target, moderator, reason: str) -> int:
+        moderator_id = moderator.id if moderator else self.bot.user.id
+        if moderator:
+            staffstats.record(guild.id, moderator.id, kind, target.id, reason)
+        return cases.open(guild.id, kind, target.id, moderator_id, reason)
+
+    async def _safe_dm(self, member: discord.Member, embed: discord.Embed, before_removal: bool = False):
+        # Failures (closed DMs) are swallowed either way
+        if before_removal:
+            # Kick/ban notices must land while the member still shares the
+            # server: awaited, and at enforcement priority so they are not
+            # stuck behind queued broadcasts
+            await dm.send(member, priority=Priority.ENFORCE, embed=embed)
+        else:
+            # Queued behind enforcement
+            dm.fire(member, embed=embed)
 
     async def _log(self, ctx_or_guild, title: str, description: str, color=COLOR_SECONDARY):
         guild = ctx_or_guild.guild if isinstance(ctx_or_guild, commands.Context) else ctx_or_guild
-        
-        if not getattr(state, "BOT_LOG_CHANNEL_ID", None):
-            return
-
-        channel = guild.get_channel(state.BOT_LOG_CHANNEL_ID)
-        if not channel:
-            return
-
-        try:
-            await channel.send(
-                embed=luxury_embed(
-                    title=title,
-                    description=description,
-                    color=color
-                )
-            )
-        except:
-            pass
+        logsink.log(guild, luxury_embed(title=title, description=description, color=color))
 
     # =====================================================
     # FUTURISTIC LISTENERS (GHOST PING & PANIC)
@@ -97,7 +103,9 @@ class Moderation(commands.Cog):
         """Detects Ghost Pings instantly"""
         if message.author.bot or not message.guild:
             return
-        
+
+        msgindex.forget(message)
+
         if message.mentions or message.role_mentions or message.mention_everyone:
             if (discord.utils.utcnow() - message.created_at).total_seconds() < 60:
                 embed = luxury_embed(
@@ -117,6 +125,8 @@ class Moderation(commands.Cog):
         if message.author.bot or not message.guild:
             return
 
+        msgindex.record(message)
+
         if not getattr(state, "SYSTEM_FLAGS", {}).get("automod_enabled", True):
             return
 
@@ -146,11 +156,8 @@ class Moderation(commands.Cog):
         )
 
         if len(self.spam_cache[uid]) >= limit:
-            try:
-                await message.delete()
-                await message.channel.purge(limit=5, check=lambda m: m.author == member)
-            except:
-                pass
+            # Everything they sent in the window, every channel — no history fetch
+            await msgindex.purge(message.guild, uid, since=now - SPAM_CLEANUP_SEC)
 
             self.last_spam_action[uid] = now
 
@@ -177,89 +184,76 @@ class Moderation(commands.Cog):
         if self._invalid_target(ctx, member):
             return await ctx.send(embed=luxury_embed(title="❌ Error", description="Target is immune.", color=COLOR_DANGER))
 
-        uid = member.id
-        state.WARN_DATA[uid] = state.WARN_DATA.get(uid, 0) + 1
-        warns = state.WARN_DATA[uid]
-
-        # Detailed Logging
-        state.WARN_LOGS.setdefault(uid, []).append({
-            "reason": reason,
-            "by": ctx.author.id,
-            "time": datetime.utcnow().timestamp()
-        })
-
-        # Track Staff Stats
-        sid = ctx.author.id
-        if sid not in state.STAFF_STATS:
-            state.STAFF_STATS[sid] = {"actions": 0, "warns": 0}
-        state.STAFF_STATS[sid]["warns"] += 1
-        state.STAFF_STATS[sid]["actions"] += 1
+        # Persisted per guild; the active count feeds the escalation engine
+        warn_id, warns = warnstore.add(ctx.guild.id, member.id, ctx.author.id, reason)
+        case_no = self._open_case(ctx.guild, "warn", member, ctx.author, reason)
 
         await self._safe_dm(
             member,
             luxury_embed(
                 title="⚠️ Warning Issued",
-                description=f"📄 **Reason:** {reason}\n⚠️ **Total Warnings:** {warns}",
+                description=f"📄 **Reason:** {reason}\n⚠️ **Active Warnings:** {warns}",
                 color=COLOR_SECONDARY
             )
         )
 
-        await ctx.send(embed=luxury_embed(title="⚠️ Warning Logged", description=f"{member.mention} has **{warns}** warnings.", color=COLOR_GOLD))
-        await self._log(ctx, "⚠️ Warning Issued", f"User: {member.mention}\nMod: {ctx.author.mention}\nReason: {reason}\nTotal: {warns}")
-        await self._handle_escalation(ctx, member, warns)
-
-    async def _handle_escalation(self, ctx, member, warns: int):
-        if warns == 3:
-            await self._apply_timeout(ctx, member, 240, "Auto-Escalation (3 Warnings: 4h Timeout)")
-        elif warns == 4:
-            await self._apply_timeout(ctx, member, 360, "Auto-Escalation (4 Warnings: 6h Timeout)")
-        elif warns == 6:
-            await self._apply_timeout(ctx, member, 1440, "Auto-Escalation (6 Warnings: 24h Timeout)")
-        elif warns == 8:
-            await self._apply_timeout(ctx, member, 10080, "Auto-Escalation (8 Warnings: 7d Timeout)")
-        elif warns >= WARN_KICK_THRESHOLD:
-            await self._apply_kick(ctx, member, f"Auto-Escalation ({warns} Warnings)")
+        await ctx.send(embed=luxury_embed(title="⚠️ Warning Logged", description=f"{member.mention} has **{warns}** active warnings. (Case `#{case_no}`)", color=COLOR_GOLD))
+        await self._log(ctx, "⚠️ Warning Issued", f"User: {member.mention}\nMod: {ctx.author.mention}\nReason: {reason}\nActive: {warns}\nCase: #{case_no}")
+        await self._handle_escalation(ctx, member)
+
+    async def _handle_escalation(self, ctx, member):
+        """Warnings + automod strikes share one per-guild ladder."""
+        score, action = escalation.next_action(ctx.guild.id, member.id)
+        if action is None or action == "WARN":
+            return
+
+        reason = f"Auto-Escalation ({score} Infraction Points: {describe(action)})"
+
+        if isinstance(action, int):
+            await self._apply_timeout(ctx, member, action // 60, reason)
+        elif action == "KICK":
+            await self._apply_kick(ctx, member, reason)
+        elif action == "BAN":
+            bot = self._bot_member(ctx.guild)
+            if not bot.guild_permissions.ban_members:
+                return
+            await self._safe_dm(member, luxury_embed(title="⛔ Banned", description=f"📄 **Reason:** {reason}", color=COLOR_DANGER), before_removal=True)
+            try:
+                await outbound.run(Priority.ENFORCE, lambda: member.ban(reason=reason), ("guild", ctx.guild.id))
+            except discord.HTTPException as e:
+                # e.g. target above the bot in the role hierarchy
+                await ctx.send(embed=luxury_embed(title="❌ Escalation Failed", description=f"Could not ban {member.mention}: `{e.text or e.status}`", color=COLOR_DANGER))
+                return await self._log(ctx, "❌ Escalation Ban Failed", f"User: {member}\nReason: {reason}\nError: {e.status}", COLOR_DANGER)
+            case_no = self._open_case(ctx.guild, "ban", member, ctx.author, reason)
+            await ctx.send(embed=luxury_embed(title="⛔ Banned", description=f"{member.mention} blacklisted.", color=COLOR_GOLD))
+            await self._log(ctx, "⛔ Ban", f"User: {member}\nReason: {reason}\nCase: #{case_no}")
 
     @commands.command(name="warns", aliases=["warnings", "warnhistory"])
+    @commands.guild_only()
     @require_level(1)
     async def warnings(self, ctx, member: discord.Member):
         """Views detailed warning history for a user"""
-        uid = member.id
-        count = state.WARN_DATA.get(uid, 0)
-        logs = state.WARN_LOGS.get(uid, [])
+        rows = warnstore.page(ctx.guild.id, member.id)
 
-        if not logs:
+        if not rows:
             return await ctx.send(embed=luxury_embed(title="✅ Clean History", description=f"{member.mention} has no warnings.", color=COLOR_GOLD))
 
-        desc = ""
-        # Showing last 10 warnings to keep embed clean
-        for i, log in enumerate(logs[-10:], 1): 
-            mod = ctx.guild.get_member(log['by'])
-            mod_name = mod.mention if mod else f"Unknown Staff (`{log['by']}`)"
-            date = datetime.fromtimestamp(log['time']).strftime('%Y-%m-%d %H:%M')
-            desc += f"**{i}.** `{date}` - {log['reason']} (By: {mod_name})\n"
-
-        embed = luxury_embed(
-            title=f"📋 Warning History — {member.name}", 
-            description=f"**Total Infractions:** {count}\n\n{desc}", 
-            color=COLOR_GOLD
-        )
-        embed.set_footer(text=f"User ID: {member.id}")
-        await ctx.send(embed=embed)
+        view = WarnHistoryView(ctx.author.id, ctx.guild, member, rows)
+        view.message = await ctx.send(embed=view.render(), view=view if view.has_more else None)
 
     @commands.command(name="warnstats")
     @require_level(2)
     async def warnstats(self, ctx, staff: discord.Member = None):
         """Views moderation statistics for a staff member"""
         target = staff or ctx.author
-        stats = state.STAFF_STATS.get(target.id, {"actions": 0, "warns": 0})
+        stats = staffstats.totals(ctx.guild.id, target.id)
 
         embed = luxury_embed(
             title=f"📊 Staff Performance — {target.name}",
             description=(
                 f"**Warnings Issued:** {stats['warns']}\n"
                 f"**Total Mod Actions:** {stats['actions']}\n"
-                f"*Note: Stats reset on bot restart.*"
+                f"**Actions Today:** {stats['today']}"
             ),
             color=COLOR_GOLD
         )
@@ -270,9 +264,56 @@ class Moderation(commands.Cog):
     @require_level(3)
     async def clearwarns(self, ctx, member: discord.Member):
         """Resets all warnings for a user"""
-        state.WARN_DATA[member.id] = 0
-        state.WARN_LOGS[member.id] = []
-        await ctx.send(embed=luxury_embed(title="✅ Warnings Cleared", description=f"Reset history for {member.mention}", color=COLOR_GOLD))
+        removed = warnstore.clear(ctx.guild.id, member.id)
+        await ctx.send(embed=luxury_embed(title="✅ Warnings Cleared", description=f"Removed **{removed}** warnings for {member.mention}", color=COLOR_GOLD))
+
+    # =====================================================
+    # ESCALATION LADDER (SHARED WITH AUTOMOD)
+    # =====================================================
+
+    @commands.group(name="escalation", invoke_without_command=True)
+    @commands.guild_only()
+    @require_level(2)
+    async def escalation_cmd(self, ctx, member: discord.Member = None):
+        """Shows the guild ladder, or a member's current infraction score"""
+        if member:
+            warns = escalation.warn_count(ctx.guild.id, member.id)
+            score, action = escalation.next_action(ctx.guild.id, member.id)
+            nxt = escalation.ladder(ctx.guild.id).action_for(score + 1)
+            return await ctx.send(embed=luxury_embed(
+                title=f"📈 Escalation — {member.name}",
+                description=(
+                    f"**Warnings:** {warns}\n"
+                    f"**AutoMod Strikes:** {score - warns}\n"
+                    f"**Score:** {score}\n"
+                    f"**Next Infraction:** {describe(nxt)}"
+                ),
+                color=COLOR_GOLD
+            ))
+
+        steps = escalation.ladder(ctx.guild.id).steps
+        desc = "\n".join(f"`{points:>2}` pts → **{describe(action)}**" for points, action in steps.items())
+        await ctx.send(embed=luxury_embed(title="📈 Escalation Ladder", description=desc, color=COLOR_GOLD))
+
+    @escalation_cmd.command(name="set")
+    @require_level(4)
+    async def escalation_set(self, ctx, points: int, action: str):
+        """&escalation set <points> <warn|kick|ban|10m|6h|7d>"""
+        try:
+            parsed = parse_action(action)
+        except ValueError as e:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Action", description=str(e), color=COLOR_DANGER))
+        if points < 1:
+            return await ctx.send(embed=luxury_embed(title="❌ Invalid Step", description="Points must be 1 or higher.", color=COLOR_DANGER))
+
+        escalation.set_step(ctx.guild.id, points, parsed)
+        await ctx.send(embed=luxury_embed(title="✅ Ladder Updated", description=f"`{points}` pts → **{describe(parsed)}**", color=COLOR_GOLD))
+
+    @escalation_cmd.command(name="reset")
+    @require_level(4)
+    async def escalation_reset(self, ctx):
+        escalation.reset_ladder(ctx.guild.id)
+        await ctx.send(embed=luxury_embed(title="✅ Ladder Reset", description="Using the default escalation ladder.", color=COLOR_GOLD))
 
     # =====================================================
     # TIMEOUT / UNTIMEOUT
@@ -300,17 +341,12 @@ class Moderation(commands.Cog):
             return
 
         await self._safe_dm(member, luxury_embed(title="⏳ Timeout Applied", description=f"⏱ **Duration:** {minutes}m\n📄 **Reason:** {reason}", color=COLOR_SECONDARY))
-        await member.timeout(timedelta(minutes=minutes), reason=reason)
-        
-        # Log to Staff Stats if triggered by a command
-        if ctx:
-            sid = ctx.author.id
-            if sid not in state.STAFF_STATS: state.STAFF_STATS[sid] = {"actions": 0, "warns": 0}
-            state.STAFF_STATS[sid]["actions"] += 1
+        await outbound.run(Priority.ENFORCE, lambda: member.timeout(timedelta(minutes=minutes), reason=reason), ("guild", target_guild.id))
+        case_no = self._open_case(target_guild, "timeout", member, ctx.author if ctx else None, f"{minutes}m — {reason}")
 
         if ctx and not silent:
             await ctx.send(embed=luxury_embed(title="⏳ Timeout Executed", description=f"{member.mention} silenced for **{minutes}m**.", color=COLOR_GOLD))
-        await self._log(target_guild, "⏳ Timeout", f"User: {member.mention}\nDuration: {minutes}m\nReason: {reason}")
+        await self._log(target_guild, "⏳ Timeout", f"User: {member.mention}\nDuration: {minutes}m\nReason: {reason}\nCase: #{case_no}")
 
     # =====================================================
     # KICK / BAN / SOFTBAN
@@ -327,31 +363,25 @@ class Moderation(commands.Cog):
     async def _apply_kick(self, ctx, member, reason: str):
         bot = self._bot_member(ctx.guild)
         if not bot.guild_permissions.kick_members: return
-        await self._safe_dm(member, luxury_embed(title="🚫 Kicked", description=f"📄 **Reason:** {reason}", color=COLOR_DANGER))
-        await member.kick(reason=reason)
+        await self._safe_dm(member, luxury_embed(title="🚫 Kicked", description=f"📄 **Reason:** {reason}", color=COLOR_DANGER), before_removal=True)
+        await outbound.run(Priority.ENFORCE, lambda: member.kick(reason=reason), ("guild", ctx.guild.id))
+        case_no = self._open_case(ctx.guild, "kick", member, ctx.author, reason)
         
         if ctx:
-            sid = ctx.author.id
-            if sid not in state.STAFF_STATS: state.STAFF_STATS[sid] = {"actions": 0, "warns": 0}
-            state.STAFF_STATS[sid]["actions"] += 1
-            
             await ctx.send(embed=luxury_embed(title="👢 Kicked", description=f"{member.mention} removed.", color=COLOR_GOLD))
-            await self._log(ctx, "👢 Kick", f"User: {member}\nReason: {reason}")
+            await self._log(ctx, "👢 Kick", f"User: {member}\nReason: {reason}\nCase: #{case_no}")
 
     @commands.command(name="ban")
     @commands.guild_only()
     @require_level(4)
     async def ban(self, ctx, member: discord.Member, *, reason="No reason provided"):
         if self._invalid_target(ctx, member): return
-        await self._safe_dm(member, luxury_embed(title="⛔ Banned", description=f"📄 **Reason:** {reason}", color=COLOR_DANGER))
-        await member.ban(reason=reason)
-        
-        sid = ctx.author.id
-        if sid not in state.STAFF_STATS: state.STAFF_STATS[sid] = {"actions": 0, "warns": 0}
-        state.STAFF_STATS[sid]["actions"] += 1
+        await self._safe_dm(member, luxury_embed(title="⛔ Banned", description=f"📄 **Reason:** {reason}", color=COLOR_DANGER), before_removal=True)
+        await outbound.run(Priority.ENFORCE, lambda: member.ban(reason=reason), ("guild", ctx.guild.id))
+        case_no = self._open_case(ctx.guild, "ban", member, ctx.author, reason)
         
         await ctx.send(embed=luxury_embed(title="⛔ Banned", description=f"{member.mention} blacklisted.", color=COLOR_GOLD))
-        await self._log(ctx, "⛔ Ban", f"User: {member}\nReason: {reason}")
+        await self._log(ctx, "⛔ Ban", f"User: {member}\nReason: {reason}\nCase: #{case_no}")
 
     @commands.command(name="softban")
     @require_level(3)
@@ -359,6 +389,7 @@ class Moderation(commands.Cog):
         if self._invalid_target(ctx, member): return
         await member.ban(reason=reason, delete_message_days=7)
         await ctx.guild.unban(member)
+        self._open_case(ctx.guild, "softban", member, ctx.author, reason)
         await ctx.send(embed=luxury_embed(title="🧼 Softbanned", description=f"Cleared messages for {member.mention}.", color=COLOR_GOLD))
 
     @commands.command(name="unban")
@@ -367,10 +398,132 @@ class Moderation(commands.Cog):
         try:
             user = await self.bot.fetch_user(user_id)
             await ctx.guild.unban(user)
+            self._open_case(ctx.guild, "unban", user, ctx.author, f"Unbanned by {ctx.author}")
             await ctx.send(embed=luxury_embed(title="🔓 Unbanned", description=f"Restored access for {user.name}", color=COLOR_GOLD))
         except:
             await ctx.send("❌ User not found or not banned.")
 
+    @commands.command(name="cleanup")
+    @commands.guild_only()
+    @require_level(2)
+    async def cleanup(self, ctx, user: discord.User, minutes: int = None):
+        """Deletes a user's recent messages across all channels (default: all indexed)."""
+        since = time.time() - minutes * 60 if minutes else None
+        start = time.perf_counter()
+        deleted, failed = await msgindex.purge(ctx.guild, user.id, since=since)
+        elapsed = time.perf_counter() - start
+
+        if not deleted and not failed:
+            return await ctx.send(embed=luxury_embed(title="🧹 Cleanup", description=f"No recent messages indexed for {user.mention}.", color=COLOR_SECONDARY))
+
+        staffstats.record(ctx.guild.id, ctx.author.id, "cleanup", user.id, f"{deleted} messages")
+        desc = f"Removed **{deleted}** messages from {user.mention}."
+        if failed:
+            desc += f"\n❌ {failed} could not be deleted."
+        desc += f"\n**Time:** `{elapsed:.2f}s`"
+        await ctx.send(embed=luxury_embed(title="🧹 Cleanup Complete", description=desc, color=COLOR_GOLD))
+
+    @commands.command(name="massban")
+    @commands.guild_only()
+    @require_level(4)
+    async def massban(self, ctx, *, args: str = ""):
+        """
+        &massban <ids / mentions...> [--joined <minutes>] [--reason <text>]
+        IDs are also read from attached text files (one or many per line).
+        """
+        reason = "Mass ban"
+        if "--reason" in args:
+            args, reason = args.split("--reason", 1)
+            reason = reason.strip() or "Mass ban"
+
+        targets = set()
+        joined = re.search(r"--joined\s+(\d+)", args)
+        if joined:
+            args = args.replace(joined.group(0), "")
+            cutoff = discord.utils.utcnow() - timedelta(minutes=int(joined.group(1)))
+            targets |= {m.id for m in ctx.guild.members if m.joined_at and m.joined_at >= cutoff}
+
+        targets |= {int(x) for x in ID_REGEX.findall(args)}
+        for attachment in ctx.message.attachments:
+            if attachment.size <= MASSBAN_FILE_MAX:
+                data = (await attachment.read()).decode(errors="ignore")
+                targets |= {int(x) for x in ID_REGEX.findall(data)}
+
+        # Same protections as &ban for anyone still in the server
+        protected = set()
+        for user_id in targets:
+            member = ctx.guild.get_member(user_id)
+            if user_id in (ctx.author.id, self.bot.user.id, ctx.guild.owner_id) or (member and self._invalid_target(ctx, member)):
+                protected.add(user_id)
+        targets -= protected
+
+        if not targets:
+            return await ctx.send(embed=luxury_embed(title="🔨 Mass Ban", description="No bannable targets found.", color=COLOR_SECONDARY))
+        if len(targets) > MASSBAN_MAX:
+            return await ctx.send(embed=luxury_embed(title="🔨 Mass Ban", description=f"Refusing {len(targets)} targets (max {MASSBAN_MAX}).", color=COLOR_DANGER))
+
+        present = sum(1 for t in targets if ctx.guild.get_member(t))
+        view = MassBanView(self, ctx, sorted(targets), reason)
+        view.message = await ctx.send(
+            embed=luxury_embed(
+                title="🔨 Confirm Mass Ban",
+                description=(
+                    f"**Targets:** {len(targets)} ({present} in server, {len(targets) - present} by ID)\n"
+                    f"**Skipped (protected):** {len(protected)}\n"
+                    f"**Reason:** {reason}"
+                ),
+                color=COLOR_DANGER
+            ),
+            view=view
+        )
+
+    async def _execute_massban(self, ctx, user_ids: list, reason: str):
+        start = time.perf_counter()
+        audit_reason = f"{ctx.author}: {reason}"[:512]
+        banned, failed = [], []
+
+        for i in range(0, len(user_ids), MASSBAN_CHUNK):
+            chunk = [discord.Object(id=uid) for uid in user_ids[i:i + MASSBAN_CHUNK]]
+            try:
+                result = await outbound.run(
+                    Priority.ENFORCE,
+                    lambda chunk=chunk: ctx.guild.bulk_ban(chunk, reason=audit_reason),
+                    ("guild", ctx.guild.id)
+                )
+                banned += [u.id for u in result.banned]
+                failed += [u.id for u in result.failed]
+            except discord.HTTPException:
+                # Raised when nothing in the chunk could be banned
+                failed += [u.id for u in chunk]
+
+        elapsed = time.perf_counter() - start
+
+        # One case and one log entry for the whole operation
+        case_no = None
+        if banned:
+            staffstats.record(ctx.guild.id, ctx.author.id, "massban", reason=f"{len(banned)} users")
+            case_no = cases.open(ctx.guild.id, "massban", None, ctx.author.id, f"{len(banned)} users — {reason}")
+
+            listing = "banned:\n" + "\n".join(map(str, banned))
+            if failed:
+                listing += "\n\nfailed:\n" + "\n".join(map(str, failed))
+            logsink.log(
+                ctx.guild,
+                luxury_embed(
+                    title="🔨 Mass Ban",
+                    description=f"By: {ctx.author}\nBanned: {len(banned)}\nFailed: {len(failed)}\nReason: {reason}\nCase: #{case_no}",
+                    color=COLOR_DANGER
+                ),
+                file=discord.File(io.BytesIO(listing.encode()), filename=f"massban-{case_no}.txt")
+            )
+
+        desc = f"**Banned:** {len(banned)}\n**Failed:** {len(failed)}\n**Time:** `{elapsed:.2f}s`"
+        if failed:
+            desc += "\n\n**Failed IDs:** " + ", ".join(f"`{u}`" for u in failed[:20]) + (" …" if len(failed) > 20 else "")
+        if case_no:
+            desc += f"\n**Case:** #{case_no}"
+        return luxury_embed(title="🔨 Mass Ban Complete", description=desc, color=COLOR_GOLD if banned else COLOR_DANGER)
+
     # =====================================================
     # UTILITY & LOCKDOWN
     # =====================================================
@@ -379,43 +532,59 @@ class Moderation(commands.Cog):
     @require_level(2)
     async def slowmode(self, ctx, seconds: int):
         await ctx.channel.edit(slowmode_delay=seconds)
+        staffstats.record(ctx.guild.id, ctx.author.id, "slowmode", ctx.channel.id, f"{seconds}s")
         await ctx.send(embed=luxury_embed(title="⏲️ Slowmode", description=f"Set to {seconds}s.", color=COLOR_GOLD))
 
     @commands.command(name="lock")
     @require_level(3)
     async def lock(self, ctx):
         await ctx.channel.set_permissions(ctx.guild.default_role, send_messages=False)
+        staffstats.record(ctx.guild.id, ctx.author.id, "lock", ctx.channel.id)
         await ctx.send(embed=luxury_embed(title="🔒 Locked", description="Channel is now restricted.", color=COLOR_DANGER))
 
     @commands.command(name="unlock")
     @require_level(3)
     async def unlock(self, ctx):
         await ctx.channel.set_permissions(ctx.guild.default_role, send_messages=None)
+        staffstats.record(ctx.guild.id, ctx.author.id, "unlock", ctx.channel.id)
         await ctx.send(embed=luxury_embed(title="🔓 Unlocked", description="Channel is open.", color=COLOR_GOLD))
 
     @commands.command(name="lockdown")
     @require_level(4)
-    async def lockdown(self, ctx):
+    async def lockdown(self, ctx, mode: str = "auto"):
+        """Locks every text channel. Mode: auto (default), role or channels."""
+        if mode not in ("auto", "role", "channels"):
+            return await ctx.send("❌ Mode must be `auto`, `role` or `channels`.")
+
         await ctx.send("⚠️ **INITIATING SERVER-WIDE LOCKDOWN...**")
-        count = 0
-        for channel in ctx.guild.text_channels:
-            try:
-                await channel.set_permissions(ctx.guild.default_role, send_messages=False)
-                count += 1
-            except: continue
-        await ctx.send(embed=luxury_embed(title="🚨 LOCKDOWN COMPLETE", description=f"Secured {count} channels.", color=COLOR_DANGER))
+        result = await lockdowns.lock(ctx.guild, ctx.author.id, mode)
+        if result is None:
+            return await ctx.send(embed=luxury_embed(title="🚨 Already Locked", description="Run `&unlockdown` first; the saved permissions are kept.", color=COLOR_DANGER))
+
+        how = "@everyone role edit" if result.mode == "role" else "per-channel overwrites"
+        desc = f"**Mode:** {how}\n**Channel overwrites:** {result.channels}"
+        if result.failed:
+            desc += f" (❌ {result.failed} failed)"
+        desc += f"\n**Time:** `{result.elapsed:.2f}s`"
+
+        staffstats.record(ctx.guild.id, ctx.author.id, "lockdown", reason=f"{result.mode}, {result.channels} channels")
+        await ctx.send(embed=luxury_embed(title="🚨 LOCKDOWN COMPLETE", description=desc, color=COLOR_DANGER))
 
     @commands.command(name="unlockdown")
     @require_level(4)
     async def unlockdown(self, ctx):
         await ctx.send("🔓 **RESTORING SERVER ACCESS...**")
-        count = 0
-        for channel in ctx.guild.text_channels:
-            try:
-                await channel.set_permissions(ctx.guild.default_role, send_messages=None)
-                count += 1
-            except: continue
-        await ctx.send(embed=luxury_embed(title="🔓 UNLOCKDOWN COMPLETE", description=f"Restored {count} channels.", color=COLOR_GOLD))
+        result = await lockdowns.unlock(ctx.guild)
+        if result is None:
+            return await ctx.send(embed=luxury_embed(title="🔓 Not Locked", description="There is no saved lockdown for this server.", color=COLOR_SECONDARY))
+
+        desc = f"**Restored overwrites:** {result.channels}"
+        if result.failed:
+            desc += f"\n❌ {result.failed} channel(s) failed — run `&unlockdown` again to retry them."
+        desc += f"\n**Time:** `{result.elapsed:.2f}s`"
+
+        staffstats.record(ctx.guild.id, ctx.author.id, "unlockdown", reason=f"{result.channels} channels")
+        await ctx.send(embed=luxury_embed(title="🔓 UNLOCKDOWN COMPLETE", description=desc, color=COLOR_GOLD))
 
     # =====================================================
     # VOICE MODERATION
@@ -425,22 +594,127 @@ class Moderation(commands.Cog):
     @require_level(3)
     async def vmuteall(self, ctx):
         if not ctx.author.voice: return await ctx.send("❌ You must be in a VC.")
-        count = 0
-        for member in ctx.author.voice.channel.members:
-            if member.top_role < ctx.author.top_role:
-                await member.edit(mute=True)
-                count += 1
-        await ctx.send(embed=luxury_embed(title="🎙️ Voice Mute", description=f"Muted {count} users.", color=COLOR_DANGER))
+        channel = ctx.author.voice.channel
+        targets = [m.id for m in channel.members if m.top_role < ctx.author.top_role]
+        staffstats.record(ctx.guild.id, ctx.author.id, "vmuteall", channel.id, f"{len(targets)} users")
+        await jobs.launch(ctx, "voice_mute", {"mute": True}, targets, f"Voice mute {channel.name}")
 
     @commands.command(name="vunmuteall")
     @require_level(3)
     async def vunmuteall(self, ctx):
         if not ctx.author.voice: return await ctx.send("❌ You must be in a VC.")
-        count = 0
-        for member in ctx.author.voice.channel.members:
-            await member.edit(mute=False)
-            count += 1
-        await ctx.send(embed=luxury_embed(title="🎙️ Voice Unmute", description=f"Unmuted {count} users.", color=COLOR_GOLD))
+        channel = ctx.author.voice.channel
+        targets = [m.id for m in channel.members]
+        staffstats.record(ctx.guild.id, ctx.author.id, "vunmuteall", channel.id, f"{len(targets)} users")
+        await jobs.launch(ctx, "voice_mute", {"mute": False}, targets, f"Voice unmute {channel.name}")
+
+    @staticmethod
+    async def _voice_mute_one(guild: discord.Guild, params: dict, target_id: int) -> bool:
+        member = guild.get_member(target_id)
+        # Left voice since the snapshot, or already in the wanted state
+        if member is None or member.voice is None or member.voice.mute == params["mute"]:
+            return False
+        await member.edit(mute=params["mute"])
+        return True
+
+# =====================================================
+# WARN HISTORY PAGINATION (KEYSET)
+# =====================================================
+
+class WarnHistoryView(discord.ui.View):
+    def __init__(self, author_id: int, guild: discord.Guild, member: discord.Member, rows):
+        super().__init__(timeout=120)
+        self.author_id = author_id
+        self.guild = guild
+        self.member = member
+        self.rows = rows
+        self.page_no = 1
+        self.message = None
+
+    @property
+    def has_more(self) -> bool:
+        return len(self.rows) == PAGE_SIZE
+
+    def render(self) -> discord.Embed:
+        now = time.time()
+        desc = ""
+        for row in self.rows:
+            mod = self.guild.get_member(row["moderator_id"])
+            mod_name = mod.mention if mod else f"Unknown Staff (`{row['moderator_id']}`)"
+            date = datetime.fromtimestamp(row["created_at"]).strftime('%Y-%m-%d %H:%M')
+            expired = row["expires_at"] is not None and row["expires_at"] <= now
+            tag = " *(expired)*" if expired else ""
+            desc += f"**#{row['id']}** `{date}` - {row['reason']} (By: {mod_name}){tag}\n"
+
+        embed = luxury_embed(
+            title=f"📋 Warning History — {self.member.name}",
+            description=f"**Active Infractions:** {warnstore.active_count(self.guild.id, self.member.id)}\n\n{desc}",
+            color=COLOR_GOLD
+        )
+        embed.set_footer(text=f"User ID: {self.member.id} • Page {self.page_no}")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="Older ▶", style=discord.ButtonStyle.secondary)
+    async def older(self, interaction: discord.Interaction, button: discord.ui.Button):
+        rows = warnstore.page(self.guild.id, self.member.id, before_id=self.rows[-1]["id"])
+        if rows:
+            self.rows = rows
+            self.page_no += 1
+        button.disabled = not self.has_more or not rows
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+
+# =====================================================
+# MASS BAN CONFIRMATION
+# =====================================================
+
+class MassBanView(discord.ui.View):
+    def __init__(self, cog: "Moderation", ctx, user_ids: list, reason: str):
+        super().__init__(timeout=60)
+        self.cog = cog
+        self.ctx = ctx
+        self.user_ids = user_ids
+        self.reason = reason
+        self.message = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.ctx.author.id
+
+    @discord.ui.button(label="Ban them", style=discord.ButtonStyle.danger, emoji="🔨")
+    async def confirm(self, interaction: discord.Interaction, _):
+        self.stop()
+        await interaction.response.edit_message(
+            embed=luxury_embed(title="🔨 Mass Ban", description=f"Banning {len(self.user_ids)} users...", color=COLOR_DANGER),
+            view=None
+        )
+        embed = await self.cog._execute_massban(self.ctx, self.user_ids, self.reason)
+        await interaction.edit_original_response(embed=embed)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, _):
+        self.stop()
+        await interaction.response.edit_message(
+            embed=luxury_embed(title="🔨 Mass Ban", description="Cancelled.", color=COLOR_SECONDARY),
+            view=None
+        )
+
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
 
 async def setup(bot: commands.Bot):
     # SAFETY: Remove collisions
@@ -3,6 +3,7 @@ from discord.ext import commands
 from datetime import datetime
 
 from utils.database import db
+from utils.warnstore import warnstore
 from utils.embeds import luxury_embed
 from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
 from utils import state
@@ -41,19 +42,18 @@ class Profile(commands.Cog):
         try:
             data = db.fetchone(
                 """
-                SELECT messages_week, messages_total, 
-                (SELECT COUNT(*) FROM warnings WHERE user_id = ? AND guild_id = ?) as warns
+                SELECT messages_week, messages_total
                 FROM user_stats 
                 WHERE user_id = ? AND guild_id = ?
                 """,
-                (member.id, ctx.guild.id, member.id, ctx.guild.id)
+                (member.id, ctx.guild.id)
             )
         except Exception:
             data = None
 
         msg_week = data["messages_week"] if data else 0
         msg_total = data["messages_total"] if data else 0
-        warn_count = data["warns"] if data else 0
+        warn_count = warnstore.active_count(ctx.guild.id, member.id)
 
         # ---------------- LEVEL LOGIC ----------------
         level = int((msg_total ** 0.5) / 2) if msg_total > 0 else 0
@@ -1,252 +1,257 @@
-import discord
-from discord.ext import commands, tasks
-from datetime import datetime, timedelta
-
-from utils.embeds import luxury_embed
-from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
-from utils import state
-
-
-ABUSE_ALERT_COOLDOWN = timedelta(hours=1)
-
-
-class Staff(commands.Cog):
-    """
-    Staff intelligence & oversight system.
-    • Private staff notes
-    • Staff activity tracking
-    • Burnout detection
-    • Abuse-pattern alerts (safe & non-accusatory)
-    """
-
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self._abuse_alert_cache: dict[int, datetime] = {}
-
-        # =================================================
-        # 🔒 HARDEN RUNTIME STATE (CRITICAL FIX)
-        # =================================================
-
-        if not hasattr(state, "STAFF_STATS"):
-            state.STAFF_STATS = {}
-
-        if not hasattr(state, "STAFF_NOTES"):
-            state.STAFF_NOTES = {}
-
-        if not hasattr(state, "MAIN_GUILD_ID"):
-            state.MAIN_GUILD_ID = None
-
-    async def cog_load(self):
-        self.activity_monitor.start()
-
-    def cog_unload(self):
-        self.activity_monitor.cancel()
-
-    # =====================================
-    # INTERNAL HELPERS
-    # =====================================
-
-    def is_staff(self, member: discord.Member) -> bool:
-        """
-        Role-name based check (robust even if IDs change)
-        """
-        return any(
-            role.name in ("Staff", "Staff+", "Staff++", "Staff+++")
-            for role in member.roles
-        )
-
-    def record_action(self, staff_id: int):
-        stats = state.STAFF_STATS.setdefault(
-            staff_id,
-            {
-                "actions": 0,
-                "today": 0,
-                "last_action": None
-            }
-        )
-        stats["actions"] += 1
-        stats["today"] += 1
-        stats["last_action"] = datetime.utcnow()
-
-    # =====================================
-    # STAFF NOTES (PRIVATE)
-    # =====================================
-
-    @commands.command()
-    @commands.guild_only()
-    async def note(self, ctx: commands.Context, user: discord.Member, *, note: str):
-        if not self.is_staff(ctx.author):
-            return await ctx.send(
-                embed=luxury_embed(
-                    title="❌ Access Denied",
-                    description="Only staff members may use this command.",
-                    color=COLOR_DANGER
-                )
-            )
-
-        notes = state.STAFF_NOTES.setdefault(user.id, [])
-        notes.append({
-            "by": ctx.author.id,
-            "note": note,
-            "time": datetime.utcnow()
-        })
-
-        self.record_action(ctx.author.id)
-
-        await ctx.send(
-            embed=luxury_embed(
-                title="📝 Staff Note Added",
-                description=f"A private note has been recorded for **{user}**.",
-                color=COLOR_GOLD
-            )
-        )
-
-    @commands.command()
-    @commands.guild_only()
-    async def notes(self, ctx: commands.Context, user: discord.Member):
-        if not self.is_staff(ctx.author):
-            return await ctx.send(
-                embed=luxury_embed(
-                    title="❌ Access Denied",
-                    description="Only staff members may view staff notes.",
-                    color=COLOR_DANGER
-                )
-            )
-
-        notes = state.STAFF_NOTES.get(user.id, [])
-        if not notes:
-            return await ctx.send(
-                embed=luxury_embed(
-                    title="📝 Staff Notes",
-                    description="No internal notes recorded for this user.",
-                    color=COLOR_SECONDARY
-                )
-            )
-
-        desc = "\n".join(
-            f"• <@{n['by']}> — {n['note']} "
-            f"(`{n['time'].strftime('%Y-%m-%d %H:%M')}`)"
-            for n in notes[-5:]
-        )
-
-        await ctx.send(
-            embed=luxury_embed(
-                title=f"🧠 Staff Notes — {user}",
-                description=desc,
-                color=COLOR_GOLD
-            )
-        )
-
-    # =====================================
-    # STAFF SNAPSHOT
-    # =====================================
-
-    @commands.command(name="staff")
-    @commands.guild_only()
-    async def staff_snapshot(self, ctx: commands.Context):
-        staff_members = [m for m in ctx.guild.members if self.is_staff(m)]
-
-        if not staff_members:
-            return await ctx.send(
-                embed=luxury_embed(
-                    title="👥 Staff Activity Snapshot",
-                    description="No staff activity recorded yet.",
-                    color=COLOR_SECONDARY
-                )
-            )
-
-        lines = []
-        for member in staff_members:
-            stats = state.STAFF_STATS.get(member.id, {})
-            lines.append(
-                f"• {member.mention} — "
-                f"{stats.get('today', 0)} actions today | "
-                f"{stats.get('actions', 0)} total"
-            )
-
-        await ctx.send(
-            embed=luxury_embed(
-                title="👥 Staff Activity Snapshot",
-                description="\n".join(lines),
-                color=COLOR_GOLD
-            )
-        )
-
-    # =====================================
-    # BURNOUT & ABUSE MONITOR
-    # =====================================
-
-    @tasks.loop(minutes=30)
-    async def activity_monitor(self):
-        now = datetime.utcnow()
-
-        for staff_id, stats in state.STAFF_STATS.items():
-            user = self.bot.get_user(staff_id)
-            if not user:
-                continue
-
-            today = stats.get("today", 0)
-            last_action = stats.get("last_action")
-
-            # 🔹 Burnout reminder
-            if today >= 20:
-                try:
-                    await user.send(
-                        embed=luxury_embed(
-                            title="🧠 Staff Wellness Reminder",
-                            description=(
-                                "You’ve been highly active today.\n\n"
-                                "Please consider taking a short break "
-                                "to avoid burnout."
-                            ),
-                            color=COLOR_SECONDARY
-                        )
-                    )
-                except (discord.Forbidden, discord.HTTPException):
-                    pass
-
-            # 🔹 Abuse-pattern alert (rate + cooldown protected)
-            if (
-                last_action
-                and now - last_action < timedelta(minutes=2)
-                and today >= 10
-            ):
-                last_alert = self._abuse_alert_cache.get(staff_id)
-                if last_alert and now - last_alert < ABUSE_ALERT_COOLDOWN:
-                    continue
-
-                self._abuse_alert_cache[staff_id] = now
-
-                guild = self.bot.get_guild(state.MAIN_GUILD_ID)
-                if guild and guild.owner:
-                    try:
-                        await guild.owner.send(
-                            embed=luxury_embed(
-                                title="⚠️ Staff Action Alert",
-                                description=(
-                                    f"<@{staff_id}> has performed many moderation "
-                                    "actions in a short time.\n\n"
-                                    "This is a **safety signal**, "
-                                    "not an accusation."
-                                ),
-                                color=COLOR_DANGER
-                            )
-                        )
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
-
-        # 🔄 Daily reset
-        for stats in state.STAFF_STATS.values():
-            if (
-                stats.get("last_action")
-                and stats["last_action"].date() != now.date()
-            ):
-                stats["today"] = 0
-
-    @activity_monitor.before_loop
-    async def before_monitor(self):
-        await self.bot.wait_until_ready()
-
-
-async def setup(bot: commands.Bot):
-    await bot.add_cog(Staff(bot))
+import discord
+from discord.ext import commands, tasks
+from datetime import datetime
+
+from utils.embeds import luxury_embed
+from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.cases import cases
+from utils.staffstats import staffstats
+from utils.windows import WindowRegistry
+from utils.outbound import Priority
+from utils.dm import dm
+from utils.staffindex import staffindex
+from utils import state
+
+
+# Abuse signal: many actions in a short burst
+BURST_WINDOW = 120            # seconds
+BURST_THRESHOLD = 10
+ABUSE_ALERT_COOLDOWN = 3600
+
+# Burnout signal: sustained workload over a rolling day
+WORKLOAD_WINDOW = 86400
+WORKLOAD_THRESHOLD = 20
+BURNOUT_REMINDER_COOLDOWN = 43200
+
+# &staff lists at most this many members (embed description limit)
+SNAPSHOT_LIMIT = 25
+
+
+class Staff(commands.Cog):
+    """
+    Staff intelligence & oversight system.
+    • Private staff notes
+    • Staff activity tracking
+    • Burnout detection
+    • Abuse-pattern alerts (safe & non-accusatory)
+    """
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+        # Per (guild, staff) sliding windows, updated on every action
+        self.burst = WindowRegistry(BURST_WINDOW, buckets=12)
+        self.workload = WindowRegistry(WORKLOAD_WINDOW, buckets=24)
+        self._abuse_alert_cache: dict[tuple, float] = {}
+        self._burnout_cache: dict[tuple, float] = {}
+
+        # =================================================
+        # 🔒 HARDEN RUNTIME STATE (CRITICAL FIX)
+        # =================================================
+
+        if not hasattr(state, "MAIN_GUILD_ID"):
+            state.MAIN_GUILD_ID = None
+
+    async def cog_load(self):
+        self.flush_stats.start()
+
+    def cog_unload(self):
+        self.flush_stats.cancel()
+        staffstats.try_flush()
+
+    # =====================================
+    # INTERNAL HELPERS
+    # =====================================
+
+    def is_staff(self, member: discord.Member) -> bool:
+        """
+        Role-name based check (robust even if IDs change),
+        answered from the staff index
+        """
+        return staffindex.is_staff(member)
+
+    def record_action(self, guild_id: int, staff_id: int, action: str, target_id: int = None):
+        staffstats.record(guild_id, staff_id, action, target_id)
+
+    # =====================================
+    # STAFF NOTES (PRIVATE)
+    # =====================================
+
+    @commands.command()
+    @commands.guild_only()
+    async def note(self, ctx: commands.Context, user: discord.Member, *, note: str):
+        if not self.is_staff(ctx.author):
+            return await ctx.send(
+                embed=luxury_embed(
+                    title="❌ Access Denied",
+                    description="Only staff members may use this command.",
+                    color=COLOR_DANGER
+                )
+            )
+
+        # Notes are stored as searchable cases (&case search)
+        case_no = cases.open(ctx.guild.id, "note", user.id, ctx.author.id, note)
+
+        self.record_action(ctx.guild.id, ctx.author.id, "note", user.id)
+
+        await ctx.send(
+            embed=luxury_embed(
+                title="📝 Staff Note Added",
+                description=f"A private note has been recorded for **{user}**. (Case `#{case_no}`)",
+                color=COLOR_GOLD
+            )
+        )
+
+    @commands.command()
+    @commands.guild_only()
+    async def notes(self, ctx: commands.Context, user: discord.Member):
+        if not self.is_staff(ctx.author):
+            return await ctx.send(
+                embed=luxury_embed(
+                    title="❌ Access Denied",
+                    description="Only staff members may view staff notes.",
+                    color=COLOR_DANGER
+                )
+            )
+
+        notes = cases.for_target(ctx.guild.id, user.id, kind="note")
+        if not notes:
+            return await ctx.send(
+                embed=luxury_embed(
+                    title="📝 Staff Notes",
+                    description="No internal notes recorded for this user.",
+                    color=COLOR_SECONDARY
+                )
+            )
+
+        desc = "\n".join(
+            f"• `#{n['case_no']}` <@{n['moderator_id']}> — {n['reason']} "
+            f"(`{datetime.utcfromtimestamp(n['created_at']).strftime('%Y-%m-%d %H:%M')}`)"
+            for n in reversed(notes)
+        )
+
+        await ctx.send(
+            embed=luxury_embed(
+                title=f"🧠 Staff Notes — {user}",
+                description=desc,
+                color=COLOR_GOLD
+            )
+        )
+
+    # =====================================
+    # STAFF SNAPSHOT
+    # =====================================
+
+    @commands.command(name="staff")
+    @commands.guild_only()
+    async def staff_snapshot(self, ctx: commands.Context):
+        # O(staff): iterate the staff index and join stats by ID, so staff
+        # without recorded actions still show up with zeroes
+        staff = staffindex.members(ctx.guild)
+
+        if not staff:
+            return await ctx.send(
+                embed=luxury_embed(
+                    title="👥 Staff Activity Snapshot",
+                    description="No staff members found.",
+                    color=COLOR_SECONDARY
+                )
+            )
+
+        stats = staffstats.summary_for(ctx.guild.id, staff)
+        idle = {"actions": 0, "today": 0, "last_at": None}
+        ranked = sorted(
+            staff,
+            key=lambda sid: (stats.get(sid, idle)["today"], stats.get(sid, idle)["actions"]),
+            reverse=True
+        )
+
+        lines = []
+        for staff_id in ranked[:SNAPSHOT_LIMIT]:
+            row = stats.get(staff_id, idle)
+            last = f"last <t:{row['last_at']}:R>" if row["last_at"] else "no actions yet"
+            lines.append(
+                f"• <@{staff_id}> — "
+                f"{row['today']} actions today | "
+                f"{row['actions']} total | "
+                f"{last}"
+            )
+        if len(ranked) > SNAPSHOT_LIMIT:
+            lines.append(f"…and **{len(ranked) - SNAPSHOT_LIMIT}** more")
+
+        tiers = " • ".join(f"{name}: `{len(ids)}`" for name, ids in staffindex.by_tier(ctx.guild).items())
+        lines.append(f"\n**Team:** {tiers}")
+
+        await ctx.send(
+            embed=luxury_embed(
+                title="👥 Staff Activity Snapshot",
+                description="\n".join(lines),
+                color=COLOR_GOLD
+            )
+        )
+
+    # =====================================
+    # BURNOUT & ABUSE MONITOR
+    # =====================================
+
+    @commands.Cog.listener()
+    async def on_staff_action(self, guild_id: int, staff_id: int, action: str, at: int):
+        """Dispatched by utils.staffstats for every recorded action (O(1))."""
+        key = (guild_id, staff_id)
+        burst = self.burst.hit(key, now=at)
+        workload = self.workload.hit(key, now=at)
+
+        # 🔹 Abuse-pattern alert (fires on crossing, cooldown protected)
+        if burst >= BURST_THRESHOLD and self._cooled(self._abuse_alert_cache, key, at, ABUSE_ALERT_COOLDOWN):
+            guild = self.bot.get_guild(guild_id)
+            if guild and guild.owner:
+                dm.fire(
+                    guild.owner,
+                    Priority.LOG,
+                    embed=luxury_embed(
+                        title="⚠️ Staff Action Alert",
+                        description=(
+                            f"<@{staff_id}> has performed **{burst}** moderation "
+                            f"actions in the last {BURST_WINDOW // 60} minutes.\n\n"
+                            "This is a **safety signal**, "
+                            "not an accusation."
+                        ),
+                        color=COLOR_DANGER
+                    )
+                )
+
+        # 🔹 Burnout reminder
+        if workload >= WORKLOAD_THRESHOLD and self._cooled(self._burnout_cache, key, at, BURNOUT_REMINDER_COOLDOWN):
+            dm.fire(
+                staff_id,
+                embed=luxury_embed(
+                    title="🧠 Staff Wellness Reminder",
+                    description=(
+                        "You’ve been highly active today.\n\n"
+                        "Please consider taking a short break "
+                        "to avoid burnout."
+                    ),
+                    color=COLOR_SECONDARY
+                )
+            )
+
+    def _cooled(self, cache: dict, key: tuple, now: float, cooldown: int) -> bool:
+        """True (and arms the cooldown) if `key` has not alerted within `cooldown`."""
+        last = cache.get(key)
+        if last and now - last < cooldown:
+            return False
+        cache[key] = now
+        return True
+
+    # =====================================
+    # STATS WRITE-BEHIND
+    # =====================================
+
+    @tasks.loop(seconds=15)
+    async def flush_stats(self):
+        # An exception would stop the loop for good → errors are logged instead
+        staffstats.try_flush()
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Staff(bot))
@@ -1,11 +1,12 @@
 import discord
 from discord.ext import commands, tasks
 from discord import ui
-import asyncio
 import time
 import platform
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
+from typing import Optional
 
 # =====================================================
 # SYSTEM DEPENDENCIES & SAFETY
@@ -19,10 +20,43 @@ except ImportError:
 from utils.embeds import luxury_embed
 from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
 from utils.permissions import require_level
+from utils.warnstore import warnstore
+from utils.staffstats import staffstats
+from utils.outbound import outbound, Priority
+from utils.logsink import logsink
+from utils.msgindex import msgindex, BULK_LIMIT, BULK_MAX_AGE
+from utils.dm import dm
 from utils import state
 
 BOT_PREFIX = "&"
 
+# =====================================================
+# PURGE FILTERS
+# =====================================================
+
+PURGE_MAX = 5000              # messages deleted per command
+PURGE_SCAN_MAX = 20000        # history scanned when filters are set
+PURGE_PROGRESS_EVERY = 3.0    # seconds between progress edits
+
+
+def duration(text: str) -> int:
+    """'30m' / '6h' / '2d' → seconds"""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    text = text.strip().lower()
+    if text[-1:] in units and text[:-1].isdigit():
+        return int(text[:-1]) * units[text[-1]]
+    raise commands.BadArgument("Durations look like 30m / 6h / 2d.")
+
+
+class PurgeFlags(commands.FlagConverter, prefix="--", delimiter=" "):
+    user: Optional[discord.User] = None
+    match: Optional[str] = None          # regex, case-insensitive
+    attachments: bool = False            # only messages with files
+    bots: bool = False                   # only bot messages
+    since: Optional[duration] = None     # newer than this long ago
+    until: Optional[duration] = None     # older than this long ago
+
+
 # =====================================================
 # INTERACTIVE HELP UI COMPONENTS
 # =====================================================
@@ -177,7 +211,7 @@ class System(commands.Cog):
     async def whois(self, ctx: commands.Context, member: discord.Member = None):
         """Deep analytics & reputation risk assessment"""
         member = member or ctx.author
-        warn_data = getattr(state, "WARN_DATA", {}).get(member.id, 0)
+        warn_data = warnstore.active_count(ctx.guild.id, member.id)
         
         # Risk Meter Calculation
         if warn_data == 0: risk_status = "🟢 Safe (Clean)"
@@ -190,7 +224,7 @@ class System(commands.Cog):
             f"👤 **Member:** {member.mention}\n"
             f"🆔 **ID:** `{member.id}`\n\n"
             f"🧠 **System Risk:** {risk_status}\n"
-            f"🛡️ **Total Warns:** `{warn_data}`\n\n"
+            f"🛡️ **Active Warns:** `{warn_data}`\n\n"
             f"📅 **Created:** <t:{int(member.created_at.timestamp())}:D>\n"
             f"📅 **Joined:** <t:{int(member.joined_at.timestamp())}:R>\n\n"
             f"🎭 **Roles:** {', '.join(roles[:5])}{'...' if len(roles) > 5 else ''}"
@@ -230,6 +264,38 @@ class System(commands.Cog):
         )
         await ctx.send(embed=embed)
 
+    @commands.command(name="outbound", aliases=["queue"])
+    @require_level(4)
+    async def outbound_stats(self, ctx: commands.Context):
+        """Outbound REST scheduler: queue depth, wait times, shedding"""
+        st = outbound.stats()
+        ls = logsink.stats()
+        mi = msgindex.stats()
+        ds = dm.stats()
+        lines = "\n".join(
+            f"`{name:<8}` depth **{st['depth'][name]}** • avg `{st['wait_ms'][name]:.0f}ms` • max `{st['max_wait_ms'][name]:.0f}ms`"
+            for name in st["depth"]
+        )
+        embed = luxury_embed(
+            title="📮 Outbound Scheduler",
+            description=(
+                f"{lines}\n\n"
+                f"**Submitted:** `{st['submitted']}` • **Executed:** `{st['executed']}` • **Failed:** `{st['failed']}`\n"
+                f"**Coalesced:** `{st['coalesced']}` • **Shed:** `{st['shed']}` • **429s:** `{st['rate_limited']}`\n"
+                f"**Tracked Buckets:** `{st['buckets']}`\n\n"
+                f"📜 **Log Sink:** `{ls['embeds']}` embeds in `{ls['messages']}` messages "
+                f"(`{ls['saved']}` sends saved, `{ls['bypassed']}` bypassed, `{ls['buffered']}` buffered)\n"
+                f"🪝 **Webhooks:** `{ls['webhooks']}` • **Off Bot Buckets:** `{ls['webhook_sends']}` • "
+                f"**Via Bot:** `{ls['bot_sends']}` • **Fallbacks:** `{ls['fallbacks']}`\n"
+                f"🧹 **Message Index:** `{mi['ids']}` IDs / `{mi['users']}` users • "
+                f"`{mi['deleted']}` deleted in `{mi['bulk_calls']}` bulk + `{mi['single_calls']}` single calls\n"
+                f"✉️ **DMs:** `{ds['sent']}` sent • `{ds['opened']}` channels opened (`{ds['channels']}` known) • "
+                f"`{ds['forbidden']}` closed • `{ds['skipped']}` skipped (`{ds['closed']}` cached closed)"
+            ),
+            color=COLOR_SECONDARY
+        )
+        await ctx.send(embed=embed)
+
     # ================= UTILITIES (AVATAR, PING, PURGE) =================
 
     @commands.command(name="avatar", aliases=["av", "pfp"])
@@ -252,14 +318,90 @@ class System(commands.Cog):
 
     @commands.command(name="purge")
     @require_level(3)
-    async def purge(self, ctx: commands.Context, amount: int):
-        """Sanitize channel messages"""
-        if amount > 100: amount = 100
+    async def purge(self, ctx: commands.Context, amount: int, *, flags: PurgeFlags = None):
+        """
+        Sanitize channel messages
+        &purge 500 --user @x --match "free nitro" --attachments yes --bots yes --since 2h --until 10m
+        """
+        amount = max(1, min(amount, PURGE_MAX))
+        filtered = flags is not None and any(
+            (flags.user, flags.match, flags.attachments, flags.bots, flags.since, flags.until)
+        )
+        flags = flags or PurgeFlags()
+
+        try:
+            pattern = re.compile(flags.match, re.IGNORECASE) if flags.match else None
+        except re.error:
+            return await ctx.send(embed=luxury_embed("❌ Invalid Regex", f"`{flags.match}` is not a valid pattern.", COLOR_DANGER))
+
+        def wanted(message: discord.Message) -> bool:
+            if flags.user and message.author.id != flags.user.id:
+                return False
+            if flags.bots and not message.author.bot:
+                return False
+            if flags.attachments and not message.attachments:
+                return False
+            if pattern and not pattern.search(message.content):
+                return False
+            return True
+
+        now = discord.utils.utcnow()
+        # The command itself is the upper bound, so the progress message is never scanned
+        before = ctx.message
+        if flags.until:
+            before = now - timedelta(seconds=flags.until)
+        after = now - timedelta(seconds=flags.since) if flags.since else None
+
         await ctx.message.delete()
-        deleted = await ctx.channel.purge(limit=amount)
-        msg = await ctx.send(f"🧹 Removed **{len(deleted)}** messages.")
-        await asyncio.sleep(4)
-        await msg.delete()
+        status = await ctx.send(embed=luxury_embed("🧹 Purging", "Scanning history...", COLOR_SECONDARY))
+
+        start = time.perf_counter()
+        scanned = deleted = failed = 0
+        last_progress = time.monotonic()
+        batch = []
+
+        async def flush():
+            nonlocal deleted, failed, batch, last_progress
+            if not batch:
+                return
+            ok, bad = await msgindex.delete_ids(ctx.channel, batch)
+            deleted += ok
+            failed += bad
+            batch = []
+
+            if time.monotonic() - last_progress >= PURGE_PROGRESS_EVERY:
+                last_progress = time.monotonic()
+                embed = luxury_embed("🧹 Purging", f"Deleted **{deleted}** • scanned `{scanned}` • failed `{failed}`", COLOR_SECONDARY)
+                outbound.fire(Priority.COSMETIC, lambda: status.edit(embed=embed), ("channel", ctx.channel.id), coalesce=("purge", status.id))
+
+        # Lazy: history is fetched 100 at a time, only as far as needed
+        scan_limit = PURGE_SCAN_MAX if filtered else amount
+        bulk_cutoff = now - timedelta(seconds=BULK_MAX_AGE)
+        async for message in ctx.channel.history(limit=scan_limit, before=before, after=after, oldest_first=False):
+            scanned += 1
+            if not wanted(message):
+                continue
+
+            batch.append(message.id)
+            # Past 14 days every delete is a single call → report progress more often
+            size = BULK_LIMIT if message.created_at >= bulk_cutoff else 10
+            if len(batch) >= size:
+                await flush()
+            if deleted + failed + len(batch) >= amount:
+                break
+        await flush()
+
+        elapsed = time.perf_counter() - start
+        staffstats.record(ctx.guild.id, ctx.author.id, "purge", ctx.channel.id, f"{deleted} messages")
+
+        desc = f"🧹 Removed **{deleted}** messages (scanned `{scanned}`) in `{elapsed:.1f}s`."
+        if failed:
+            desc += f"\n❌ {failed} could not be deleted."
+        # A queued progress edit must not land on top of (or after the deletion
+        # of) the final message → drop it, then send the final edit ahead of cosmetics
+        outbound.drop(("purge", status.id))
+        final = luxury_embed("🧹 Purge Complete", desc, COLOR_GOLD)
+        await outbound.run(Priority.LOG, lambda: status.edit(embed=final, delete_after=8), ("channel", ctx.channel.id))
 
     # ================= PANIC PROTOCOLS =================
 
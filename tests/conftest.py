@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# utils.database opens `hellfire.db` relative to the working directory on
+# import → keep test runs from touching a real database
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(tempfile.mkdtemp(prefix="hellfire-tests-"))
@@ -0,0 +1,19 @@
+import pytest
+
+from utils.escalation import MAX_TIMEOUT, parse_action
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("ban", "BAN"),
+    ("1m", 60),
+    ("6h", 21600),
+    ("28d", MAX_TIMEOUT),
+])
+def test_parse_action_accepts_valid_steps(text, expected):
+    assert parse_action(text) == expected
+
+
+@pytest.mark.parametrize("text", ["0m", "29d", "50000m", "soon"])
+def test_parse_action_rejects_out_of_range_or_unknown(text):
+    with pytest.raises(ValueError):
+        parse_action(text)
@@ -0,0 +1,36 @@
+import pytest
+
+from utils.rules import DEFAULT_RULES, adaptive_threshold, validate_rule
+
+
+def rule(**fields):
+    return dict({"id": "custom", "when": [{"feature": "length", "op": ">", "value": 5}]}, **fields)
+
+
+def test_default_rules_are_valid():
+    assert all(validate_rule(raw) is None for raw in DEFAULT_RULES)
+
+
+@pytest.mark.parametrize("raw", [
+    rule(when=[{"feature": "length", "op": ">", "value": "5"}]),
+    rule(when=[{"feature": "invite", "op": "==", "value": 1}]),
+    rule(when=[{"feature": "burst", "op": ">=", "value": 5, "panic": "3"}]),
+    rule(when=["length"]),
+    rule(minutes="abc"),
+    rule(minutes=0),
+    rule(priority=1.5),
+    rule(channels=5),
+    rule(exempt_roles=[1, "2"]),
+])
+def test_malformed_rules_are_rejected(raw):
+    assert validate_rule(raw) is not None
+
+
+@pytest.mark.parametrize("base, scale, expected", [
+    (3, 0.6, 3),        # panic limit never drops below the floor
+    (6, 0.5, 3),
+    (6, 2.0, 12),       # busy channels still loosen
+    (2, 0.6, 2),        # a stricter-than-floor base is left alone
+])
+def test_adaptive_threshold_is_floored(base, scale, expected):
+    assert adaptive_threshold(base, scale) == expected
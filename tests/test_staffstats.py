@@ -0,0 +1,46 @@
+import sqlite3
+
+import pytest
+
+import utils.staffstats as staffstats_module
+from utils.database import Database
+from utils.staffstats import StaffStats
+
+
+@pytest.fixture
+def stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(staffstats_module, "db", Database(str(tmp_path / "staff.db")))
+    return StaffStats(batch_size=1000)
+
+
+def test_failed_flush_keeps_the_batch(stats):
+    stats.record(1, 10, "warn", 5)
+    stats.record(1, 10, "kick", 5)
+
+    def broken(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    stats._write = broken
+    with pytest.raises(sqlite3.OperationalError):
+        stats.flush()
+    del stats._write
+
+    stats.record(1, 10, "mute", 5)
+    totals = stats.totals(1, 10)
+    assert totals["actions"] == 3
+    assert totals["warns"] == 1
+
+
+def test_record_survives_a_failing_flush(stats):
+    def broken(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    stats.batch_size = 2
+    stats._write = broken
+    stats.record(1, 10, "ban", 5)
+    stats.record(1, 10, "kick", 5)     # fills the batch → flush fails quietly
+    assert not stats.try_flush()
+    del stats._write
+
+    assert stats.try_flush()
+    assert stats.totals(1, 10)["actions"] == 2
@@ -0,0 +1,28 @@
+import pytest
+
+import utils.warnstore as warnstore_module
+from utils.database import Database
+from utils.warnstore import WarnStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(warnstore_module, "db", Database(str(tmp_path / "warns.db")))
+    return WarnStore(expiry_days=30)
+
+
+def test_first_warn_on_cold_cache_counts_once(store):
+    _, active = store.add(1, 42, 7, "spam")
+    assert active == 1
+    assert store.active_count(1, 42) == 1
+
+
+def test_warn_after_restart_counts_existing_rows_once(store):
+    store.add(1, 42, 7, "spam")
+    store.add(1, 42, 7, "spam again")
+
+    # A fresh store has an empty cache, as after a restart
+    restarted = WarnStore(expiry_days=30)
+    _, active = restarted.add(1, 42, 7, "third")
+    assert active == 3
+    assert restarted.active_count(1, 42) == 3
@@ -0,0 +1,106 @@
+import math
+import time
+import zlib
+from typing import Dict, Optional
+
+
+# =====================================================
+# 🔱 HELLFIRE CHANNEL TRAFFIC BASELINES
+# • EWMA of message rate & unique authors per channel
+# • O(1) memory per channel (a few floats + one 64-bit bitmap)
+# • Drives adaptive automod thresholds from *distinct-author* activity:
+#   one user's volume can never loosen that user's own limits
+# =====================================================
+
+TICK_SECONDS = 10.0       # same horizon as the automod analysis window
+ALPHA = 0.3               # EWMA weight of the newest tick
+BITMAP_BITS = 64          # linear-counting sketch for unique authors
+
+REFERENCE_AUTHORS = 3.0      # unique authors / tick considered "normal"
+MIN_SCALE = 0.8              # quiet channels → (a little) stricter
+MAX_SCALE = 2.5              # hype channels → more lenient
+
+
+def _estimate_unique(bitmap: int) -> float:
+    """Linear counting: n ≈ -m · ln(zero_bits / m)."""
+    zeros = BITMAP_BITS - bin(bitmap).count("1")
+    if zeros == 0:
+        return float(BITMAP_BITS)  # saturated — good enough for a baseline
+    return -BITMAP_BITS * math.log(zeros / BITMAP_BITS)
+
+
+class ChannelBaseline:
+    __slots__ = ("tick_start", "tick_msgs", "tick_authors", "rate", "authors", "ticks")
+
+    def __init__(self, now: float):
+        self.tick_start = now
+        self.tick_msgs = 0
+        self.tick_authors = 0    # bitmap of hashed author IDs
+        self.rate = 0.0          # EWMA msgs per tick
+        self.authors = 0.0       # EWMA unique authors per tick
+        self.ticks = 0           # completed ticks folded in
+
+    def observe(self, author_id: int, now: float):
+        self._roll(now)
+        self.tick_msgs += 1
+        self.tick_authors |= 1 << (zlib.crc32(author_id.to_bytes(8, "little")) % BITMAP_BITS)
+
+    def _roll(self, now: float):
+        elapsed = int((now - self.tick_start) // TICK_SECONDS)
+        if elapsed <= 0:
+            return
+
+        # Fold the finished tick, then decay for any fully idle ticks after it
+        self.rate += ALPHA * (self.tick_msgs - self.rate)
+        self.authors += ALPHA * (_estimate_unique(self.tick_authors) - self.authors)
+
+        idle = min(elapsed - 1, 64)
+        if idle:
+            decay = (1 - ALPHA) ** idle
+            self.rate *= decay
+            self.authors *= decay
+
+        self.ticks += elapsed
+        self.tick_start += elapsed * TICK_SECONDS
+        self.tick_msgs = 0
+        self.tick_authors = 0
+
+    @property
+    def per_author(self) -> float:
+        return self.rate / self.authors if self.authors >= 0.5 else 0.0
+
+    def scale(self) -> float:
+        """Threshold multiplier for per-user burst limits in this channel."""
+        if self.ticks < 3:
+            return 1.0  # not enough history yet
+        # A lone author (however loud) is ~1 unique author → stricter, never looser
+        return max(MIN_SCALE, min(MAX_SCALE, self.authors / REFERENCE_AUTHORS))
+
+
+class BaselineTracker:
+    def __init__(self):
+        self._channels: Dict[int, ChannelBaseline] = {}
+
+    def observe(self, channel_id: int, author_id: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        baseline = self._channels.get(channel_id)
+        if baseline is None:
+            baseline = self._channels[channel_id] = ChannelBaseline(now)
+        baseline.observe(author_id, now)
+
+    def scale(self, channel_id: int) -> float:
+        baseline = self._channels.get(channel_id)
+        if not baseline:
+            return 1.0
+        # Fold idle ticks first → a channel that went quiet loses its old multiplier
+        baseline._roll(time.time())
+        return baseline.scale()
+
+    def get(self, channel_id: int) -> Optional[ChannelBaseline]:
+        baseline = self._channels.get(channel_id)
+        if baseline:
+            baseline._roll(time.time())
+        return baseline
+
+
+baselines = BaselineTracker()
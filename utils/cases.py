@@ -0,0 +1,189 @@
+import re
+import time
+from typing import List, Optional, Tuple
+
+from utils.database import db
+
+
+# =====================================================
+# 🔱 HELLFIRE MODERATION CASES
+# • Every warn / timeout / kick / ban / note becomes a numbered case
+# • Case numbers are per guild (UNIQUE(guild_id, case_no) → O(log n) MAX)
+# • Reasons indexed by an external-content FTS5 table (bm25 ranking)
+# • Search pages by keyset (rank, id) — no OFFSET scans
+# • Very common terms fall back to newest-first (no full bm25 sort)
+# =====================================================
+
+PAGE_SIZE = 5
+RANK_CAP = 5000            # above this many matches, rank by recency instead
+TOKEN_REGEX = re.compile(r"[\w']+\*?")
+
+
+def fts_query(terms: str) -> Optional[str]:
+    """
+    Turns free text into a safe FTS5 query: every word is quoted (so
+    operators / punctuation can't break the syntax), words are ANDed,
+    and a trailing * keeps prefix matching ("spam*").
+    """
+    tokens = []
+    for tok in TOKEN_REGEX.findall(terms):
+        prefix = tok.endswith("*")
+        word = tok.rstrip("*").replace('"', "")
+        if word:
+            tokens.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(tokens) or None
+
+
+class CaseStore:
+    # =================================================
+    # WRITE
+    # =================================================
+
+    def open(self, guild_id: int, kind: str, target_id: Optional[int], moderator_id: Optional[int], reason: str) -> int:
+        """Records a case and returns its per-guild number."""
+        with db.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO mod_cases (guild_id, case_no, kind, target_id, moderator_id, reason, created_at)
+                SELECT ?, COALESCE(MAX(case_no), 0) + 1, ?, ?, ?, ?, ?
+                FROM mod_cases WHERE guild_id = ?
+                """,
+                (guild_id, kind, target_id, moderator_id, reason, int(time.time()), guild_id)
+            )
+            cur.execute("SELECT case_no FROM mod_cases WHERE id = ?", (cur.lastrowid,))
+            return cur.fetchone()["case_no"]
+
+    def set_reason(self, guild_id: int, case_no: int, reason: str) -> bool:
+        cur = db.execute(
+            "UPDATE mod_cases SET reason = ? WHERE guild_id = ? AND case_no = ?",
+            (reason, guild_id, case_no)
+        )
+        return cur.rowcount > 0
+
+    # =================================================
+    # READ
+    # =================================================
+
+    def get(self, guild_id: int, case_no: int):
+        return db.fetchone(
+            "SELECT * FROM mod_cases WHERE guild_id = ? AND case_no = ?",
+            (guild_id, case_no)
+        )
+
+    def for_target(self, guild_id: int, target_id: int, kind: Optional[str] = None, limit: int = 5):
+        if kind:
+            return db.fetchall(
+                """
+                SELECT * FROM mod_cases WHERE guild_id = ? AND target_id = ? AND kind = ?
+                ORDER BY id DESC LIMIT ?
+                """,
+                (guild_id, target_id, kind, limit)
+            )
+        return db.fetchall(
+            "SELECT * FROM mod_cases WHERE guild_id = ? AND target_id = ? ORDER BY id DESC LIMIT ?",
+            (guild_id, target_id, limit)
+        )
+
+    def search(
+        self,
+        guild_id: int,
+        terms: str,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = PAGE_SIZE
+    ) -> List:
+        """
+        Best matches first. `after` is the (score, id) of the last row of the
+        previous page; rows carry a `score` column to build the next cursor.
+
+        bm25 has to score every match before it can sort, so terms matching
+        more than RANK_CAP cases (e.g. "spam") are served newest-first
+        instead — native rowid order, constant cost per page.
+        """
+        query = fts_query(terms)
+        if not query:
+            return []
+
+        if not db.fts5:
+            return self._search_like(guild_id, terms, after, limit)
+
+        if self._too_common(query):
+            return self._search_recent(guild_id, query, after, limit)
+
+        if after is None:
+            return db.fetchall(
+                """
+                SELECT c.*, f.rank AS score
+                FROM mod_cases_fts f JOIN mod_cases c ON c.id = f.rowid
+                WHERE mod_cases_fts MATCH ? AND c.guild_id = ?
+                ORDER BY f.rank, c.id LIMIT ?
+                """,
+                (query, guild_id, limit)
+            )
+
+        score, last_id = after
+        return db.fetchall(
+            """
+            SELECT c.*, f.rank AS score
+            FROM mod_cases_fts f JOIN mod_cases c ON c.id = f.rowid
+            WHERE mod_cases_fts MATCH ? AND c.guild_id = ?
+            AND (f.rank > ? OR (f.rank = ? AND c.id > ?))
+            ORDER BY f.rank, c.id LIMIT ?
+            """,
+            (query, guild_id, score, score, last_id, limit)
+        )
+
+    def _too_common(self, query: str) -> bool:
+        row = db.fetchone(
+            "SELECT COUNT(*) AS c FROM (SELECT rowid FROM mod_cases_fts WHERE mod_cases_fts MATCH ? LIMIT ?)",
+            (query, RANK_CAP + 1)
+        )
+        return row["c"] > RANK_CAP
+
+    def _search_recent(self, guild_id: int, query: str, after, limit: int):
+        last_id = after[1] if after else None
+        if last_id is None:
+            return db.fetchall(
+                """
+                SELECT c.*, 0 AS score
+                FROM mod_cases_fts f JOIN mod_cases c ON c.id = f.rowid
+                WHERE mod_cases_fts MATCH ? AND c.guild_id = ?
+                ORDER BY f.rowid DESC LIMIT ?
+                """,
+                (query, guild_id, limit)
+            )
+        return db.fetchall(
+            """
+            SELECT c.*, 0 AS score
+            FROM mod_cases_fts f JOIN mod_cases c ON c.id = f.rowid
+            WHERE mod_cases_fts MATCH ? AND c.guild_id = ? AND f.rowid < ?
+            ORDER BY f.rowid DESC LIMIT ?
+            """,
+            (query, guild_id, last_id, limit)
+        )
+
+    def _search_like(self, guild_id: int, terms: str, after, limit: int):
+        """Fallback for SQLite builds without FTS5 (newest first, unranked)."""
+        words = [w.rstrip("*") for w in TOKEN_REGEX.findall(terms)]
+        clause = " AND ".join("reason LIKE ?" for _ in words)
+        params = [f"%{w}%" for w in words]
+
+        cursor = ""
+        if after is not None:
+            cursor = "AND id < ?"
+            params.append(after[1])
+
+        return db.fetchall(
+            f"""
+            SELECT *, 0 AS score FROM mod_cases
+            WHERE guild_id = ? AND {clause} {cursor}
+            ORDER BY id DESC LIMIT ?
+            """,
+            (guild_id, *params, limit)
+        )
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+cases = CaseStore()
@@ -70,7 +70,24 @@ class Database:
                 guild_id INTEGER NOT NULL,
                 moderator_id INTEGER NOT NULL,
                 reason TEXT,
-                created_at INTEGER
+                created_at INTEGER,
+                expires_at INTEGER
+            )
+            """)
+            self._ensure_column("warnings", "expires_at", "INTEGER")
+
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_warnings_guild_user
+            ON warnings (guild_id, user_id)
+            """)
+
+            # ---------------- ESCALATION LADDERS (PER GUILD) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS escalation_ladders (
+                guild_id INTEGER NOT NULL,
+                points INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                PRIMARY KEY (guild_id, points)
             )
             """)
 
@@ -87,6 +104,29 @@ class Database:
             )
             """)
 
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_staff_actions_guild_staff
+            ON staff_actions (guild_id, staff_id, created_at)
+            """)
+
+            # ---------------- STAFF DAILY ROLLUP ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS staff_daily (
+                guild_id INTEGER NOT NULL,
+                staff_id INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                actions INTEGER DEFAULT 0,
+                warns INTEGER DEFAULT 0,
+                last_at INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, staff_id, day)
+            )
+            """)
+
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_staff_daily_day
+            ON staff_daily (guild_id, day)
+            """)
+
             # ---------------- SUPPORT TICKETS ----------------
             self.conn.execute("""
             CREATE TABLE IF NOT EXISTS support_tickets (
@@ -99,6 +139,160 @@ class Database:
             )
             """)
 
+            # ---------------- AUTOMOD RULES (PER GUILD) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS automod_rules (
+                guild_id INTEGER NOT NULL,
+                rule_id TEXT NOT NULL,
+                body TEXT NOT NULL,
+                updated_at INTEGER,
+                PRIMARY KEY (guild_id, rule_id)
+            )
+            """)
+
+            # ---------------- AUTOMOD STRIKES (DECAY ON READ) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS automod_strikes (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                strikes INTEGER DEFAULT 0,
+                updated_at INTEGER,
+                PRIMARY KEY (guild_id, user_id)
+            )
+            """)
+
+            # ---------------- MODERATION CASES (+ FTS5 SEARCH) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS mod_cases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                case_no INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                target_id INTEGER,
+                moderator_id INTEGER,
+                reason TEXT,
+                created_at INTEGER,
+                UNIQUE (guild_id, case_no)
+            )
+            """)
+
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_mod_cases_target
+            ON mod_cases (guild_id, target_id)
+            """)
+
+            self._setup_case_search()
+
+            # ---------------- LOG WEBHOOKS (ONE PER LOG CHANNEL) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS log_webhooks (
+                channel_id INTEGER PRIMARY KEY,
+                webhook_id INTEGER NOT NULL,
+                token TEXT NOT NULL
+            )
+            """)
+
+            # ---------------- DM CHANNELS (NO RE-OPEN PER SEND) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dm_channels (
+                user_id INTEGER PRIMARY KEY,
+                channel_id INTEGER NOT NULL
+            )
+            """)
+
+            # ---------------- BULK JOBS (RESUMABLE) ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                title TEXT,
+                params TEXT,
+                status TEXT NOT NULL,
+                created_by INTEGER,
+                channel_id INTEGER,
+                message_id INTEGER,
+                cursor INTEGER DEFAULT 0,
+                total INTEGER DEFAULT 0,
+                done INTEGER DEFAULT 0,
+                failed INTEGER DEFAULT 0,
+                skipped INTEGER DEFAULT 0,
+                created_at INTEGER,
+                updated_at INTEGER
+            )
+            """)
+
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_guild_status
+            ON jobs (guild_id, status)
+            """)
+
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_targets (
+                job_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                target_id INTEGER NOT NULL,
+                status TEXT,
+                PRIMARY KEY (job_id, seq)
+            )
+            """)
+            self._ensure_column("job_targets", "status", "TEXT")
+
+            # ---------------- LOCKDOWN SNAPSHOTS ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS lockdowns (
+                guild_id INTEGER PRIMARY KEY,
+                mode TEXT NOT NULL,
+                role_perms INTEGER,
+                created_by INTEGER,
+                created_at INTEGER
+            )
+            """)
+
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS lockdown_overwrites (
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                existed INTEGER NOT NULL,
+                allow INTEGER DEFAULT 0,
+                deny INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, channel_id)
+            )
+            """)
+
+            # ---------------- ANTI-NUKE TRUSTED ACTORS ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS antinuke_trust (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                added_by INTEGER,
+                created_at INTEGER,
+                PRIMARY KEY (guild_id, user_id)
+            )
+            """)
+
+            # ---------------- SCHEDULES ----------------
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT,
+                run_at INTEGER NOT NULL,
+                interval INTEGER,
+                created_by INTEGER,
+                channel_id INTEGER,
+                status TEXT DEFAULT 'active',
+                runs INTEGER DEFAULT 0,
+                created_at INTEGER
+            )
+            """)
+
+            self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_schedules_status
+            ON schedules (status, run_at)
+            """)
+
             # ---------------- SERVER ECONOMY (FUTURE) ----------------
             self.conn.execute("""
             CREATE TABLE IF NOT EXISTS economy (
@@ -112,6 +306,34 @@ class Database:
 
             self.conn.commit()
 
+    def _setup_case_search(self):
+        """
+        External-content FTS5 index over case reasons, kept in sync by
+        triggers. Builds without FTS5 fall back to LIKE search.
+        """
+        try:
+            self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS mod_cases_fts
+            USING fts5(reason, kind, content='mod_cases', content_rowid='id')
+            """)
+        except sqlite3.OperationalError:
+            self.fts5 = False
+            return
+
+        self.fts5 = True
+        self.conn.executescript("""
+        CREATE TRIGGER IF NOT EXISTS mod_cases_ai AFTER INSERT ON mod_cases BEGIN
+            INSERT INTO mod_cases_fts (rowid, reason, kind) VALUES (new.id, new.reason, new.kind);
+        END;
+        CREATE TRIGGER IF NOT EXISTS mod_cases_ad AFTER DELETE ON mod_cases BEGIN
+            INSERT INTO mod_cases_fts (mod_cases_fts, rowid, reason, kind) VALUES ('delete', old.id, old.reason, old.kind);
+        END;
+        CREATE TRIGGER IF NOT EXISTS mod_cases_au AFTER UPDATE ON mod_cases BEGIN
+            INSERT INTO mod_cases_fts (mod_cases_fts, rowid, reason, kind) VALUES ('delete', old.id, old.reason, old.kind);
+            INSERT INTO mod_cases_fts (rowid, reason, kind) VALUES (new.id, new.reason, new.kind);
+        END;
+        """)
+
     # =================================================
     # SAFE CONTEXT MANAGER
     # =================================================
@@ -153,6 +375,12 @@ class Database:
         with self.lock:
             return self.conn.execute(query, params).fetchall()
 
+    def _ensure_column(self, table: str, column: str, decl: str):
+        """Additive migration for databases created before a column existed."""
+        cols = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        if column not in cols:
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
     # =================================================
     # HIGH-LEVEL HELPERS (PERFORMANCE)
     # =================================================
@@ -179,13 +407,14 @@ class Database:
             )
             self.conn.commit()
 
-    def add_warning(self, user_id: int, guild_id: int, moderator_id: int, reason: str):
+    def add_warning(self, user_id: int, guild_id: int, moderator_id: int, reason: str, expires_at: int = None) -> int:
         with self.lock:
-            self.conn.execute("""
-            INSERT INTO warnings (user_id, guild_id, moderator_id, reason, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """, (user_id, guild_id, moderator_id, reason, int(time.time())))
+            cur = self.conn.execute("""
+            INSERT INTO warnings (user_id, guild_id, moderator_id, reason, created_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """, (user_id, guild_id, moderator_id, reason, int(time.time()), expires_at))
             self.conn.commit()
+            return cur.lastrowid
 
     def log_staff_action(self, staff_id: int, guild_id: int, action: str, target_id: int = None, reason: str = None):
         with self.lock:
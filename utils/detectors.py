@@ -0,0 +1,150 @@
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+
+# =====================================================
+# 🔱 HELLFIRE DETECTOR EXECUTION LAYER
+# • Cheap checks stay inline on the event loop
+# • Expensive checks on long messages go to a process pool
+# • Hard per-message time budget; in-flight pool work is capped because
+#   a timed-out job keeps its worker busy until it finishes
+# NOTE: keep this module free of discord imports — it is
+# re-imported inside every worker process.
+# =====================================================
+
+ZALGO_REGEX = re.compile(r"[\u0300-\u036f\u0483-\u0489\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]")
+
+
+# =====================================================
+# DETECTORS (TOP-LEVEL → PICKLABLE)
+# =====================================================
+
+def detect_zalgo(text: str) -> bool:
+    return ZALGO_REGEX.search(text) is not None
+
+
+def shannon_entropy(text: str) -> float:
+    """Math-based detection for keyboard smashing/gibberish."""
+    if len(text) < 8:
+        return 3.0  # Ignore short messages
+    length = len(text)
+    return -sum((n / length) * math.log(n / length, 2) for n in Counter(text).values())
+
+
+EXPENSIVE_DETECTORS = {
+    "zalgo": detect_zalgo,
+    "entropy": shannon_entropy,
+}
+
+
+def run_detectors(text: str) -> Dict[str, object]:
+    """Runs every expensive detector in one go (one pool round-trip per message)."""
+    return {name: fn(text) for name, fn in EXPENSIVE_DETECTORS.items()}
+
+
+# =====================================================
+# RUNNER
+# =====================================================
+
+class DetectorRunner:
+    """
+    Decides where detectors execute and enforces the latency budget.
+
+    Messages up to `inline_max_len` characters are analysed inline (cost is
+    negligible); longer ones are shipped to a ProcessPoolExecutor. If the
+    pool does not answer within `budget_ms`, the message is treated as clean
+    for those detectors (fail-open). Cancelling only helps while the job is
+    still queued — a running one occupies its worker to the end — so at most
+    `max_pending` jobs are in flight; beyond that detection is skipped.
+    """
+
+    def __init__(self, inline_max_len: int = 300, budget_ms: float = 50, workers: int = 2, max_pending: Optional[int] = None):
+        self.inline_max_len = inline_max_len
+        self.budget = budget_ms / 1000
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Released from the pool's callback thread → guarded
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        # Instrumentation
+        self.inline_runs = 0
+        self.offloaded = 0
+        self.budget_exceeded = 0
+        self.errors = 0
+        self.saturated = 0
+        self._offload_ms_total = 0.0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def run(self, text: str) -> Optional[Dict[str, object]]:
+        if len(text) <= self.inline_max_len:
+            self.inline_runs += 1
+            return run_detectors(text)
+
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                self.saturated += 1
+                return None
+            self._pending += 1
+
+        self.offloaded += 1
+        start = time.perf_counter()
+
+        try:
+            future = self.pool.submit(run_detectors, text)
+        except RuntimeError:
+            # Pool broken or shut down — rebuild lazily next time
+            self._release()
+            self.errors += 1
+            self._pool = None
+            return None
+        future.add_done_callback(self._release)
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.budget)
+        except asyncio.TimeoutError:
+            future.cancel()
+            self.budget_exceeded += 1
+            return None
+        except Exception:
+            self.errors += 1
+            return None
+
+        self._offload_ms_total += (time.perf_counter() - start) * 1000
+        return result
+
+    def _release(self, _future=None):
+        with self._pending_lock:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, float]:
+        completed = self.offloaded - self.budget_exceeded - self.errors
+        return {
+            "inline": self.inline_runs,
+            "offloaded": self.offloaded,
+            "budget_exceeded": self.budget_exceeded,
+            "errors": self.errors,
+            "saturated": self.saturated,
+            "pending": self._pending,
+            "exceeded_pct": (self.budget_exceeded / self.offloaded * 100) if self.offloaded else 0.0,
+            "avg_offload_ms": (self._offload_ms_total / completed) if completed > 0 else 0.0,
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
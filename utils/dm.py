@@ -0,0 +1,165 @@
+import time
+from typing import Dict, Optional, Union
+
+import discord
+
+from utils.database import db
+from utils.outbound import outbound, Priority
+
+
+# =====================================================
+# 🔱 HELLFIRE DM DELIVERY
+# • One path for every direct message the bot sends
+# • DM channel IDs persisted → no "open DM" REST call per send
+# • Users with DMs closed are skipped for a while (TTL negative cache)
+# • All DMs share one outbound budget: ("dm", 0)
+# =====================================================
+
+CLOSED_TTL = 6 * 3600     # skip users with closed DMs this long
+ROUTE = ("dm", 0)         # shared bot-wide DM bucket
+
+UserLike = Union[discord.abc.User, discord.Object, int]
+
+
+def _uid(user: UserLike) -> int:
+    return user if isinstance(user, int) else user.id
+
+
+class DMService:
+    def __init__(self):
+        self.bot = None
+        self._channels: Dict[int, int] = {}     # user_id -> DM channel id
+        self._closed: Dict[int, float] = {}     # user_id -> retry after (unix)
+        self._loaded = False
+
+        # Instrumentation
+        self.sent = 0
+        self.opened = 0
+        self.forbidden = 0
+        self.skipped = 0
+
+    def bind(self, bot):
+        self.bot = bot
+
+    # =================================================
+    # NEGATIVE CACHE
+    # =================================================
+
+    def is_closed(self, user: UserLike) -> bool:
+        until = self._closed.get(_uid(user))
+        if until is None:
+            return False
+        if time.time() >= until:
+            del self._closed[_uid(user)]
+            return False
+        return True
+
+    # =================================================
+    # DM CHANNELS
+    # =================================================
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        for row in db.fetchall("SELECT user_id, channel_id FROM dm_channels"):
+            self._channels[row["user_id"]] = row["channel_id"]
+
+    def remember(self, user_id: int, channel_id: int):
+        """Records a DM channel seen elsewhere (e.g. the user messaged us)."""
+        self._load()
+        self._closed.pop(user_id, None)
+        if self._channels.get(user_id) != channel_id:
+            self._channels[user_id] = channel_id
+            db.execute(
+                "INSERT OR REPLACE INTO dm_channels (user_id, channel_id) VALUES (?, ?)",
+                (user_id, channel_id)
+            )
+
+    def cached(self, user: UserLike) -> Optional[discord.PartialMessageable]:
+        """The user's DM channel if already known, without any REST call."""
+        self._load()
+        channel_id = self._channels.get(_uid(user))
+        if channel_id is None or self.bot is None:
+            return None
+        return self.bot.get_partial_messageable(channel_id, type=discord.ChannelType.private)
+
+    async def _channel(self, user_id: int) -> discord.PartialMessageable:
+        channel = self.cached(user_id)
+        if channel is not None:
+            return channel
+
+        data = await self.bot.http.start_private_message(user_id)
+        self.opened += 1
+        self.remember(user_id, int(data["id"]))
+        return self.cached(user_id)
+
+    def _forget(self, user_id: int):
+        self._channels.pop(user_id, None)
+        db.execute("DELETE FROM dm_channels WHERE user_id = ?", (user_id,))
+
+    # =================================================
+    # DELIVERY
+    # =================================================
+
+    async def _deliver(self, user_id: int, kwargs: dict) -> discord.Message:
+        try:
+            channel = await self._channel(user_id)
+            try:
+                message = await channel.send(**kwargs)
+            except discord.NotFound:
+                # Stale channel id → open a fresh one once
+                self._forget(user_id)
+                channel = await self._channel(user_id)
+                message = await channel.send(**kwargs)
+        except discord.Forbidden:
+            self.forbidden += 1
+            self._closed[user_id] = time.time() + CLOSED_TTL
+            raise
+
+        self.sent += 1
+        return message
+
+    async def send(self, user: UserLike, priority: Priority = Priority.DM, **kwargs) -> Optional[discord.Message]:
+        """
+        Sends a DM and waits for it. Returns the message, or None if the
+        user's DMs are closed / the send failed.
+        """
+        user_id = _uid(user)
+        if self.is_closed(user_id):
+            self.skipped += 1
+            return None
+        try:
+            return await outbound.run(priority, lambda: self._deliver(user_id, kwargs), ROUTE)
+        except discord.HTTPException:
+            return None
+
+    def fire(self, user: UserLike, priority: Priority = Priority.DM, **kwargs):
+        """send() without waiting; failures are swallowed."""
+        user_id = _uid(user)
+        if self.is_closed(user_id):
+            self.skipped += 1
+            return
+        outbound.fire(priority, lambda: self._deliver(user_id, kwargs), ROUTE)
+
+    # =================================================
+    # INTROSPECTION
+    # =================================================
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {
+            "sent": self.sent,
+            "opened": self.opened,
+            "forbidden": self.forbidden,
+            "skipped": self.skipped,
+            "channels": len(self._channels),
+            "closed": sum(1 for until in self._closed.values() if until > now),
+        }
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+dm = DMService()
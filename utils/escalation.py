@@ -0,0 +1,135 @@
+from typing import Dict, List, Tuple, Union
+
+from utils.database import db
+from utils.config import ESCALATION_LADDER
+from utils.strikes import strikes
+from utils.warnstore import warnstore
+
+
+# =====================================================
+# 🔱 HELLFIRE SHARED ESCALATION ENGINE
+# • One ladder per guild for manual warns AND automod strikes
+# • Score = active (unexpired) warnings + (decayed) automod strikes
+# • Ladder precomputed into a dense table → O(1) lookup
+# =====================================================
+
+Action = Union[str, int]   # "WARN" | "KICK" | "BAN" | timeout seconds
+
+MIN_TIMEOUT = 60               # 0 would *clear* an existing timeout
+MAX_TIMEOUT = 28 * 86400       # Discord rejects longer timeouts (HTTP 400)
+
+
+def describe(action: Action) -> str:
+    if isinstance(action, int):
+        if action >= 86400 and action % 86400 == 0:
+            return f"Timeout {action // 86400}d"
+        if action >= 3600 and action % 3600 == 0:
+            return f"Timeout {action // 3600}h"
+        return f"Timeout {action // 60}m"
+    return action.title()
+
+
+def parse_action(text: str) -> Action:
+    """'warn' / 'kick' / 'ban' / '10m' / '6h' / '7d' → Action"""
+    text = text.strip().lower()
+    if text in ("warn", "kick", "ban"):
+        return text.upper()
+
+    units = {"m": 60, "h": 3600, "d": 86400}
+    if text[-1:] in units and text[:-1].isdigit():
+        seconds = int(text[:-1]) * units[text[-1]]
+        if not MIN_TIMEOUT <= seconds <= MAX_TIMEOUT:
+            raise ValueError("Timeouts must be between 1m and 28d.")
+        return seconds
+
+    raise ValueError("Use warn, kick, ban or a duration like 10m / 6h / 7d.")
+
+
+class CompiledLadder:
+    """
+    Dense step table: table[score] = action of the highest threshold ≤ score.
+    Scores past the top threshold reuse the final action.
+    """
+
+    __slots__ = ("steps", "table")
+
+    def __init__(self, steps: Dict[int, Action]):
+        self.steps = dict(sorted(steps.items()))
+        top = max(self.steps) if self.steps else 0
+
+        table: List[Action] = [None] * (top + 1)
+        current = None
+        for score in range(top + 1):
+            current = self.steps.get(score, current)
+            table[score] = current
+        self.table = table
+
+    def action_for(self, score: int) -> Action:
+        if score <= 0:
+            return None
+        return self.table[min(score, len(self.table) - 1)]
+
+
+class EscalationEngine:
+    def __init__(self):
+        # guild_id -> CompiledLadder
+        self._ladders: Dict[int, CompiledLadder] = {}
+
+    # =================================================
+    # LADDERS (PER GUILD)
+    # =================================================
+
+    def ladder(self, guild_id: int) -> CompiledLadder:
+        ladder = self._ladders.get(guild_id)
+        if ladder is None:
+            steps = dict(ESCALATION_LADDER)
+            for row in db.fetchall(
+                "SELECT points, action FROM escalation_ladders WHERE guild_id = ?",
+                (guild_id,)
+            ):
+                if row["action"].isdigit():
+                    # Steps stored before range checks existed are ignored
+                    if not MIN_TIMEOUT <= int(row["action"]) <= MAX_TIMEOUT:
+                        continue
+                    steps[row["points"]] = int(row["action"])
+                else:
+                    steps[row["points"]] = row["action"]
+            ladder = self._ladders[guild_id] = CompiledLadder(steps)
+        return ladder
+
+    def set_step(self, guild_id: int, points: int, action: Action):
+        db.execute(
+            """
+            INSERT INTO escalation_ladders (guild_id, points, action)
+            VALUES (?, ?, ?)
+            ON CONFLICT(guild_id, points) DO UPDATE SET action = excluded.action
+            """,
+            (guild_id, points, str(action))
+        )
+        self._ladders.pop(guild_id, None)  # recompiled on next lookup
+
+    def reset_ladder(self, guild_id: int):
+        db.execute("DELETE FROM escalation_ladders WHERE guild_id = ?", (guild_id,))
+        self._ladders.pop(guild_id, None)
+
+    # =================================================
+    # COMBINED HISTORY
+    # =================================================
+
+    def warn_count(self, guild_id: int, user_id: int) -> int:
+        return warnstore.active_count(guild_id, user_id)
+
+    def score(self, guild_id: int, user_id: int) -> int:
+        return self.warn_count(guild_id, user_id) + strikes.get(guild_id, user_id)
+
+    def next_action(self, guild_id: int, user_id: int) -> Tuple[int, Action]:
+        """Call AFTER recording the new infraction. Returns (score, action)."""
+        score = self.score(guild_id, user_id)
+        return score, self.ladder(guild_id).action_for(score)
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+escalation = EscalationEngine()
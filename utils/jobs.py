@@ -0,0 +1,351 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from utils.database import db
+from utils.embeds import luxury_embed
+from utils.config import COLOR_GOLD, COLOR_SECONDARY, COLOR_DANGER
+from utils.outbound import outbound, Priority
+
+
+# =====================================================
+# 🔱 HELLFIRE BULK JOB ENGINE
+# • Targets snapshotted to SQLite at creation (job_targets)
+# • Persisted cursor → jobs resume exactly where they stopped
+# • Per-target outcome (done / skipped / failed) kept in job_targets
+# • AIMD concurrency: +1 per clean wave, halved on observed 429s
+# • Progress embed edited at most every few seconds (coalesced)
+# =====================================================
+
+CHUNK = 200               # targets read from the snapshot per query
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 10
+START_CONCURRENCY = 2
+PROGRESS_EVERY = 5.0      # seconds between progress embed edits
+MAX_ATTEMPTS = 3          # per target, 429 retries included
+
+ACTIVE = ("queued", "running")
+# "paused": no handler registered for the kind (yet) → resumed by register()
+RESUMABLE = ACTIVE + ("paused",)
+
+# handler(guild, params, target_id) -> True (done) / False (skipped); raise = failed
+Handler = Callable[[discord.Guild, dict, int], Awaitable[bool]]
+
+
+class RateLimitWatcher(logging.Handler):
+    """
+    discord.py absorbs most 429s internally (sleep + retry) and only logs
+    them. Counting those log records is the cheapest way to *see* them.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord):
+        if "rate limited" in record.getMessage().lower():
+            self.count += 1
+
+
+def _bar(done: int, total: int, width: int = 16) -> str:
+    filled = int(width * done / total) if total else width
+    return "█" * filled + "░" * (width - filled)
+
+
+class JobEngine:
+    def __init__(self):
+        self.bot = None
+        self._handlers: Dict[str, Handler] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._cancelled: set = set()
+        self._concurrency: Dict[int, int] = {}
+
+        self.watcher = RateLimitWatcher()
+        logging.getLogger("discord.http").addHandler(self.watcher)
+
+    # =================================================
+    # SETUP
+    # =================================================
+
+    def bind(self, bot):
+        self.bot = bot
+
+    def register(self, kind: str, handler: Handler):
+        self._handlers[kind] = handler
+        # A cog (re)loaded after startup picks up the jobs that waited for it;
+        # before the gateway is ready, resume_all() does this instead
+        if self.bot is not None and self.bot.is_ready():
+            for row in db.fetchall("SELECT id FROM jobs WHERE kind = ? AND status = 'paused'", (kind,)):
+                self._resume(row["id"])
+
+    # =================================================
+    # LIFECYCLE
+    # =================================================
+
+    def create(
+        self,
+        guild_id: int,
+        kind: str,
+        params: dict,
+        targets: List[int],
+        created_by: int,
+        channel_id: Optional[int] = None,
+        title: str = ""
+    ) -> int:
+        """Persists the job and its target snapshot. Call start() to run it."""
+        now = int(time.time())
+        with db.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO jobs (guild_id, kind, title, params, status, created_by, channel_id,
+                                  cursor, total, done, failed, skipped, created_at, updated_at)
+                VALUES (?, ?, ?, ?, 'queued', ?, ?, 0, ?, 0, 0, 0, ?, ?)
+                """,
+                (guild_id, kind, title or kind, json.dumps(params), created_by, channel_id, len(targets), now, now)
+            )
+            job_id = cur.lastrowid
+            cur.executemany(
+                "INSERT INTO job_targets (job_id, seq, target_id) VALUES (?, ?, ?)",
+                [(job_id, seq, target) for seq, target in enumerate(targets)]
+            )
+        return job_id
+
+    def start(self, job_id: int):
+        if job_id in self._tasks and not self._tasks[job_id].done():
+            return
+        self._tasks[job_id] = asyncio.get_running_loop().create_task(self._run(job_id))
+
+    async def launch(self, ctx, kind: str, params: dict, targets: List[int], title: str) -> int:
+        """create() + progress message + start(), for command handlers."""
+        return await self.post(ctx.channel, ctx.author.id, kind, params, targets, title)
+
+    async def post(
+        self,
+        channel: discord.abc.Messageable,
+        created_by: int,
+        kind: str,
+        params: dict,
+        targets: List[int],
+        title: str
+    ) -> int:
+        """launch() without a command context (e.g. scheduled work)."""
+        job_id = self.create(channel.guild.id, kind, params, targets, created_by, channel.id, title)
+        msg = await channel.send(embed=self.render(self.get(job_id)))
+        db.execute("UPDATE jobs SET message_id = ? WHERE id = ?", (msg.id, job_id))
+        self.start(job_id)
+        return job_id
+
+    def cancel(self, job_id: int, guild_id: int) -> bool:
+        cur = db.execute(
+            f"UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND guild_id = ? AND status IN {RESUMABLE}",
+            (int(time.time()), job_id, guild_id)
+        )
+        if cur.rowcount and job_id in self._tasks:
+            self._cancelled.add(job_id)
+        return cur.rowcount > 0
+
+    def resume_all(self) -> int:
+        """
+        Restarts every unfinished job whose kind has a registered handler;
+        the rest are parked as paused until register() sees their kind.
+        """
+        resumed = 0
+        for row in db.fetchall(f"SELECT id, kind FROM jobs WHERE status IN {RESUMABLE}"):
+            if row["kind"] in self._handlers:
+                self._resume(row["id"])
+                resumed += 1
+            else:
+                self._set_status(row["id"], "paused")
+        return resumed
+
+    def _resume(self, job_id: int):
+        db.execute("UPDATE jobs SET status = 'queued' WHERE id = ? AND status = 'paused'", (job_id,))
+        self.start(job_id)
+
+    def _set_status(self, job_id: int, status: str):
+        db.execute("UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (status, int(time.time()), job_id))
+
+    # =================================================
+    # QUERIES
+    # =================================================
+
+    def get(self, job_id: int):
+        return db.fetchone("SELECT * FROM jobs WHERE id = ?", (job_id,))
+
+    def for_guild(self, guild_id: int, limit: int = 10):
+        return db.fetchall(
+            "SELECT * FROM jobs WHERE guild_id = ? ORDER BY id DESC LIMIT ?",
+            (guild_id, limit)
+        )
+
+    def active_for(self, guild_id: int, kind: str, key: str, value):
+        """The unfinished job of `kind` whose params[key] == value, if any."""
+        return db.fetchone(
+            f"""
+            SELECT * FROM jobs
+            WHERE guild_id = ? AND kind = ? AND status IN {ACTIVE}
+            AND json_extract(params, '$.' || ?) = ?
+            LIMIT 1
+            """,
+            (guild_id, kind, key, value)
+        )
+
+    def targets(self, job_id: int, status: str, limit: int = 30):
+        return db.fetchall(
+            "SELECT target_id FROM job_targets WHERE job_id = ? AND status = ? ORDER BY seq LIMIT ?",
+            (job_id, status, limit)
+        )
+
+    def concurrency(self, job_id: int) -> int:
+        return self._concurrency.get(job_id, 0)
+
+    # =================================================
+    # RUNNER
+    # =================================================
+
+    async def _run(self, job_id: int):
+        job = self.get(job_id)
+        if not job or job["status"] not in ACTIVE:
+            return
+
+        # Never leave the row queued/running when we can't run it: a live-looking
+        # job that never moves blocks e.g. the next run of a recurring broadcast
+        handler = self._handlers.get(job["kind"])
+        if handler is None:
+            self._set_status(job_id, "paused")
+            return
+        guild = self.bot.get_guild(job["guild_id"]) if self.bot else None
+        if guild is None:
+            self._set_status(job_id, "failed")
+            return
+
+        params = json.loads(job["params"])
+        cursor, done, failed, skipped = job["cursor"], job["done"], job["failed"], job["skipped"]
+        limit = START_CONCURRENCY
+        last_progress = 0.0
+        db.execute("UPDATE jobs SET status = 'running' WHERE id = ?", (job_id,))
+
+        try:
+            while job_id not in self._cancelled:
+                rows = db.fetchall(
+                    "SELECT seq, target_id FROM job_targets WHERE job_id = ? AND seq >= ? AND status IS NULL ORDER BY seq LIMIT ?",
+                    (job_id, cursor, CHUNK)
+                )
+                if not rows:
+                    break
+
+                pending = [(r["seq"], r["target_id"], 0) for r in rows]
+                while pending and job_id not in self._cancelled:
+                    self._concurrency[job_id] = limit
+                    wave, pending = pending[:limit], pending[limit:]
+
+                    seen = self.watcher.count
+                    results = await asyncio.gather(
+                        *(handler(guild, params, target) for _, target, _ in wave),
+                        return_exceptions=True
+                    )
+                    throttled = self.watcher.count > seen
+
+                    retry, outcomes = [], []
+                    for (seq, target, attempts), result in zip(wave, results):
+                        if isinstance(result, discord.HTTPException) and result.status == 429 and attempts + 1 < MAX_ATTEMPTS:
+                            throttled = True
+                            retry.append((seq, target, attempts + 1))
+                            continue
+                        if isinstance(result, BaseException):
+                            failed += 1
+                            outcome = "failed"
+                        elif result:
+                            done += 1
+                            outcome = "done"
+                        else:
+                            skipped += 1
+                            outcome = "skipped"
+                        outcomes.append((outcome, job_id, seq))
+
+                    # AIMD: back off hard on pressure, probe upward slowly
+                    if throttled:
+                        limit = max(MIN_CONCURRENCY, limit // 2)
+                    else:
+                        limit = min(MAX_CONCURRENCY, limit + 1)
+
+                    # Retries go first so the cursor stays contiguous
+                    pending = retry + pending
+                    cursor = pending[0][0] if pending else rows[-1]["seq"] + 1
+
+                    # Outcomes and cursor commit together → after a crash only the
+                    # in-flight wave can repeat (finished targets are skipped by status)
+                    with db.cursor() as cur:
+                        cur.executemany("UPDATE job_targets SET status = ? WHERE job_id = ? AND seq = ?", outcomes)
+                        cur.execute(
+                            "UPDATE jobs SET cursor = ?, done = ?, failed = ?, skipped = ?, updated_at = ? WHERE id = ?",
+                            (cursor, done, failed, skipped, int(time.time()), job_id)
+                        )
+
+                    now = time.monotonic()
+                    if now - last_progress >= PROGRESS_EVERY:
+                        last_progress = now
+                        self._progress(job_id)
+
+            if job_id not in self._cancelled:
+                db.execute("UPDATE jobs SET status = 'done', updated_at = ? WHERE id = ?", (int(time.time()), job_id))
+        except Exception:
+            db.execute("UPDATE jobs SET status = 'failed', updated_at = ? WHERE id = ?", (int(time.time()), job_id))
+            raise
+        finally:
+            self._cancelled.discard(job_id)
+            self._concurrency.pop(job_id, None)
+            self._tasks.pop(job_id, None)
+            self._progress(job_id)
+
+    # =================================================
+    # PROGRESS
+    # =================================================
+
+    def render(self, job) -> discord.Embed:
+        total = job["total"]
+        processed = job["done"] + job["failed"] + job["skipped"]
+        elapsed = max(1, (job["updated_at"] or job["created_at"]) - job["created_at"])
+        rate = processed / elapsed
+        eta = int((total - processed) / rate) if rate > 0 and job["status"] in ACTIVE else 0
+
+        colors = {"done": COLOR_GOLD, "cancelled": COLOR_DANGER, "failed": COLOR_DANGER}
+        desc = (
+            f"`{_bar(processed, total)}` **{processed}/{total}**\n\n"
+            f"✅ Done: `{job['done']}` • ⏭️ Skipped: `{job['skipped']}` • ❌ Failed: `{job['failed']}`\n"
+            f"**Status:** `{job['status']}`"
+        )
+        if job["status"] in ACTIVE:
+            desc += f" • **Concurrency:** `{self.concurrency(job['id'])}` • **ETA:** `{eta // 60}m {eta % 60}s`"
+
+        embed = luxury_embed(title=f"⚙️ Job #{job['id']} — {job['title']}", description=desc, color=colors.get(job["status"], COLOR_SECONDARY))
+        embed.set_footer(text=f"&job cancel {job['id']}")
+        return embed
+
+    def _progress(self, job_id: int):
+        job = self.get(job_id)
+        if not job or not job["message_id"] or not self.bot:
+            return
+        channel = self.bot.get_channel(job["channel_id"])
+        if not channel:
+            return
+
+        message = channel.get_partial_message(job["message_id"])
+        embed = self.render(job)
+        outbound.fire(
+            Priority.COSMETIC,
+            lambda: message.edit(embed=embed),
+            ("channel", channel.id),
+            coalesce=("job-progress", job_id)
+        )
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+jobs = JobEngine()
@@ -0,0 +1,217 @@
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+import discord
+
+from utils import state
+from utils.database import db
+from utils.config import LOCKDOWN_CONCURRENCY
+from utils.outbound import outbound, Priority
+
+
+# =====================================================
+# 🔱 HELLFIRE LOCKDOWN
+# • "role" mode: one @everyone role edit (send_messages off), plus
+#   per-channel edits only where @everyone is explicitly allowed to talk
+# • "channels" mode (another role grants send_messages): every text channel
+# • Existing @everyone overwrites are snapshotted to SQLite before any edit
+#   and restored exactly (or removed, if none existed) on unlockdown
+# • Channel edits run with bounded concurrency on per-channel routes
+# =====================================================
+
+SEND = discord.Permissions(send_messages=True).value
+
+
+class LockdownResult:
+    __slots__ = ("mode", "channels", "failed", "elapsed")
+
+    def __init__(self, mode: str, channels: int, failed: int, elapsed: float):
+        self.mode = mode
+        self.channels = channels
+        self.failed = failed
+        self.elapsed = elapsed
+
+
+class LockdownManager:
+    def __init__(self, concurrency: int = LOCKDOWN_CONCURRENCY):
+        self.concurrency = concurrency
+
+    # =================================================
+    # STATE
+    # =================================================
+
+    def active(self, guild_id: int):
+        return db.fetchone("SELECT * FROM lockdowns WHERE guild_id = ?", (guild_id,))
+
+    @staticmethod
+    def _role_mode_possible(guild: discord.Guild) -> bool:
+        """
+        An @everyone role edit only silences members if no other role hands
+        send_messages back. Administrators bypass channel overwrites anyway,
+        so their roles don't count.
+        """
+        for role in guild.roles:
+            if role.is_default():
+                continue
+            perms = role.permissions
+            if perms.send_messages and not perms.administrator:
+                return False
+        return True
+
+    # =================================================
+    # LOCK
+    # =================================================
+
+    async def lock(self, guild: discord.Guild, by: int, mode: str = "auto") -> Optional[LockdownResult]:
+        """Returns None if the guild is already locked (its snapshot is kept)."""
+        if self.active(guild.id):
+            return None
+
+        start = time.perf_counter()
+        everyone = guild.default_role
+        role_perms = None
+
+        if mode in ("auto", "role") and self._role_mode_possible(guild) and guild.me.guild_permissions.manage_roles:
+            role_perms = everyone.permissions.value
+            perms = discord.Permissions(role_perms)
+            perms.send_messages = False
+            try:
+                await outbound.run(
+                    Priority.ENFORCE,
+                    lambda: everyone.edit(permissions=perms, reason="Server lockdown"),
+                    ("guild", guild.id)
+                )
+                mode = "role"
+            except discord.HTTPException:
+                role_perms = None
+
+        if role_perms is None:
+            mode = "channels"
+
+        # Channels needing an overwrite: explicit @everyone allows in role
+        # mode; anything not already denied in channel mode
+        targets = []
+        for channel in guild.text_channels:
+            current = channel.overwrites_for(everyone).send_messages
+            if current is True or (mode == "channels" and current is None):
+                targets.append(channel)
+
+        rows = []
+        for channel in targets:
+            allow, deny = channel.overwrites_for(everyone).pair()
+            rows.append((guild.id, channel.id, int(everyone in channel.overwrites), allow.value, deny.value))
+
+        with db.cursor() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO lockdowns (guild_id, mode, role_perms, created_by, created_at) VALUES (?, ?, ?, ?, ?)",
+                (guild.id, mode, role_perms, by, int(time.time()))
+            )
+            cur.execute("DELETE FROM lockdown_overwrites WHERE guild_id = ?", (guild.id,))
+            cur.executemany(
+                "INSERT INTO lockdown_overwrites (guild_id, channel_id, existed, allow, deny) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        state.LOCKDOWN_DATA.add(guild.id)
+
+        def deny_send(channel):
+            overwrite = channel.overwrites_for(everyone)
+            overwrite.send_messages = False
+            return lambda: channel.set_permissions(everyone, overwrite=overwrite, reason="Server lockdown")
+
+        ok = len(await self._apply([(c, deny_send(c)) for c in targets]))
+        return LockdownResult(mode, ok, len(targets) - ok, time.perf_counter() - start)
+
+    # =================================================
+    # RESTORE
+    # =================================================
+
+    async def unlock(self, guild: discord.Guild) -> Optional[LockdownResult]:
+        """Restores the snapshot. Returns None if the guild is not locked."""
+        record = self.active(guild.id)
+        if not record:
+            return None
+
+        start = time.perf_counter()
+        everyone = guild.default_role
+
+        if record["role_perms"] is not None:
+            # Only the bit we flipped — other permission changes made during
+            # the lockdown are kept
+            perms = discord.Permissions(everyone.permissions.value)
+            perms.send_messages = bool(record["role_perms"] & SEND)
+            await outbound.run(
+                Priority.ENFORCE,
+                lambda: everyone.edit(permissions=perms, reason="Lockdown lifted"),
+                ("guild", guild.id)
+            )
+
+        saved = db.fetchall(
+            "SELECT channel_id, existed, allow, deny FROM lockdown_overwrites WHERE guild_id = ?",
+            (guild.id,)
+        )
+
+        def restore(channel, row):
+            if not row["existed"]:
+                return lambda: channel.set_permissions(everyone, overwrite=None, reason="Lockdown lifted")
+            overwrite = discord.PermissionOverwrite.from_pair(
+                discord.Permissions(row["allow"]), discord.Permissions(row["deny"])
+            )
+            return lambda: channel.set_permissions(everyone, overwrite=overwrite, reason="Lockdown lifted")
+
+        edits, gone = [], []
+        for row in saved:
+            channel = guild.get_channel(row["channel_id"])
+            if channel is None:
+                gone.append(row["channel_id"])
+            else:
+                edits.append((channel, restore(channel, row)))
+
+        # Deleted channels have nothing left to restore
+        restored = gone + await self._apply(edits)
+        failed = len(saved) - len(restored)
+
+        with db.cursor() as cur:
+            cur.executemany(
+                "DELETE FROM lockdown_overwrites WHERE guild_id = ? AND channel_id = ?",
+                [(guild.id, cid) for cid in restored]
+            )
+            if not failed:
+                cur.execute("DELETE FROM lockdowns WHERE guild_id = ?", (guild.id,))
+            else:
+                # Keep the failed channels' snapshot for a retry; the role is done
+                cur.execute("UPDATE lockdowns SET role_perms = NULL, mode = 'channels' WHERE guild_id = ?", (guild.id,))
+        if not failed:
+            state.LOCKDOWN_DATA.discard(guild.id)
+
+        return LockdownResult(record["mode"], len(edits) - failed, failed, time.perf_counter() - start)
+
+    # =================================================
+    # FAN-OUT
+    # =================================================
+
+    async def _apply(self, edits: List[Tuple[discord.abc.GuildChannel, object]]) -> List[int]:
+        """
+        Runs channel edits at most `concurrency` at a time, each on its own
+        channel route. Returns the ids of the channels that succeeded.
+        """
+        sem = asyncio.Semaphore(self.concurrency)
+        ok = []
+
+        async def one(channel, factory):
+            async with sem:
+                try:
+                    await outbound.run(Priority.ENFORCE, factory, ("channel", channel.id))
+                    ok.append(channel.id)
+                except discord.HTTPException:
+                    pass
+
+        await asyncio.gather(*(one(c, f) for c, f in edits))
+        return ok
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+lockdowns = LockdownManager()
@@ -0,0 +1,284 @@
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Optional, Set, Tuple
+
+import aiohttp
+import discord
+
+from utils import state
+from utils.database import db
+from utils.outbound import outbound, Priority
+
+
+# =====================================================
+# 🔱 HELLFIRE LOG SINK
+# • Buffers log embeds per log channel
+# • Flushes as one multi-embed message (≤ 10 embeds / 6000 chars)
+# • Flush on a short timer — sooner for warnings — or when 10 are queued
+# • CRITICAL entries (and file uploads) bypass the buffer
+# • Delivered through one cached webhook per log channel (own rate
+#   limits, shared HTTP session); falls back to the bot user
+# =====================================================
+
+class Severity(IntEnum):
+    INFO = 0
+    WARN = 1
+    CRITICAL = 2
+
+
+MAX_EMBEDS = 10           # Discord per-message embed limit
+MAX_CHARS = 6000          # Discord per-message embed text limit
+FLUSH_DELAY = {
+    Severity.INFO: 2.0,
+    Severity.WARN: 0.5,
+}
+
+WEBHOOK_NAME = "HellFire Logs"
+NO_WEBHOOK_RETRY = 3600   # re-try webhook creation this long after a refusal
+CLOSE_TIMEOUT = 10.0      # close() waits this long for queued batches
+
+
+class LogSink:
+    def __init__(self):
+        # channel_id -> (channel, pending embeds)
+        self._buffers: Dict[int, Tuple[discord.abc.Messageable, Deque[discord.Embed]]] = {}
+        # channel_id -> (deadline, timer handle)
+        self._timers: Dict[int, Tuple[float, asyncio.TimerHandle]] = {}
+
+        # channel_id -> webhook (bound to the shared session)
+        self._hooks: Dict[int, discord.Webhook] = {}
+        # channel_id -> when webhook creation was last refused
+        self._no_hook: Dict[int, float] = {}
+        # channel_id -> lock around lookup/creation (one webhook per channel)
+        self._hook_locks: Dict[int, asyncio.Lock] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Deliveries queued on outbound and not finished yet (drained by close)
+        self._inflight: Set[asyncio.Future] = set()
+        self._loaded = False
+
+        # Instrumentation
+        self.embeds = 0
+        self.messages = 0
+        self.bypassed = 0
+        self.webhook_sends = 0
+        self.bot_sends = 0
+        self.fallbacks = 0
+        self.webhooks_created = 0
+
+    # =================================================
+    # ROUTING
+    # =================================================
+
+    def log_channel(self, guild: discord.Guild):
+        if not guild or not getattr(state, "BOT_LOG_CHANNEL_ID", None):
+            return None
+        return guild.get_channel(state.BOT_LOG_CHANNEL_ID)
+
+    def log(self, guild: discord.Guild, embed: discord.Embed, severity: Severity = Severity.INFO, file: discord.File = None):
+        """Posts to the guild's configured bot log channel (no-op if unset)."""
+        channel = self.log_channel(guild)
+        if channel:
+            self.post(channel, embed, severity, file)
+
+    def post(self, channel, embed: discord.Embed, severity: Severity = Severity.INFO, file: discord.File = None):
+        self.embeds += 1
+
+        if severity >= Severity.CRITICAL or file is not None:
+            # Whatever is already buffered goes first so the channel reads in order
+            self.flush(channel.id)
+            self.bypassed += 1
+            self._send(channel, [embed], file)
+            return
+
+        entry = self._buffers.get(channel.id)
+        if entry is None:
+            entry = self._buffers[channel.id] = (channel, deque())
+        entry[1].append(embed)
+
+        if len(entry[1]) >= MAX_EMBEDS:
+            self.flush(channel.id)
+        else:
+            self._arm(channel.id, FLUSH_DELAY[severity])
+
+    # =================================================
+    # FLUSHING
+    # =================================================
+
+    def _arm(self, channel_id: int, delay: float):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+
+        current = self._timers.get(channel_id)
+        if current is not None:
+            if current[0] <= deadline:
+                return
+            current[1].cancel()  # a more urgent entry pulls the flush forward
+
+        self._timers[channel_id] = (deadline, loop.call_at(deadline, self.flush, channel_id))
+
+    def flush(self, channel_id: int):
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None:
+            timer[1].cancel()
+
+        entry = self._buffers.pop(channel_id, None)
+        if entry is None:
+            return
+
+        channel, pending = entry
+        while pending:
+            batch, size = [], 0
+            while pending and len(batch) < MAX_EMBEDS:
+                cost = len(pending[0])
+                if batch and size + cost > MAX_CHARS:
+                    break
+                batch.append(pending.popleft())
+                size += cost
+            self._send(channel, batch)
+
+    def flush_all(self):
+        for channel_id in list(self._buffers):
+            self.flush(channel_id)
+
+    def _send(self, channel, embeds, file: discord.File = None):
+        self.messages += 1
+        self._load()
+
+        # Known webhook → its own route; otherwise the bot's channel route
+        route = ("webhook", channel.id) if channel.id in self._hooks else ("channel", channel.id)
+        future = outbound.submit(Priority.LOG, lambda: self._deliver(channel, embeds, file), route)
+        self._inflight.add(future)
+        future.add_done_callback(self._delivered)
+
+    def _delivered(self, future: asyncio.Future):
+        self._inflight.discard(future)
+        # Failures are counted by outbound, never raised
+        future.cancelled() or future.exception()
+
+    async def _deliver(self, channel, embeds, file: discord.File = None):
+        hook = await self._webhook_for(channel)
+
+        if hook is not None:
+            me = channel.guild.me
+            try:
+                kwargs = {"embeds": embeds, "username": me.display_name, "avatar_url": me.display_avatar.url}
+                if file is not None:
+                    kwargs["file"] = file
+                await hook.send(**kwargs)
+                self.webhook_sends += 1
+                return
+            except (discord.NotFound, discord.Forbidden):
+                # Webhook deleted or revoked → forget it, use the bot this time
+                self._forget_hook(channel.id)
+                self.fallbacks += 1
+                if file is not None:
+                    file.reset()
+            except discord.HTTPException:
+                # Rejected payload / webhook hiccup → the batch still goes out via the bot
+                self.fallbacks += 1
+                if file is not None:
+                    file.reset()
+
+        self.bot_sends += 1
+        if file is not None:
+            await channel.send(embeds=embeds, file=file)
+        else:
+            await channel.send(embeds=embeds)
+
+    # =================================================
+    # WEBHOOKS
+    # =================================================
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        for row in db.fetchall("SELECT channel_id, webhook_id, token FROM log_webhooks"):
+            self._hooks[row["channel_id"]] = self._partial(row["webhook_id"], row["token"])
+
+    def _partial(self, webhook_id: int, token: str) -> discord.Webhook:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return discord.Webhook.partial(webhook_id, token, session=self._session)
+
+    async def _webhook_for(self, channel) -> Optional[discord.Webhook]:
+        hook = self._hooks.get(channel.id)
+        if hook is not None:
+            return hook
+
+        # Concurrent deliveries to one channel must not each create a webhook
+        lock = self._hook_locks.get(channel.id)
+        if lock is None:
+            lock = self._hook_locks[channel.id] = asyncio.Lock()
+        async with lock:
+            return await self._resolve_hook(channel)
+
+    async def _resolve_hook(self, channel) -> Optional[discord.Webhook]:
+        hook = self._hooks.get(channel.id)
+        if hook is not None:
+            return hook   # created while we waited for the lock
+
+        refused = self._no_hook.get(channel.id)
+        if refused and time.time() - refused < NO_WEBHOOK_RETRY:
+            return None
+        if not isinstance(channel, discord.TextChannel):
+            return None
+
+        try:
+            # Reuse one of ours if it already exists (e.g. after a DB reset)
+            existing = [w for w in await channel.webhooks() if w.name == WEBHOOK_NAME and w.token]
+            created = existing[0] if existing else await channel.create_webhook(name=WEBHOOK_NAME, reason="Log delivery")
+        except (discord.Forbidden, discord.HTTPException):
+            self._no_hook[channel.id] = time.time()
+            return None
+
+        if not existing:
+            self.webhooks_created += 1
+
+        db.execute(
+            """
+            INSERT INTO log_webhooks (channel_id, webhook_id, token) VALUES (?, ?, ?)
+            ON CONFLICT(channel_id) DO UPDATE SET webhook_id = excluded.webhook_id, token = excluded.token
+            """,
+            (channel.id, created.id, created.token)
+        )
+        hook = self._hooks[channel.id] = self._partial(created.id, created.token)
+        return hook
+
+    def _forget_hook(self, channel_id: int):
+        self._hooks.pop(channel_id, None)
+        db.execute("DELETE FROM log_webhooks WHERE channel_id = ?", (channel_id,))
+
+    async def close(self):
+        self.flush_all()
+        # The final batches need the session → wait for them before closing it
+        if self._inflight:
+            await asyncio.wait(set(self._inflight), timeout=CLOSE_TIMEOUT)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    # =================================================
+    # INTROSPECTION
+    # =================================================
+
+    def stats(self) -> dict:
+        return {
+            "embeds": self.embeds,
+            "messages": self.messages,
+            "saved": self.embeds - self.messages,
+            "bypassed": self.bypassed,
+            "buffered": sum(len(q) for _, q in self._buffers.values()),
+            "webhook_sends": self.webhook_sends,
+            "bot_sends": self.bot_sends,
+            "fallbacks": self.fallbacks,
+            "webhooks": len(self._hooks),
+        }
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+logsink = LogSink()
@@ -0,0 +1,215 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import discord
+
+from utils.outbound import outbound, Priority
+
+
+# =====================================================
+# 🔱 HELLFIRE RECENT MESSAGE INDEX
+# • (guild, user) → channel → last N message IDs (bounded, LRU)
+# • Cleanup groups IDs by channel → delete_messages (≤ 100 per call)
+# • No channel history fetches: the IDs are already known
+# • Single flagged deletes are coalesced per channel into bulk calls
+# =====================================================
+
+PER_CHANNEL = 100         # IDs kept per (guild, user, channel)
+MAX_USERS = 20000         # (guild, user) keys kept, least recently active dropped
+HORIZON = 6 * 3600        # IDs older than this are pruned on write
+BULK_LIMIT = 100          # Discord bulk delete per-call limit
+BULK_MAX_AGE = 14 * 86400 - 60   # bulk delete refuses messages ≥ 14 days old
+BATCH_DELAY = 0.5         # coalescing window for queued single deletes
+
+Key = Tuple[int, int]     # (guild_id, user_id)
+
+
+def created_at(message_id: int) -> float:
+    """Unix time encoded in a snowflake."""
+    return ((message_id >> 22) + discord.utils.DISCORD_EPOCH) / 1000
+
+
+class MessageIndex:
+    def __init__(self):
+        self._index: "OrderedDict[Key, Dict[int, Deque[int]]]" = OrderedDict()
+        # channel_id -> (channel, pending ids, timer)
+        self._queued: Dict[int, Tuple[discord.abc.Messageable, List[int], asyncio.TimerHandle]] = {}
+
+        # Instrumentation
+        self.bulk_calls = 0
+        self.single_calls = 0
+        self.deleted = 0
+
+    # =================================================
+    # INDEX
+    # =================================================
+
+    def record(self, message: discord.Message):
+        key = (message.guild.id, message.author.id)
+        channels = self._index.get(key)
+        if channels is None:
+            channels = self._index[key] = {}
+            if len(self._index) > MAX_USERS:
+                self._index.popitem(last=False)
+        else:
+            self._index.move_to_end(key)
+
+        ids = channels.get(message.channel.id)
+        if ids is None:
+            ids = channels[message.channel.id] = deque(maxlen=PER_CHANNEL)
+        ids.append(message.id)
+
+        cutoff = time.time() - HORIZON
+        while ids and created_at(ids[0]) < cutoff:
+            ids.popleft()
+
+    def forget(self, message: discord.Message):
+        channels = self._index.get((message.guild.id, message.author.id))
+        ids = channels.get(message.channel.id) if channels else None
+        if ids and message.id in ids:
+            ids.remove(message.id)
+
+    def collect(
+        self,
+        guild_id: int,
+        user_id: int,
+        since: Optional[float] = None,
+        channel_id: Optional[int] = None
+    ) -> Dict[int, List[int]]:
+        """Indexed message IDs grouped by channel (oldest first)."""
+        channels = self._index.get((guild_id, user_id)) or {}
+        result = {}
+        for cid, ids in channels.items():
+            if channel_id is not None and cid != channel_id:
+                continue
+            picked = [i for i in ids if since is None or created_at(i) >= since]
+            if picked:
+                result[cid] = picked
+        return result
+
+    def _drop(self, guild_id: int, user_id: int, grouped: Dict[int, List[int]]):
+        channels = self._index.get((guild_id, user_id))
+        if not channels:
+            return
+        for cid, picked in grouped.items():
+            ids = channels.get(cid)
+            if ids is None:
+                continue
+            gone = set(picked)
+            remaining = [i for i in ids if i not in gone]
+            if remaining:
+                channels[cid] = deque(remaining, maxlen=PER_CHANNEL)
+            else:
+                del channels[cid]
+        if not channels:
+            del self._index[(guild_id, user_id)]
+
+    # =================================================
+    # CLEANUP
+    # =================================================
+
+    async def purge(
+        self,
+        guild: discord.Guild,
+        user_id: int,
+        since: Optional[float] = None,
+        channel_id: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Deletes a user's indexed messages. Channels are cleaned in parallel
+        (each has its own rate-limit route). Returns (deleted, failed).
+        """
+        grouped = self.collect(guild.id, user_id, since, channel_id)
+        self._drop(guild.id, user_id, grouped)
+
+        jobs = []
+        for cid, ids in grouped.items():
+            channel = guild.get_channel_or_thread(cid)
+            if channel is not None:
+                jobs.append(self.delete_ids(channel, ids))
+
+        results = await asyncio.gather(*jobs)
+        deleted = sum(r[0] for r in results)
+        failed = sum(r[1] for r in results)
+        return deleted, failed
+
+    async def delete_ids(self, channel, ids: List[int]) -> Tuple[int, int]:
+        """
+        Bulk-deletes `ids` (≤ 100 per call). IDs past the 14-day bulk window
+        go one at a time, paced by the channel's bucket. Returns (deleted, failed).
+        """
+        cutoff = time.time() - BULK_MAX_AGE
+        recent = [i for i in ids if created_at(i) >= cutoff]
+        old = [i for i in ids if created_at(i) < cutoff]
+        deleted = failed = 0
+
+        for i in range(0, len(recent), BULK_LIMIT):
+            chunk = [discord.Object(id=m) for m in recent[i:i + BULK_LIMIT]]
+            try:
+                await outbound.run(Priority.DELETE, lambda chunk=chunk: channel.delete_messages(chunk), ("channel", channel.id))
+                self.bulk_calls += 1
+                deleted += len(chunk)
+            except discord.HTTPException:
+                failed += len(chunk)
+
+        # Past the bulk window Discord only allows one-by-one deletes
+        for message_id in old:
+            try:
+                await outbound.run(Priority.DELETE, channel.get_partial_message(message_id).delete, ("channel", channel.id))
+                self.single_calls += 1
+                deleted += 1
+            except discord.HTTPException:
+                failed += 1
+
+        self.deleted += deleted
+        return deleted, failed
+
+    # =================================================
+    # COALESCED SINGLE DELETES
+    # =================================================
+
+    def queue_delete(self, message: discord.Message):
+        """
+        Deletes `message` shortly, together with any other message queued
+        for the same channel in the meantime (one bulk call instead of N).
+        """
+        cid = message.channel.id
+        entry = self._queued.get(cid)
+        if entry is None:
+            timer = asyncio.get_running_loop().call_later(BATCH_DELAY, self._flush_queued, cid)
+            entry = self._queued[cid] = (message.channel, [], timer)
+        entry[1].append(message.id)
+        self.forget(message)
+
+        if len(entry[1]) >= BULK_LIMIT:
+            self._flush_queued(cid)
+
+    def _flush_queued(self, channel_id: int):
+        entry = self._queued.pop(channel_id, None)
+        if entry is None:
+            return
+        channel, ids, timer = entry
+        timer.cancel()
+        asyncio.get_running_loop().create_task(self.delete_ids(channel, ids))
+
+    # =================================================
+    # INTROSPECTION
+    # =================================================
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._index),
+            "ids": sum(len(ids) for channels in self._index.values() for ids in channels.values()),
+            "bulk_calls": self.bulk_calls,
+            "single_calls": self.single_calls,
+            "deleted": self.deleted,
+        }
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+msgindex = MessageIndex()
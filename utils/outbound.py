@@ -0,0 +1,331 @@
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+import discord
+
+
+# =====================================================
+# 🔱 HELLFIRE OUTBOUND SCHEDULER
+# • One queue for every REST side-effect the bot makes
+# • Strict priority: ENFORCE > DELETE > LOG > DM > COSMETIC
+# • Local token buckets per route → a hot bucket never blocks others
+# • Under pressure: coalesce duplicates, shed DM / cosmetic work
+# =====================================================
+
+class Priority(IntEnum):
+    ENFORCE = 0     # timeouts, kicks, bans, quarantines
+    DELETE = 1      # message removal
+    LOG = 2         # staff / audit log posts
+    DM = 3          # user notifications
+    COSMETIC = 4    # progress edits, reactions, nicknames
+
+
+# Route kind -> (burst capacity, refill seconds for a full burst)
+# Conservative guesses at Discord's published per-route limits.
+BUCKET_LIMITS: Dict[str, Tuple[int, float]] = {
+    "channel": (5, 5.0),
+    "dm": (10, 2.0),          # one shared budget for every DM (utils.dm)
+    "guild": (10, 10.0),      # member edits / timeouts / kicks / bans
+    "webhook": (5, 2.0),      # per-webhook; separate from the bot's buckets
+}
+
+MAX_DEPTH = 1000          # above this, sheddable work is dropped
+SHED_FROM = Priority.DM   # DM and COSMETIC can be shed
+SCAN_LIMIT = 32           # jobs inspected per priority when looking for a ready bucket
+MAX_RETRIES = 3
+MAX_BUCKETS = 5000        # idle (full) buckets are pruned past this
+
+Bucket = Tuple[str, int]
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "rate", "tokens", "stamp", "blocked_until")
+
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.rate = capacity / per
+        self.tokens = float(capacity)
+        self.stamp = time.monotonic()
+        self.blocked_until = 0.0
+
+    def wait_time(self, now: float) -> float:
+        """0 when a request may go out now, otherwise seconds until it can."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def block(self, seconds: float, now: float):
+        """Server said 429 — trust it over our estimate."""
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        # One request may probe the route once the block lifts; refill from there
+        self.tokens = 1.0
+        self.stamp = self.blocked_until
+
+
+class Job:
+    __slots__ = ("priority", "factory", "bucket", "coalesce", "future", "enqueued", "retries")
+
+    def __init__(self, priority: Priority, factory, bucket: Optional[Bucket], coalesce: Optional[Hashable]):
+        self.priority = priority
+        self.factory = factory
+        self.bucket = bucket
+        self.coalesce = coalesce
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued = time.monotonic()
+        self.retries = 0
+
+
+class Outbound:
+    def __init__(self, concurrency: int = 8, max_depth: int = MAX_DEPTH):
+        self.max_depth = max_depth
+        self._queues: Dict[Priority, Deque[Job]] = {p: deque() for p in Priority}
+        self._buckets: Dict[Bucket, TokenBucket] = {}
+        self._pending: Dict[Hashable, Job] = {}   # coalesce key -> queued job
+        self._concurrency = concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Instrumentation
+        self.submitted = 0
+        self.executed = 0
+        self.failed = 0
+        self.coalesced = 0
+        self.shed = 0
+        self.rate_limited = 0
+        self._wait_ewma = {p: 0.0 for p in Priority}
+        self._wait_max = {p: 0.0 for p in Priority}
+
+    # =================================================
+    # LIFECYCLE
+    # =================================================
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._sem = asyncio.Semaphore(self._concurrency)
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._dispatcher())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # =================================================
+    # SUBMISSION
+    # =================================================
+
+    def submit(
+        self,
+        priority: Priority,
+        factory: Callable[[], Awaitable],
+        bucket: Optional[Bucket] = None,
+        coalesce: Optional[Hashable] = None
+    ) -> asyncio.Future:
+        """
+        Queues `factory()` for execution and returns a future with its result.
+
+        `bucket` names the rate-limit route, e.g. ("channel", id).
+        `coalesce` collapses queued jobs with the same key: the newest
+        factory wins and every submitter shares one future.
+        """
+        self.start()
+        self.submitted += 1
+
+        if coalesce is not None:
+            queued = self._pending.get(coalesce)
+            if queued is not None:
+                queued.factory = factory
+                self.coalesced += 1
+                return queued.future
+
+        job = Job(priority, factory, bucket, coalesce)
+        self._queues[priority].append(job)
+        if coalesce is not None:
+            self._pending[coalesce] = job
+
+        if self.depth() > self.max_depth:
+            self._shed_one()
+
+        self._wake.set()
+        return job.future
+
+    async def run(self, priority: Priority, factory, bucket: Optional[Bucket] = None, coalesce: Optional[Hashable] = None):
+        """submit() and await the result (exceptions propagate to the caller)."""
+        return await self.submit(priority, factory, bucket, coalesce)
+
+    def fire(self, priority: Priority, factory, bucket: Optional[Bucket] = None, coalesce: Optional[Hashable] = None):
+        """submit() without awaiting; failures are counted, never raised."""
+        future = self.submit(priority, factory, bucket, coalesce)
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def drop(self, coalesce: Hashable) -> bool:
+        """Removes a still-queued coalesced job (its future resolves to None)."""
+        job = self._pending.pop(coalesce, None)
+        if job is None:
+            return False
+        try:
+            self._queues[job.priority].remove(job)
+        except ValueError:
+            pass   # already picked up by a worker
+        if not job.future.done():
+            job.future.set_result(None)
+        return True
+
+    # =================================================
+    # PRESSURE HANDLING
+    # =================================================
+
+    def _shed_one(self):
+        for priority in reversed(Priority):
+            if priority < SHED_FROM:
+                break
+            queue = self._queues[priority]
+            if queue:
+                job = queue.popleft()   # oldest sheddable job is the least useful
+                self._forget(job)
+                if not job.future.done():
+                    job.future.set_result(None)
+                self.shed += 1
+                return
+
+    def _forget(self, job: Job):
+        if job.coalesce is not None and self._pending.get(job.coalesce) is job:
+            del self._pending[job.coalesce]
+
+    # =================================================
+    # DISPATCH
+    # =================================================
+
+    def _bucket(self, key: Optional[Bucket]) -> Optional[TokenBucket]:
+        if key is None:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limits = BUCKET_LIMITS.get(key[0])
+            if limits is None:
+                return None
+            if len(self._buckets) >= MAX_BUCKETS:
+                self._prune_buckets()
+            bucket = self._buckets[key] = TokenBucket(*limits)
+        return bucket
+
+    def _prune_buckets(self):
+        now = time.monotonic()
+        for key in [k for k, b in self._buckets.items() if b.wait_time(now) == 0 and b.tokens >= b.capacity]:
+            del self._buckets[key]
+
+    def _next_ready(self) -> Tuple[Optional[Job], Optional[float]]:
+        """Highest-priority job whose bucket has capacity, else the shortest wait."""
+        now = time.monotonic()
+        soonest = None
+
+        for priority in Priority:
+            queue = self._queues[priority]
+            for idx in range(min(len(queue), SCAN_LIMIT)):
+                job = queue[idx]
+                bucket = self._bucket(job.bucket)
+                wait = bucket.wait_time(now) if bucket else 0.0
+
+                if wait <= 0:
+                    del queue[idx]
+                    if bucket:
+                        bucket.take()
+                    return job, None
+
+                soonest = wait if soonest is None else min(soonest, wait)
+
+        return None, soonest
+
+    async def _dispatcher(self):
+        while True:
+            job, wait = self._next_ready()
+
+            if job is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._sem.acquire()
+            asyncio.create_task(self._execute(job))
+
+    async def _execute(self, job: Job):
+        self._forget(job)
+        waited = time.monotonic() - job.enqueued
+        self._wait_ewma[job.priority] += 0.2 * (waited - self._wait_ewma[job.priority])
+        self._wait_max[job.priority] = max(self._wait_max[job.priority], waited)
+
+        try:
+            result = await job.factory()
+        except discord.HTTPException as e:
+            if e.status == 429 and job.retries < MAX_RETRIES:
+                self._requeue(job, getattr(e, "retry_after", None) or 1.0)
+                return
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        except Exception as e:
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self.executed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._sem.release()
+
+    def _requeue(self, job: Job, retry_after: float):
+        self.rate_limited += 1
+        job.retries += 1
+
+        bucket = self._bucket(job.bucket)
+        if bucket:
+            bucket.block(retry_after, time.monotonic())
+
+        # Front of its class: it already waited its turn once
+        self._queues[job.priority].appendleft(job)
+        if job.coalesce is not None:
+            self._pending.setdefault(job.coalesce, job)
+        self._wake.set()
+
+    # =================================================
+    # INTROSPECTION
+    # =================================================
+
+    def depth(self, priority: Optional[Priority] = None) -> int:
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(q) for q in self._queues.values())
+
+    def stats(self) -> dict:
+        return {
+            "depth": {p.name: len(self._queues[p]) for p in Priority},
+            "wait_ms": {p.name: self._wait_ewma[p] * 1000 for p in Priority},
+            "max_wait_ms": {p.name: self._wait_max[p] * 1000 for p in Priority},
+            "submitted": self.submitted,
+            "executed": self.executed,
+            "failed": self.failed,
+            "coalesced": self.coalesced,
+            "shed": self.shed,
+            "rate_limited": self.rate_limited,
+            "buckets": len(self._buckets),
+        }
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+outbound = Outbound()
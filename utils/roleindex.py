@@ -0,0 +1,253 @@
+import re
+from typing import Dict, List, Set
+
+import discord
+
+
+# =====================================================
+# 🔱 HELLFIRE ROLE MEMBERSHIP INDEX
+# • guild → role → set(member IDs), built once per guild, then kept
+#   current from member / role gateway events (no member scans)
+# • Segments are role expressions resolved with set algebra:
+#     @Gamers and not @Muted
+#     (@EU or @NA) and not 'Server Booster'
+# =====================================================
+
+TOKEN_RE = re.compile(
+    r"\s*(?:(?P<op>\(|\)|&|\||!)|<@&(?P<mention>\d+)>|'(?P<quoted>[^']+)'|(?P<word>[^\s()&|!]+))"
+)
+EVERYONE = ("everyone", "@everyone", "all")
+
+
+class RoleIndex:
+    def __init__(self):
+        self.bot = None
+        self._roles: Dict[int, Dict[int, Set[int]]] = {}    # guild -> role -> members
+        self._members: Dict[int, Set[int]] = {}             # guild -> every member
+        self._bots: Dict[int, Set[int]] = {}                # guild -> bot accounts
+
+    def bind(self, bot):
+        self.bot = bot
+        bot.add_listener(self._on_member_join, "on_member_join")
+        bot.add_listener(self._on_member_update, "on_member_update")
+        bot.add_listener(self._on_raw_member_remove, "on_raw_member_remove")
+        bot.add_listener(self._on_guild_role_delete, "on_guild_role_delete")
+        bot.add_listener(self._on_guild_remove, "on_guild_remove")
+
+    # =================================================
+    # BUILD
+    # =================================================
+
+    def _ensure(self, guild: discord.Guild) -> Dict[int, Set[int]]:
+        roles = self._roles.get(guild.id)
+        if roles is not None:
+            return roles
+
+        roles, members, bots = {}, set(), set()
+        for member in guild.members:
+            members.add(member.id)
+            if member.bot:
+                bots.add(member.id)
+            for role in member.roles[1:]:
+                roles.setdefault(role.id, set()).add(member.id)
+
+        # Until the member list is chunked the snapshot is partial → don't keep it
+        if guild.chunked:
+            self._roles[guild.id] = roles
+            self._members[guild.id] = members
+            self._bots[guild.id] = bots
+        return roles
+
+    # =================================================
+    # EVENTS
+    # =================================================
+
+    async def _on_member_join(self, member: discord.Member):
+        if member.guild.id not in self._roles:
+            return
+        self._members[member.guild.id].add(member.id)
+        if member.bot:
+            self._bots[member.guild.id].add(member.id)
+        roles = self._roles[member.guild.id]
+        for role in member.roles[1:]:
+            roles.setdefault(role.id, set()).add(member.id)
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        roles = self._roles.get(after.guild.id)
+        if roles is None:
+            return
+        old = {role.id for role in before.roles}
+        new = {role.id for role in after.roles}
+        if old == new:
+            return
+        for role_id in old - new:
+            roles.get(role_id, set()).discard(after.id)
+        for role_id in new - old:
+            roles.setdefault(role_id, set()).add(after.id)
+
+    async def _on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        roles = self._roles.get(payload.guild_id)
+        if roles is None:
+            return
+        user_id = payload.user.id
+        self._members[payload.guild_id].discard(user_id)
+        self._bots[payload.guild_id].discard(user_id)
+        for members in roles.values():
+            members.discard(user_id)
+
+    async def _on_guild_role_delete(self, role: discord.Role):
+        roles = self._roles.get(role.guild.id)
+        if roles is not None:
+            roles.pop(role.id, None)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        self._roles.pop(guild.id, None)
+        self._members.pop(guild.id, None)
+        self._bots.pop(guild.id, None)
+
+    # =================================================
+    # QUERIES
+    # =================================================
+
+    def ready(self, guild: discord.Guild) -> bool:
+        """True once the guild is indexed (lookups no longer scan members)."""
+        if guild.id in self._roles:
+            return True
+        # Unchunked guilds would be scanned in full on every call → bail early
+        if not guild.chunked:
+            return False
+        self._ensure(guild)
+        return True
+
+    def members(self, guild: discord.Guild, role_id: int) -> Set[int]:
+        """Member IDs holding the role. Treat the result as read-only."""
+        return self._ensure(guild).get(role_id, set())
+
+    def everyone(self, guild: discord.Guild) -> Set[int]:
+        self._ensure(guild)
+        return self._members.get(guild.id) or {m.id for m in guild.members}
+
+    def bots(self, guild: discord.Guild) -> Set[int]:
+        self._ensure(guild)
+        return self._bots.get(guild.id) or {m.id for m in guild.members if m.bot}
+
+    # =================================================
+    # SEGMENT EXPRESSIONS
+    # =================================================
+
+    def resolve(self, guild: discord.Guild, expression: str) -> Set[int]:
+        """
+        Evaluates a role expression to member IDs.
+        Operators: and / &, or / |, not / !, parentheses.
+        Roles: mentions, IDs, single words or 'quoted names'.
+        Raises ValueError on bad syntax or unknown roles.
+        """
+        tokens = self._tokenize(expression)
+        if not tokens:
+            raise ValueError("Empty segment.")
+        parser = _Parser(self, guild, tokens)
+        result = parser.expr()
+        if parser.pos != len(tokens):
+            raise ValueError(f"Unexpected `{tokens[parser.pos][1]}`.")
+        # A bare role returns the live index set → hand out a copy
+        return set(result)
+
+    @staticmethod
+    def _tokenize(expression: str) -> List[tuple]:
+        tokens, pos = [], 0
+        expression = expression.strip()
+        while pos < len(expression):
+            match = TOKEN_RE.match(expression, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"Can't read segment near `{expression[pos:pos + 20]}`.")
+            pos = match.end()
+
+            if match["op"]:
+                tokens.append(("op", match["op"]))
+            elif match["mention"]:
+                tokens.append(("role", int(match["mention"])))
+            elif match["quoted"]:
+                tokens.append(("role", match["quoted"]))
+            else:
+                word = match["word"]
+                keyword = {"and": "&", "or": "|", "not": "!"}.get(word.lower())
+                tokens.append(("op", keyword) if keyword else ("role", word))
+        return tokens
+
+    def _role(self, guild: discord.Guild, ref) -> Set[int]:
+        if isinstance(ref, str) and ref.lower() in EVERYONE:
+            return self.everyone(guild)
+
+        role = None
+        if isinstance(ref, int) or ref.isdigit():
+            role = guild.get_role(int(ref))
+        else:
+            name = ref.lstrip("@").lower()
+            role = discord.utils.find(lambda r: r.name.lower() == name, guild.roles)
+
+        if role is None:
+            raise ValueError(f"Unknown role `{ref}`.")
+        if role.is_default():
+            return self.everyone(guild)
+        return self.members(guild, role.id)
+
+
+class _Parser:
+    """
+    expr   := term ('|' term)*
+    term   := factor ('&' factor)*
+    factor := '!' factor | '(' expr ')' | role
+    """
+
+    def __init__(self, index: RoleIndex, guild: discord.Guild, tokens: List[tuple]):
+        self.index = index
+        self.guild = guild
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self, value: str) -> bool:
+        return self.pos < len(self.tokens) and self.tokens[self.pos] == ("op", value)
+
+    def expr(self) -> Set[int]:
+        result = self.term()
+        while self._peek("|"):
+            self.pos += 1
+            result = result | self.term()
+        return result
+
+    def term(self) -> Set[int]:
+        result = self.factor()
+        while self._peek("&"):
+            self.pos += 1
+            if self._peek("!"):
+                # "A and not B" → difference, without materialising "not B"
+                self.pos += 1
+                result = result - self.factor()
+            else:
+                result = result & self.factor()
+        return result
+
+    def factor(self) -> Set[int]:
+        if self.pos >= len(self.tokens):
+            raise ValueError("Segment ends unexpectedly.")
+
+        kind, value = self.tokens[self.pos]
+        self.pos += 1
+        if kind == "role":
+            return self.index._role(self.guild, value)
+        if value == "!":
+            return self.index.everyone(self.guild) - self.factor()
+        if value == "(":
+            result = self.expr()
+            if not self._peek(")"):
+                raise ValueError("Missing `)`.")
+            self.pos += 1
+            return result
+        raise ValueError(f"Unexpected `{value}`.")
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+roleindex = RoleIndex()
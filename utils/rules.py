@@ -0,0 +1,504 @@
+import inspect
+import json
+import operator
+import re
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from utils.database import db
+from utils.config import TOXICITY_THRESHOLD, TOXICITY_ALERT_THRESHOLD
+
+
+# =====================================================
+# 🔱 HELLFIRE AUTOMOD RULE ENGINE
+# • Declarative rules (JSON): conditions → scope → action
+# • Compiled once per guild into an ordered plan
+# • Cheapest predicates evaluated first, short-circuiting
+# • Rule edits bump a version → lazy recompile, no restart
+# • Shadow rules evaluate & get profiled but never enforce
+# =====================================================
+
+INVITE_REGEX = re.compile(r"(discord\.gg/|discord\.com/invite/|discordapp\.com/invite/)", re.IGNORECASE)
+IP_LOGGER_REGEX = re.compile(r"(grabify\.link|iplogger\.org|blasze\.com|shorte\.st)", re.IGNORECASE)
+LINK_REGEX = re.compile(r"https?://", re.IGNORECASE)
+
+SCAM_KEYWORDS = [
+    "free nitro", "steam skin", "crypto drop", "airdrop", "claim now",
+    "limited offer", "free btc", "free crypto", "gift nitro",
+]
+
+# TOXICITY/SELF-HARM KEYWORDS (Staff get notified, user gets help-resource DM)
+DANGER_KEYWORDS = ["kys", "suicide", "self harm", "kill myself", "end it"]
+
+ACTIONS = ("strike", "soft_warn", "timeout", "delete", "alert")
+
+
+# =====================================================
+# FEATURE EXTRACTION (LAZY, CACHED PER MESSAGE)
+# =====================================================
+
+class MessageFeatures:
+    """
+    Per-message feature bag. Each feature is computed at most once and
+    only if a rule actually asks for it.
+    """
+
+    def __init__(self, message, content: str, history: list, detectors=None, toxicity=None, scale: float = 1.0):
+        self.message = message
+        self.content = content
+        self.history = history          # [(timestamp, content), ...] inside the analysis window
+        self.detectors = detectors
+        self.toxicity = toxicity
+        self.scale = scale              # channel baseline multiplier for adaptive thresholds
+        self._cache: Dict[str, object] = {}
+
+    async def get(self, name: str):
+        if name in self._cache:
+            return self._cache[name]
+
+        value = FEATURES[name][1](self)
+        if inspect.isawaitable(value):
+            value = await value
+
+        self._cache[name] = value
+        return value
+
+    async def _signals(self) -> dict:
+        if "_signals" not in self._cache:
+            result = await self.detectors.run(self.content) if self.detectors else None
+            self._cache["_signals"] = result or {}
+        return self._cache["_signals"]
+
+
+def _caps_ratio(f: MessageFeatures) -> float:
+    raw = f.message.content
+    letters = [c for c in raw if c.isalpha()]
+    return sum(c.isupper() for c in letters) / len(letters) if letters else 0.0
+
+
+async def _zalgo(f: MessageFeatures) -> bool:
+    return bool((await f._signals()).get("zalgo"))
+
+
+async def _entropy(f: MessageFeatures) -> float:
+    return (await f._signals()).get("entropy", 3.0)
+
+
+async def _toxicity(f: MessageFeatures) -> float:
+    if not f.toxicity or len(f.content) < 3:
+        return 0.0
+    return await f.toxicity.score(f.content)
+
+
+# name -> (cost, extractor). Cost is a relative rank used for ordering.
+FEATURES = {
+    "length":           (0, lambda f: len(f.content)),
+    "attachments":      (0, lambda f: len(f.message.attachments)),
+    "mentions":         (0, lambda f: len(f.message.mentions) + len(f.message.role_mentions)),
+    "burst":            (0, lambda f: len(f.history)),
+    "duplicates":       (1, lambda f: sum(1 for _, c in f.history if c == f.content)),
+    "caps_ratio":       (1, _caps_ratio),
+    "links":            (2, lambda f: len(LINK_REGEX.findall(f.content))),
+    "invite":           (2, lambda f: INVITE_REGEX.search(f.content) is not None),
+    "ip_logger":        (2, lambda f: IP_LOGGER_REGEX.search(f.content) is not None),
+    "scam_keyword":     (2, lambda f: any(k in f.content for k in SCAM_KEYWORDS)),
+    "danger_keyword":   (2, lambda f: any(k in f.content for k in DANGER_KEYWORDS)),
+    "zalgo":            (5, _zalgo),
+    "entropy":          (5, _entropy),
+    "toxicity":         (10, _toxicity),
+}
+
+# Features that yield True/False; every other feature is numeric
+BOOL_FEATURES = frozenset({"invite", "ip_logger", "scam_keyword", "danger_keyword", "zalgo"})
+
+# Adaptive thresholds never scale below this (or below the base, if lower):
+# a quiet channel must not turn two quick messages into a strike
+ADAPTIVE_FLOOR = 3
+
+
+def adaptive_threshold(value: float, scale: float) -> float:
+    return max(value * scale, min(value, ADAPTIVE_FLOOR))
+
+
+ID_LIST_FIELDS = ("channels", "exclude_channels", "roles", "exempt_roles")
+INT_FIELDS = ("minutes", "priority")
+
+OPERATORS = {
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+
+# =====================================================
+# DEFAULT RULEBOOK (FORMER HARDCODED LAYERS)
+# =====================================================
+
+DEFAULT_RULES: List[dict] = [
+    # --- SilentAutoMod layers ---
+    {"id": "invite", "label": "External Server Invite", "priority": 10,
+     "when": [{"feature": "invite", "op": "==", "value": True}], "action": "strike"},
+    {"id": "ip_logger", "label": "Malicious IP-Logger Link", "priority": 10,
+     "when": [{"feature": "ip_logger", "op": "==", "value": True}], "action": "strike"},
+    {"id": "scam", "label": "Potential scam message detected", "priority": 10,
+     "when": [{"feature": "scam_keyword", "op": "==", "value": True}], "action": "soft_warn"},
+    {"id": "danger_keyword", "label": "High-Risk Keyword Detected", "priority": 0,
+     "when": [{"feature": "danger_keyword", "op": "==", "value": True}], "action": "alert"},
+    {"id": "zalgo", "label": "Zalgo/Text Distortion", "priority": 20,
+     "when": [{"feature": "zalgo", "op": "==", "value": True}], "action": "strike"},
+    {"id": "gibberish", "label": "Entropy Threshold (Gibberish)", "priority": 20,
+     "when": [{"feature": "length", "op": ">", "value": 20},
+              {"feature": "entropy", "op": "<", "value": 2.0}], "action": "strike"},
+    {"id": "burst", "label": "Rapid Message Burst (Spam)", "priority": 30,
+     "when": [{"feature": "burst", "op": ">=", "value": 5, "panic": 3, "adaptive": True}], "action": "strike"},
+    {"id": "duplicates", "label": "Duplicate Message Spam", "priority": 30,
+     "when": [{"feature": "duplicates", "op": ">", "value": 2}], "action": "strike"},
+    {"id": "attachments", "label": "Media/Attachment Spam", "priority": 30,
+     "when": [{"feature": "attachments", "op": ">", "value": 3}], "action": "strike"},
+    # --- Former Security layers ---
+    {"id": "link_flood", "label": "Link spam detected", "priority": 30,
+     "when": [{"feature": "links", "op": ">=", "value": 3}], "action": "timeout", "minutes": 5},
+    {"id": "toxicity", "label": "Toxicity Classifier", "priority": 40,
+     "when": [{"feature": "toxicity", "op": ">=", "value": TOXICITY_THRESHOLD}], "action": "strike"},
+    {"id": "toxicity_watch", "label": "Possible Toxicity", "priority": 40,
+     "when": [{"feature": "toxicity", "op": ">=", "value": TOXICITY_ALERT_THRESHOLD}], "action": "alert"},
+]
+
+
+# =====================================================
+# PROFILING (PER RULE, COMPACT RING BUFFER)
+# =====================================================
+
+class RuleStats:
+    """
+    Hit counters plus the last SAMPLES evaluation times (µs) in a fixed
+    uint32 ring — 512 bytes per rule no matter how long the bot runs.
+    """
+
+    SAMPLES = 128
+
+    __slots__ = ("evals", "hits", "shadow_hits", "overrides", "total_us", "_ring", "_pos")
+
+    def __init__(self):
+        self.evals = 0
+        self.hits = 0
+        self.shadow_hits = 0
+        self.overrides = 0
+        self.total_us = 0
+        self._ring = array("I", [0] * self.SAMPLES)
+        self._pos = 0
+
+    def record(self, elapsed_ns: int, hit: bool, shadow: bool):
+        us = min(elapsed_ns // 1000, 0xFFFFFFFF)
+        self._ring[self._pos % self.SAMPLES] = us
+        self._pos += 1
+        self.evals += 1
+        self.total_us += us
+
+        if hit:
+            if shadow:
+                self.shadow_hits += 1
+            else:
+                self.hits += 1
+
+    def summary(self) -> dict:
+        filled = min(self._pos, self.SAMPLES)
+        recent = sorted(self._ring[:filled]) if filled else [0]
+        caught = self.hits + self.shadow_hits
+
+        return {
+            "evals": self.evals,
+            "hits": self.hits,
+            "shadow_hits": self.shadow_hits,
+            "overrides": self.overrides,
+            "hit_rate": caught / self.evals if self.evals else 0.0,
+            "avg_us": sum(recent) / len(recent),
+            "p95_us": recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+            # Total evaluation time spent per (non-overridden) catch
+            "us_per_catch": self.total_us / max(caught - self.overrides, 1),
+        }
+
+
+class RuleProfiler:
+    def __init__(self):
+        self._stats: Dict[Tuple[int, str], RuleStats] = {}
+
+    def get(self, guild_id: int, rule_id: str) -> RuleStats:
+        key = (guild_id, rule_id)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = RuleStats()
+        return stats
+
+    def for_guild(self, guild_id: int) -> Dict[str, RuleStats]:
+        return {rid: st for (gid, rid), st in self._stats.items() if gid == guild_id}
+
+    def reset(self, guild_id: int):
+        for key in [k for k in self._stats if k[0] == guild_id]:
+            del self._stats[key]
+
+
+profiler = RuleProfiler()
+
+
+# =====================================================
+# COMPILATION
+# =====================================================
+
+class CompiledRule:
+    __slots__ = (
+        "id", "label", "action", "minutes", "cost", "priority", "shadow", "stats",
+        "conditions", "channels", "exclude_channels", "roles", "exempt_roles", "raw"
+    )
+
+    def __init__(self, raw: dict, panic: bool, guild_id: int = 0):
+        self.raw = raw
+        self.id = raw["id"]
+        self.label = raw.get("label", raw["id"])
+        self.action = raw.get("action", "strike")
+        self.shadow = bool(raw.get("shadow", False))
+        self.stats = profiler.get(guild_id, self.id)
+        self.minutes = int(raw.get("minutes", 5))
+        self.priority = int(raw.get("priority", 100))
+
+        conditions = []
+        for cond in raw.get("when", []):
+            cost = FEATURES[cond["feature"]][0]
+            value = cond.get("panic", cond["value"]) if panic else cond["value"]
+            adaptive = bool(cond.get("adaptive", False))
+            conditions.append((cost, cond["feature"], OPERATORS[cond["op"]], value, adaptive))
+
+        # Cheapest predicate first → expensive features are often never computed
+        conditions.sort(key=lambda c: c[0])
+        self.conditions: Tuple = tuple(c[1:] for c in conditions)
+        self.cost = max((c[0] for c in conditions), default=0)
+
+        self.channels = frozenset(raw.get("channels") or ())
+        self.exclude_channels = frozenset(raw.get("exclude_channels") or ())
+        self.roles = frozenset(raw.get("roles") or ())
+        self.exempt_roles = frozenset(raw.get("exempt_roles") or ())
+
+    def in_scope(self, channel_id: int, role_ids: frozenset) -> bool:
+        if self.channels and channel_id not in self.channels:
+            return False
+        if channel_id in self.exclude_channels:
+            return False
+        if self.roles and self.roles.isdisjoint(role_ids):
+            return False
+        if self.exempt_roles and not self.exempt_roles.isdisjoint(role_ids):
+            return False
+        return True
+
+    async def matches(self, features: MessageFeatures) -> bool:
+        for name, op, value, adaptive in self.conditions:
+            if adaptive:
+                value = adaptive_threshold(value, features.scale)
+            if not op(await features.get(name), value):
+                return False
+        return True
+
+
+class EvaluationPlan:
+    """Ordered rule list for one guild (priority, then cost)."""
+
+    def __init__(self, rules: List[CompiledRule]):
+        self.rules = sorted(rules, key=lambda r: (r.priority, r.cost))
+
+    async def evaluate(self, features: MessageFeatures, channel_id: int, role_ids: frozenset):
+        """
+        Returns (enforced_rule | None, [alert_rules]).
+        Stops at the first enforcing rule; alert and shadow rules never
+        stop the scan.
+        """
+        alerts = []
+        for rule in self.rules:
+            if not rule.in_scope(channel_id, role_ids):
+                continue
+
+            start = time.perf_counter_ns()
+            hit = await rule.matches(features)
+            rule.stats.record(time.perf_counter_ns() - start, hit, rule.shadow)
+
+            if not hit or rule.shadow:
+                continue
+            if rule.action == "alert":
+                alerts.append(rule)
+                continue
+            return rule, alerts
+        return None, alerts
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_rule(raw: dict) -> Optional[str]:
+    """
+    Returns an error message, or None when the rule is valid.
+    Types are checked too: a stored rule that fails at evaluation time
+    would break automod for the whole guild.
+    """
+    if not isinstance(raw, dict) or not isinstance(raw.get("id"), str) or not raw["id"]:
+        return "Rule must be an object with a string `id`."
+    if not isinstance(raw.get("label", ""), str):
+        return "`label` must be a string."
+    if raw.get("action", "strike") not in ACTIONS:
+        return f"Unknown action. Use one of: {', '.join(ACTIONS)}"
+
+    for field in INT_FIELDS:
+        if field in raw and not _is_int(raw[field]):
+            return f"`{field}` must be a whole number."
+    if raw.get("minutes", 5) < 1:
+        return "`minutes` must be at least 1."
+
+    for field in ID_LIST_FIELDS:
+        ids = raw.get(field)
+        if ids is not None and not (isinstance(ids, list) and all(_is_int(i) for i in ids)):
+            return f"`{field}` must be a list of IDs."
+
+    when = raw.get("when")
+    if not isinstance(when, list) or not when:
+        return "`when` must be a non-empty list of conditions."
+    for cond in when:
+        if not isinstance(cond, dict):
+            return "Every condition must be an object."
+        feature = cond.get("feature")
+        if feature not in FEATURES:
+            return f"Unknown feature `{feature}`. Use one of: {', '.join(FEATURES)}"
+        if cond.get("op") not in OPERATORS:
+            return f"Unknown operator `{cond.get('op')}`."
+        if "value" not in cond:
+            return "Every condition needs a `value`."
+
+        check, kind = (
+            (lambda v: isinstance(v, bool), "true/false") if feature in BOOL_FEATURES
+            else (_is_number, "a number")
+        )
+        for key in ("value", "panic"):
+            if key in cond and not check(cond[key]):
+                return f"`{feature}` {key} must be {kind}."
+        if cond.get("adaptive") and feature in BOOL_FEATURES:
+            return "Only numeric conditions can be `adaptive`."
+    return None
+
+
+# =====================================================
+# RULEBOOK (PERSISTED, VERSIONED, PER GUILD)
+# =====================================================
+
+class RuleBook:
+    def __init__(self):
+        # guild_id -> {rule_id: raw}
+        self._overrides: Dict[int, Dict[str, dict]] = {}
+        self._versions: Dict[int, int] = {}
+        # guild_id -> (version, panic, plan)
+        self._plans: Dict[int, Tuple[int, bool, EvaluationPlan]] = {}
+        self._loaded = False
+
+    def _load(self):
+        for row in db.fetchall("SELECT guild_id, rule_id, body FROM automod_rules"):
+            try:
+                raw = json.loads(row["body"])
+            except ValueError:
+                continue
+            # Rows saved before type validation existed may be malformed
+            if validate_rule(raw) is not None:
+                print(f"⚠️ Skipping invalid automod rule {row['rule_id']} (guild {row['guild_id']})")
+                continue
+            self._overrides.setdefault(row["guild_id"], {})[row["rule_id"]] = raw
+        self._loaded = True
+
+    def rules_for(self, guild_id: int) -> List[dict]:
+        if not self._loaded:
+            self._load()
+
+        merged = {r["id"]: r for r in DEFAULT_RULES}
+        merged.update(self._overrides.get(guild_id, {}))
+        return [r for r in merged.values() if r.get("enabled", True)]
+
+    def plan(self, guild_id: int, panic: bool = False) -> EvaluationPlan:
+        version = self._versions.get(guild_id, 0)
+        cached = self._plans.get(guild_id)
+
+        if cached and cached[0] == version and cached[1] == panic:
+            return cached[2]
+
+        compiled = []
+        for raw in self.rules_for(guild_id):
+            # One broken rule must never take the rest of the guild's plan down
+            try:
+                compiled.append(CompiledRule(raw, panic, guild_id))
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"⚠️ Skipping uncompilable automod rule {raw.get('id')}: {e}")
+        plan = EvaluationPlan(compiled)
+        self._plans[guild_id] = (version, panic, plan)
+        return plan
+
+    def _bump(self, guild_id: int):
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+
+    def set_rule(self, guild_id: int, raw: dict):
+        if not self._loaded:
+            self._load()
+
+        db.execute(
+            """
+            INSERT INTO automod_rules (guild_id, rule_id, body, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(guild_id, rule_id)
+            DO UPDATE SET body = excluded.body, updated_at = excluded.updated_at
+            """,
+            (guild_id, raw["id"], json.dumps(raw), int(time.time()))
+        )
+        self._overrides.setdefault(guild_id, {})[raw["id"]] = raw
+        self._bump(guild_id)
+
+    def remove_rule(self, guild_id: int, rule_id: str) -> bool:
+        """Drops a guild override. Default rules come back to their stock form."""
+        if not self._loaded:
+            self._load()
+
+        if rule_id not in self._overrides.get(guild_id, {}):
+            return False
+
+        db.execute("DELETE FROM automod_rules WHERE guild_id = ? AND rule_id = ?", (guild_id, rule_id))
+        self._overrides[guild_id].pop(rule_id, None)
+        self._bump(guild_id)
+        return True
+
+    def toggle_rule(self, guild_id: int, rule_id: str) -> Optional[bool]:
+        raw = next((r for r in self.all_rules(guild_id) if r["id"] == rule_id), None)
+        if raw is None:
+            return None
+
+        raw = dict(raw, enabled=not raw.get("enabled", True))
+        self.set_rule(guild_id, raw)
+        return raw["enabled"]
+
+    def set_shadow(self, guild_id: int, rule_id: str, shadow: bool) -> bool:
+        raw = next((r for r in self.all_rules(guild_id) if r["id"] == rule_id), None)
+        if raw is None:
+            return False
+
+        self.set_rule(guild_id, dict(raw, shadow=shadow))
+        return True
+
+    def all_rules(self, guild_id: int) -> List[dict]:
+        """Every rule including disabled ones (for listing)."""
+        if not self._loaded:
+            self._load()
+        merged = {r["id"]: r for r in DEFAULT_RULES}
+        merged.update(self._overrides.get(guild_id, {}))
+        return list(merged.values())
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+rulebook = RuleBook()
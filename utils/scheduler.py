@@ -0,0 +1,179 @@
+import asyncio
+import heapq
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.database import db
+
+
+# =====================================================
+# 🔱 HELLFIRE SCHEDULER
+# • Scheduled work lives in SQLite (survives restarts)
+# • One in-process min-heap of (deadline, id) and ONE timer task that
+#   sleeps until the earliest deadline — no task per schedule
+# • Cancels are lazy: stale heap entries are dropped when they surface
+# • Recurring schedules re-arm themselves after each run
+# =====================================================
+
+# handler(row, payload) -> None
+Handler = Callable[[dict, dict], Awaitable[None]]
+
+
+def parse_duration(text: str) -> int:
+    """'45' (minutes) / '30m' / '6h' / '2d' / '90s' → seconds"""
+    text = text.strip().lower()
+    if text.isdigit():
+        return int(text) * 60
+
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    if text[-1:] in units and text[:-1].isdigit():
+        return int(text[:-1]) * units[text[-1]]
+
+    raise ValueError("Durations look like 30m / 6h / 2d.")
+
+
+class Scheduler:
+    def __init__(self):
+        self.bot = None
+        self._handlers: Dict[str, Handler] = {}
+        self._heap: List[Tuple[int, int]] = []      # (run_at, schedule id)
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # =================================================
+    # SETUP
+    # =================================================
+
+    def bind(self, bot):
+        self.bot = bot
+
+    def register(self, kind: str, handler: Handler):
+        self._handlers[kind] = handler
+
+    def start(self):
+        """Loads every active schedule and starts the timer (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._heap = [
+            (row["run_at"], row["id"])
+            for row in db.fetchall("SELECT id, run_at FROM schedules WHERE status = 'active'")
+        ]
+        heapq.heapify(self._heap)
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._timer())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # =================================================
+    # SCHEDULES
+    # =================================================
+
+    def add(
+        self,
+        guild_id: int,
+        kind: str,
+        payload: dict,
+        run_at: int,
+        created_by: int,
+        channel_id: Optional[int] = None,
+        interval: Optional[int] = None
+    ) -> int:
+        cur = db.execute(
+            """
+            INSERT INTO schedules (guild_id, kind, payload, run_at, interval, created_by, channel_id, status, runs, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'active', 0, ?)
+            """,
+            (guild_id, kind, json.dumps(payload), run_at, interval, created_by, channel_id, int(time.time()))
+        )
+        self._push(run_at, cur.lastrowid)
+        return cur.lastrowid
+
+    def cancel(self, schedule_id: int, guild_id: int) -> bool:
+        # The heap entry stays until it surfaces; the status check drops it then
+        cur = db.execute(
+            "UPDATE schedules SET status = 'cancelled' WHERE id = ? AND guild_id = ? AND status = 'active'",
+            (schedule_id, guild_id)
+        )
+        return cur.rowcount > 0
+
+    def for_guild(self, guild_id: int, kind: Optional[str] = None):
+        if kind:
+            return db.fetchall(
+                "SELECT * FROM schedules WHERE guild_id = ? AND kind = ? AND status = 'active' ORDER BY run_at",
+                (guild_id, kind)
+            )
+        return db.fetchall(
+            "SELECT * FROM schedules WHERE guild_id = ? AND status = 'active' ORDER BY run_at",
+            (guild_id,)
+        )
+
+    def _push(self, run_at: int, schedule_id: int):
+        if self._wake is None:
+            return   # not started yet; start() loads it from the DB
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (run_at, schedule_id))
+        if earliest is None or run_at < earliest:
+            self._wake.set()   # new head → re-arm the timer
+
+    # =================================================
+    # TIMER
+    # =================================================
+
+    async def _timer(self):
+        while True:
+            if not self._heap:
+                timeout = None
+            else:
+                timeout = max(0.0, self._heap[0][0] - time.time())
+
+            if timeout is None or timeout > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            run_at, schedule_id = heapq.heappop(self._heap)
+            row = db.fetchone("SELECT * FROM schedules WHERE id = ?", (schedule_id,))
+            # Cancelled, or a stale entry left behind by a re-arm
+            if not row or row["status"] != "active" or row["run_at"] != run_at:
+                continue
+
+            self._rearm(row)
+            asyncio.get_running_loop().create_task(self._fire(row))
+
+    def _rearm(self, row):
+        if row["interval"]:
+            # Missed runs (downtime) collapse into the one firing now
+            now = int(time.time())
+            next_at = row["run_at"] + row["interval"]
+            if next_at <= now:
+                next_at = now + row["interval"]
+            db.execute(
+                "UPDATE schedules SET run_at = ?, runs = runs + 1 WHERE id = ?",
+                (next_at, row["id"])
+            )
+            heapq.heappush(self._heap, (next_at, row["id"]))
+        else:
+            db.execute("UPDATE schedules SET status = 'done', runs = runs + 1 WHERE id = ?", (row["id"],))
+
+    async def _fire(self, row):
+        handler = self._handlers.get(row["kind"])
+        if handler is None:
+            return
+        try:
+            await handler(dict(row), json.loads(row["payload"]))
+        except Exception as e:
+            print(f"⚠️ Scheduled {row['kind']} #{row['id']} failed: {e}")
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+scheduler = Scheduler()
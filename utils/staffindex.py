@@ -0,0 +1,75 @@
+from typing import Dict, Iterable, List, Set
+
+import discord
+
+from utils.config import STAFF_ROLES
+from utils.roleindex import roleindex
+
+
+# =====================================================
+# 🔱 HELLFIRE STAFF INDEX
+# • Staff tiers are role *names* (utils.config.STAFF_ROLES)
+# • name → role IDs cached per guild, dropped on role create/update/delete
+# • Membership comes from the role index → is_staff is a handful of
+#   set lookups, staff listings are O(staff) instead of O(members)
+# =====================================================
+
+
+class StaffIndex:
+    def __init__(self):
+        self._names: Dict[int, Dict[str, List[int]]] = {}    # guild -> role name -> role ids
+
+    def bind(self, bot):
+        bot.add_listener(self._on_role_change, "on_guild_role_create")
+        bot.add_listener(self._on_role_change, "on_guild_role_delete")
+        bot.add_listener(self._on_role_update, "on_guild_role_update")
+
+    # =================================================
+    # ROLE NAMES
+    # =================================================
+
+    async def _on_role_change(self, role: discord.Role):
+        self._names.pop(role.guild.id, None)
+
+    async def _on_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            self._names.pop(after.guild.id, None)
+
+    def role_ids(self, guild: discord.Guild, names: Iterable[str] = STAFF_ROLES) -> List[int]:
+        by_name = self._names.get(guild.id)
+        if by_name is None:
+            by_name = self._names[guild.id] = {}
+            for role in guild.roles:
+                by_name.setdefault(role.name, []).append(role.id)
+        return [role_id for name in names for role_id in by_name.get(name, ())]
+
+    def roles(self, guild: discord.Guild, names: Iterable[str] = STAFF_ROLES) -> List[discord.Role]:
+        return [role for role in map(guild.get_role, self.role_ids(guild, names)) if role]
+
+    # =================================================
+    # MEMBERSHIP
+    # =================================================
+
+    def is_staff(self, member: discord.Member, names: Iterable[str] = STAFF_ROLES) -> bool:
+        role_ids = self.role_ids(member.guild, names)
+        if not roleindex.ready(member.guild):
+            # Member list not chunked yet → fall back to the member's own roles
+            return any(role.id in role_ids for role in member.roles)
+        return any(member.id in roleindex.members(member.guild, role_id) for role_id in role_ids)
+
+    def members(self, guild: discord.Guild, names: Iterable[str] = STAFF_ROLES) -> Set[int]:
+        staff: Set[int] = set()
+        for role_id in self.role_ids(guild, names):
+            staff |= roleindex.members(guild, role_id)
+        return staff
+
+    def by_tier(self, guild: discord.Guild) -> Dict[str, Set[int]]:
+        """Tier name → member IDs, for every configured staff tier."""
+        return {name: self.members(guild, (name,)) for name in STAFF_ROLES}
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+staffindex = StaffIndex()
@@ -0,0 +1,178 @@
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.database import db
+
+
+# =====================================================
+# 🔱 HELLFIRE STAFF STATISTICS
+# • Every moderation action → one `staff_actions` row (batched inserts)
+# • `staff_daily` rollup per (guild, staff, day) maintained on flush
+# • Reads are primary-key range lookups on the rollup, never raw scans
+# • `on_record` hook lets the bot fan each action out as an event
+# =====================================================
+
+BATCH_SIZE = 50          # flush early once this many actions are pending
+DAY = 86400
+
+Key = Tuple[int, int, int]   # (guild_id, staff_id, day)
+
+
+def day_of(ts: float) -> int:
+    """UTC day number (days since epoch)."""
+    return int(ts // DAY)
+
+
+class StaffStats:
+    def __init__(self, batch_size: int = BATCH_SIZE):
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        # (guild, staff, day) -> [actions, warns, last_at]
+        self._rollup: Dict[Key, list] = defaultdict(lambda: [0, 0, 0])
+        # (guild_id, staff_id, action, at) -> None; set by the bot at startup
+        self.on_record: Optional[Callable[[int, int, str, int], None]] = None
+
+    # =================================================
+    # WRITE (BUFFERED)
+    # =================================================
+
+    def record(self, guild_id: int, staff_id: int, action: str, target_id: Optional[int] = None, reason: Optional[str] = None):
+        now = int(time.time())
+        self._pending.append((staff_id, guild_id, action, target_id, reason, now))
+
+        roll = self._rollup[(guild_id, staff_id, day_of(now))]
+        roll[0] += 1
+        if action == "warn":
+            roll[1] += 1
+        roll[2] = now
+
+        if self.on_record:
+            self.on_record(guild_id, staff_id, action, now)
+
+        if len(self._pending) >= self.batch_size:
+            # The action itself already happened → never fail the caller over stats
+            self.try_flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        rollup, self._rollup = self._rollup, defaultdict(lambda: [0, 0, 0])
+
+        try:
+            self._write(pending, rollup)
+        except Exception:
+            # Nothing was committed → put the batch back ahead of anything
+            # recorded meanwhile, so the next flush retries it
+            self._pending = pending + self._pending
+            for key, (actions, warns, last_at) in self._rollup.items():
+                roll = rollup[key]
+                roll[0] += actions
+                roll[1] += warns
+                roll[2] = max(roll[2], last_at)
+            self._rollup = rollup
+            raise
+
+    def try_flush(self) -> bool:
+        """flush() for write-behind paths: errors are logged, the batch stays queued."""
+        try:
+            self.flush()
+            return True
+        except Exception as e:
+            print(f"⚠️ Staff stats flush failed ({len(self._pending)} actions kept for retry): {e}")
+            return False
+
+    def _write(self, pending: List[tuple], rollup: Dict[Key, list]):
+        with db.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO staff_actions (staff_id, guild_id, action, target_id, reason, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                pending
+            )
+            cur.executemany(
+                """
+                INSERT INTO staff_daily (guild_id, staff_id, day, actions, warns, last_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, staff_id, day) DO UPDATE SET
+                    actions = actions + excluded.actions,
+                    warns = warns + excluded.warns,
+                    last_at = MAX(last_at, excluded.last_at)
+                """,
+                [(g, s, d, r[0], r[1], r[2]) for (g, s, d), r in rollup.items()]
+            )
+
+    # =================================================
+    # READ (ROLLUP LOOKUPS)
+    # =================================================
+
+    def totals(self, guild_id: int, staff_id: int) -> dict:
+        self.flush()
+        row = db.fetchone(
+            """
+            SELECT COALESCE(SUM(actions), 0) AS actions,
+                   COALESCE(SUM(warns), 0) AS warns,
+                   COALESCE(SUM(CASE WHEN day = ? THEN actions END), 0) AS today,
+                   MAX(last_at) AS last_at
+            FROM staff_daily WHERE guild_id = ? AND staff_id = ?
+            """,
+            (day_of(time.time()), guild_id, staff_id)
+        )
+        return dict(row)
+
+    def guild_summary(self, guild_id: int, limit: int = 25):
+        """Per-staff totals for the guild, busiest today first."""
+        self.flush()
+        return db.fetchall(
+            """
+            SELECT staff_id,
+                   SUM(actions) AS actions,
+                   SUM(warns) AS warns,
+                   COALESCE(SUM(CASE WHEN day = ? THEN actions END), 0) AS today,
+                   MAX(last_at) AS last_at
+            FROM staff_daily WHERE guild_id = ?
+            GROUP BY staff_id
+            ORDER BY today DESC, actions DESC
+            LIMIT ?
+            """,
+            (day_of(time.time()), guild_id, limit)
+        )
+
+    def summary_for(self, guild_id: int, staff_ids) -> Dict[int, dict]:
+        """guild_summary() restricted to the given staff, keyed by staff_id."""
+        self.flush()
+        staff_ids = list(staff_ids)
+        result: Dict[int, dict] = {}
+        for i in range(0, len(staff_ids), 500):   # stay under SQLite's variable limit
+            chunk = staff_ids[i:i + 500]
+            rows = db.fetchall(
+                f"""
+                SELECT staff_id,
+                       SUM(actions) AS actions,
+                       SUM(warns) AS warns,
+                       COALESCE(SUM(CASE WHEN day = ? THEN actions END), 0) AS today,
+                       MAX(last_at) AS last_at
+                FROM staff_daily WHERE guild_id = ? AND staff_id IN ({",".join("?" * len(chunk))})
+                GROUP BY staff_id
+                """,
+                (day_of(time.time()), guild_id, *chunk)
+            )
+            result.update((row["staff_id"], dict(row)) for row in rows)
+        return result
+
+    def today(self, guild_id: int):
+        self.flush()
+        return db.fetchall(
+            "SELECT staff_id, actions, warns, last_at FROM staff_daily WHERE guild_id = ? AND day = ?",
+            (guild_id, day_of(time.time()))
+        )
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+staffstats = StaffStats()
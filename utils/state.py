@@ -2,7 +2,7 @@
 # 🔥 HellFire Hangout — Global Runtime State
 # =================================================
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple
 from datetime import datetime
 
 # =================================================
@@ -59,18 +59,11 @@ STAFF_ROLE_TIERS: Dict[int, Optional[int]] = {
 }
 
 # =================================================
-# 🧾 MODERATION — WARN & LOCKDOWN
+# 🧾 MODERATION — LOCKDOWN
+# (warnings live in the DB → utils.warnstore)
 # =================================================
-WARN_DATA: Dict[int, int] = {}
-WARN_LOGS: Dict[int, List[dict]] = {}
 LOCKDOWN_DATA: Set[int] = set()
 
-# =================================================
-# 🧠 STAFF — INTELLIGENCE & SAFETY
-# =================================================
-STAFF_STATS: Dict[int, dict] = {}
-STAFF_NOTES: Dict[int, List[dict]] = {}
-
 # =================================================
 # 🛡️ AUTOMOD / SECURITY — RUNTIME MEMORY
 # =================================================
@@ -79,6 +72,13 @@ GHOST_PING_HISTORY: Dict[int, dict] = {}
 AUTOMOD_LAST_ACTION: Dict[int, float] = {}
 AUTOMOD_STRIKES: Dict[int, int] = {}
 
+# =================================================
+# ☢️ ANTI-NUKE — TRUSTED ACTORS
+# =================================================
+# (guild_id, user_id) never quarantined by the anti-nuke monitor
+# Mirror of the `antinuke_trust` table, loaded by cogs.antinuke
+ANTINUKE_WHITELIST: Set[Tuple[int, int]] = set()
+
 # =================================================
 # 🏆 ACTIVITY — WEEKLY MVP SYSTEM
 # =================================================
@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from utils.database import db
+
+
+# =====================================================
+# 🔱 HELLFIRE AUTOMOD STRIKE STORE
+# • Persisted per (guild, user) with a last-update timestamp
+# • Decay computed on read — no periodic sweeps
+# • Hot entries cached (LRU); writes are batched (write-behind)
+# =====================================================
+
+STRIKE_DECAY_SECONDS = 3600   # forgive 1 strike per hour of good behaviour
+CACHE_SIZE = 5000
+
+Key = Tuple[int, int]
+
+
+class StrikeStore:
+    def __init__(self, decay_seconds: int = STRIKE_DECAY_SECONDS, cache_size: int = CACHE_SIZE):
+        self.decay = decay_seconds
+        self.cache_size = cache_size
+
+        # (guild_id, user_id) -> [strikes, updated_at]
+        self._cache: "OrderedDict[Key, list]" = OrderedDict()
+        self._dirty: Dict[Key, list] = {}
+
+    # =================================================
+    # INTERNAL
+    # =================================================
+
+    def _entry(self, key: Key) -> list:
+        entry = self._cache.get(key)
+
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+
+        # Evicted but not yet flushed → the pending write is the truth
+        entry = self._dirty.get(key)
+        if entry is None:
+            row = db.fetchone(
+                "SELECT strikes, updated_at FROM automod_strikes WHERE guild_id = ? AND user_id = ?",
+                key
+            )
+            entry = [row["strikes"], row["updated_at"]] if row else [0, 0]
+
+        self._cache[key] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return entry
+
+    def _decayed(self, entry: list, now: int) -> list:
+        """Applies lazy decay in place, keeping the partial-hour remainder."""
+        strikes, updated = entry
+        if strikes <= 0 or not updated:
+            return entry
+
+        steps = (now - updated) // self.decay
+        if steps > 0:
+            entry[0] = max(0, strikes - steps)
+            entry[1] = updated + steps * self.decay if entry[0] else now
+        return entry
+
+    # =================================================
+    # PUBLIC API
+    # =================================================
+
+    def get(self, guild_id: int, user_id: int) -> int:
+        return self._decayed(self._entry((guild_id, user_id)), int(time.time()))[0]
+
+    def add(self, guild_id: int, user_id: int, amount: int = 1) -> int:
+        key = (guild_id, user_id)
+        now = int(time.time())
+        entry = self._decayed(self._entry(key), now)
+
+        entry[0] = max(0, entry[0] + amount)
+        entry[1] = now
+        self._dirty[key] = entry
+        return entry[0]
+
+    def refund(self, guild_id: int, user_id: int, amount: int = 1) -> int:
+        key = (guild_id, user_id)
+        entry = self._decayed(self._entry(key), int(time.time()))
+
+        if entry[0] > 0:
+            entry[0] = max(0, entry[0] - amount)
+            self._dirty[key] = entry
+        return entry[0]
+
+    def flush(self):
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        db.executemany(
+            """
+            INSERT INTO automod_strikes (guild_id, user_id, strikes, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(guild_id, user_id)
+            DO UPDATE SET strikes = excluded.strikes, updated_at = excluded.updated_at
+            """,
+            [(g, u, e[0], e[1]) for (g, u), e in dirty.items()]
+        )
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+strikes = StrikeStore()
@@ -0,0 +1,184 @@
+import asyncio
+import os
+import re
+import zlib
+from typing import List, Optional
+
+# =====================================================
+# OPTIONAL DEPENDENCY (NUMPY)
+# =====================================================
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# =====================================================
+# 🔱 HELLFIRE LOCAL TOXICITY CLASSIFIER
+# • Hashed n-gram features (no vocabulary file)
+# • Linear model loaded from a local .npz (no network)
+# • Micro-batched, vectorized scoring in a worker thread
+# =====================================================
+
+WORD_REGEX = re.compile(r"[a-z0-9']+")
+
+
+class HashedNgramModel:
+    """
+    Logistic-regression scorer over hashed character & word n-grams.
+
+    Model file (.npz) keys:
+    • weights    — float32 vector of length `n_features`
+    • bias       — scalar
+    • char_range — (min_n, max_n) for character n-grams (optional)
+    """
+
+    def __init__(self, weights, bias: float = 0.0, char_range=(3, 5)):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("HashedNgramModel requires numpy")
+
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = float(bias)
+        self.n_features = int(self.weights.shape[0])
+        self.char_range = (int(char_range[0]), int(char_range[1]))
+
+    # ---------------- PERSISTENCE ----------------
+
+    @classmethod
+    def load(cls, path: str) -> "HashedNgramModel":
+        data = np.load(path)
+        char_range = tuple(data["char_range"]) if "char_range" in data else (3, 5)
+        return cls(data["weights"], float(data["bias"]), char_range)
+
+    def save(self, path: str):
+        np.savez(
+            path,
+            weights=self.weights,
+            bias=np.float32(self.bias),
+            char_range=np.asarray(self.char_range, dtype=np.int32)
+        )
+
+    # ---------------- FEATURES ----------------
+
+    def features(self, text: str) -> List[int]:
+        """Hashed feature indices for one message (crc32 is stable across processes)."""
+        n = self.n_features
+        lo, hi = self.char_range
+        words = WORD_REGEX.findall(text.lower())
+        out = []
+
+        for i, word in enumerate(words):
+            out.append(zlib.crc32(b"w:" + word.encode()) % n)
+            if i:
+                out.append(zlib.crc32(f"b:{words[i - 1]} {word}".encode()) % n)
+
+            padded = f" {word} "
+            for size in range(lo, hi + 1):
+                for j in range(len(padded) - size + 1):
+                    out.append(zlib.crc32(padded[j:j + size].encode()) % n)
+
+        return out
+
+    # ---------------- SCORING ----------------
+
+    def score_batch(self, texts: List[str]):
+        """Returns toxicity probabilities for a batch in one vectorized pass."""
+        if not texts:
+            return np.zeros(0, dtype=np.float32)
+
+        per_text = [self.features(t) for t in texts]
+        lengths = np.fromiter((len(f) for f in per_text), dtype=np.int64, count=len(per_text))
+        indices = np.fromiter(
+            (i for f in per_text for i in f),
+            dtype=np.int64,
+            count=int(lengths.sum())
+        )
+        rows = np.repeat(np.arange(len(texts)), lengths)
+
+        # Binary-ish bag of n-grams, L2-normalised per message
+        logits = np.bincount(rows, weights=self.weights[indices], minlength=len(texts))
+        norms = np.sqrt(np.maximum(lengths, 1))
+        logits = logits / norms + self.bias
+
+        return 1.0 / (1.0 + np.exp(-logits))
+
+
+class MicroBatchScorer:
+    """
+    Collects messages for a few milliseconds, then scores them together
+    in a worker thread so the event loop never runs the model itself.
+    """
+
+    def __init__(self, model: HashedNgramModel, window_ms: float = 5, max_batch: int = 64):
+        self.model = model
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set[asyncio.Task] = set()     # strong refs until each batch finishes
+
+        # Instrumentation
+        self.batches = 0
+        self.scored = 0
+
+    async def score(self, text: str) -> float:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+
+        try:
+            scores = await asyncio.to_thread(self.model.score_batch, texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.scored += len(batch)
+
+        for (_, future), value in zip(batch, scores):
+            if not future.done():
+                future.set_result(float(value))
+
+    @property
+    def avg_batch(self) -> float:
+        return self.scored / self.batches if self.batches else 0.0
+
+
+def load_scorer(path: str, window_ms: float = 5, max_batch: int = 64) -> Optional[MicroBatchScorer]:
+    """Returns a ready scorer, or None when numpy or the model file is missing."""
+    if not NUMPY_AVAILABLE or not path or not os.path.exists(path):
+        return None
+
+    try:
+        model = HashedNgramModel.load(path)
+    except Exception as e:
+        print(f"⚠️ [Toxicity] Failed to load model {path}: {e}")
+        return None
+
+    return MicroBatchScorer(model, window_ms=window_ms, max_batch=max_batch)
@@ -0,0 +1,119 @@
+import bisect
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from utils.database import db
+from utils.config import WARN_EXPIRY_DAYS
+
+
+# =====================================================
+# 🔱 HELLFIRE WARN STORE
+# • Warnings persisted per guild in the `warnings` table
+# • Optional expiry — expired warns stay in history but stop counting
+# • Active counts cached as sorted expiry lists (O(log n) per read)
+# • History paged by keyset (id < cursor) on the (guild, user) index
+# =====================================================
+
+CACHE_SIZE = 5000
+PAGE_SIZE = 10
+NEVER = float("inf")
+
+Key = Tuple[int, int]
+
+
+class WarnStore:
+    def __init__(self, expiry_days: int = WARN_EXPIRY_DAYS, cache_size: int = CACHE_SIZE):
+        self.expiry = expiry_days * 86400
+        self.cache_size = cache_size
+
+        # (guild_id, user_id) -> sorted expiry timestamps of active warns
+        self._active: "OrderedDict[Key, List[float]]" = OrderedDict()
+
+    # =================================================
+    # INTERNAL
+    # =================================================
+
+    def _expiries(self, key: Key, now: int) -> List[float]:
+        expiries = self._active.get(key)
+
+        if expiries is None:
+            rows = db.fetchall(
+                """
+                SELECT expires_at FROM warnings
+                WHERE guild_id = ? AND user_id = ?
+                AND (expires_at IS NULL OR expires_at > ?)
+                """,
+                (key[0], key[1], now)
+            )
+            expiries = sorted(NEVER if r["expires_at"] is None else r["expires_at"] for r in rows)
+            self._active[key] = expiries
+            if len(self._active) > self.cache_size:
+                self._active.popitem(last=False)
+        else:
+            self._active.move_to_end(key)
+
+        # Drop everything that lapsed since the last read
+        cut = bisect.bisect_right(expiries, now)
+        if cut:
+            del expiries[:cut]
+        return expiries
+
+    # =================================================
+    # PUBLIC API
+    # =================================================
+
+    def add(self, guild_id: int, user_id: int, moderator_id: int, reason: str) -> Tuple[int, int]:
+        """Returns (warning_id, active_count)."""
+        now = int(time.time())
+        expires_at = now + self.expiry if self.expiry else None
+
+        # Load (or refresh) the cache before inserting: a cold load after the
+        # insert would already contain the new row and count it twice
+        expiries = self._expiries((guild_id, user_id), now)
+
+        warn_id = db.add_warning(user_id, guild_id, moderator_id, reason, expires_at)
+        bisect.insort(expiries, NEVER if expires_at is None else expires_at)
+        return warn_id, len(expiries)
+
+    def active_count(self, guild_id: int, user_id: int) -> int:
+        return len(self._expiries((guild_id, user_id), int(time.time())))
+
+    def total_count(self, guild_id: int, user_id: int) -> int:
+        row = db.fetchone(
+            "SELECT COUNT(*) AS c FROM warnings WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        )
+        return row["c"] if row else 0
+
+    def page(self, guild_id: int, user_id: int, before_id: Optional[int] = None, limit: int = PAGE_SIZE):
+        """Newest first. Pass the last row's id as `before_id` for the next page."""
+        if before_id is None:
+            return db.fetchall(
+                """
+                SELECT id, moderator_id, reason, created_at, expires_at FROM warnings
+                WHERE guild_id = ? AND user_id = ?
+                ORDER BY id DESC LIMIT ?
+                """,
+                (guild_id, user_id, limit)
+            )
+        return db.fetchall(
+            """
+            SELECT id, moderator_id, reason, created_at, expires_at FROM warnings
+            WHERE guild_id = ? AND user_id = ? AND id < ?
+            ORDER BY id DESC LIMIT ?
+            """,
+            (guild_id, user_id, before_id, limit)
+        )
+
+    def clear(self, guild_id: int, user_id: int) -> int:
+        cur = db.execute("DELETE FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+        self._active.pop((guild_id, user_id), None)
+        return cur.rowcount
+
+
+# =====================================================
+# GLOBAL INSTANCE
+# =====================================================
+
+warnstore = WarnStore()
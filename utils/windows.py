@@ -0,0 +1,111 @@
+import time
+from typing import Dict, Hashable, Optional
+
+
+# =====================================================
+# 🔱 HELLFIRE SLIDING WINDOWS
+# • Fixed-size bucket rings (constant memory per key)
+# • O(1) update & read (bucket count is a constant)
+# • No timestamp lists, no periodic sweeps
+# =====================================================
+
+
+class SlidingWindowCounter:
+    """
+    Approximate sliding-window counter built on a ring of time buckets.
+
+    The window is split into `buckets` slots. Each slot remembers which
+    epoch it belongs to, so stale slots are reset lazily on touch instead
+    of being swept by a background task.
+    """
+
+    __slots__ = ("window", "buckets", "width", "_counts", "_epochs")
+
+    def __init__(self, window: float, buckets: int = 10):
+        if window <= 0 or buckets < 1:
+            raise ValueError("SlidingWindowCounter expects a positive window and bucket count")
+
+        self.window = float(window)
+        self.buckets = buckets
+        self.width = self.window / buckets
+        self._counts = [0] * buckets
+        self._epochs = [-1] * buckets
+
+    def add(self, amount: int = 1, now: Optional[float] = None) -> int:
+        """Records `amount` events and returns the current window total."""
+        now = time.time() if now is None else now
+        epoch = int(now // self.width)
+        idx = epoch % self.buckets
+
+        if self._epochs[idx] != epoch:
+            self._epochs[idx] = epoch
+            self._counts[idx] = 0
+
+        self._counts[idx] += amount
+        return self.total(now)
+
+    def total(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        oldest = int(now // self.width) - self.buckets + 1
+
+        return sum(
+            count
+            for count, epoch in zip(self._counts, self._epochs)
+            if epoch >= oldest
+        )
+
+    def reset(self):
+        self._counts = [0] * self.buckets
+        self._epochs = [-1] * self.buckets
+
+    def idle(self, now: Optional[float] = None) -> bool:
+        """True when every bucket has fallen out of the window."""
+        now = time.time() if now is None else now
+        oldest = int(now // self.width) - self.buckets + 1
+        return all(epoch < oldest for epoch in self._epochs)
+
+
+class WindowRegistry:
+    """
+    Keyed collection of SlidingWindowCounters.
+
+    Idle counters are evicted opportunistically (one probe per insert),
+    which keeps memory bounded without ever scanning the whole map.
+    """
+
+    def __init__(self, window: float, buckets: int = 10, max_keys: int = 10000):
+        self.window = window
+        self.buckets = buckets
+        self.max_keys = max_keys
+        self._counters: Dict[Hashable, SlidingWindowCounter] = {}
+
+    def hit(self, key: Hashable, amount: int = 1, now: Optional[float] = None) -> int:
+        counter = self._counters.get(key)
+
+        if counter is None:
+            self._evict_one(now)
+            counter = SlidingWindowCounter(self.window, self.buckets)
+            self._counters[key] = counter
+
+        return counter.add(amount, now)
+
+    def total(self, key: Hashable, now: Optional[float] = None) -> int:
+        counter = self._counters.get(key)
+        return counter.total(now) if counter else 0
+
+    def reset(self, key: Hashable):
+        self._counters.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def _evict_one(self, now: Optional[float]):
+        if not self._counters:
+            return
+
+        # Dicts preserve insertion order: the first key is the oldest
+        oldest_key = next(iter(self._counters))
+        counter = self._counters[oldest_key]
+
+        if counter.idle(now) or len(self._counters) >= self.max_keys:
+            del self._counters[oldest_key]